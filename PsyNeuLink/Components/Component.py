@@ -75,6 +75,10 @@ It also contains:
 from PsyNeuLink.Globals.Utilities import *
 from PsyNeuLink.Globals.Preferences.ComponentPreferenceSet import *
 
+# Maximum number of sets of runtime params for which validation is cached (see Component._validate_runtime_params)
+RUNTIME_PARAMS_VALIDATION_CACHE_SIZE = 1000
+
+
 class ResetMode(Enum):
     CURRENT_TO_INSTANCE_DEFAULTS = 0
     INSTANCE_TO_CLASS = 1
@@ -290,6 +294,13 @@ class Component(object):
     # Determines whether variableClassDefault can be changed (to match an variable in __init__ method)
     variableClassDefault_locked = False
 
+    # Set (for all components) by set_execution_mode:  if True, validation, reporting and logging are skipped
+    #    on the execution path without consulting preferences (see ExecutionMode)
+    _fast_execution = False
+    # Set to False for components whose _validate_variable assigns other attributes from the variable,
+    #    so that it is always called in fast execution mode (see _check_args)
+    _fast_execution_skips_variable_conversion = True
+
 
     # Names and types of params required to be implemented in all subclass paramClassDefaults:
     # Notes:
@@ -298,6 +309,9 @@ class Component(object):
     #              (can't reference own class directly class block)
     requiredParamClassDefaultTypes = {}
     paramClassDefaults = {}
+
+    # Signatures of the __init__ methods of Component classes (by class), used by _assign_args_to_param_dicts
+    _init_signatures = {}
     #endregion
 
     def __init__(self,
@@ -491,6 +505,8 @@ class Component(object):
         # MODIFIED 4/1/17 END
 
         self.runtime_params_in_use = False
+        self._runtime_params_assigned = set()
+        self._validated_runtime_params = set()
         #endregion
 
         #region VALIDATE FUNCTION (self.function and/or self.params[function, FUNCTION_PARAMS])
@@ -564,8 +580,12 @@ class Component(object):
         """
 
         # Get args in call to __init__ and create access to default values
-        sig = inspect.signature(self.__init__)
-        default = lambda val : list(sig.parameters.values())[list(sig.parameters.keys()).index(val)].default
+        # Note: the signature is the same for all instances of a class, so it is only computed once for each
+        try:
+            sig = Component._init_signatures[self.__class__]
+        except KeyError:
+            sig = Component._init_signatures[self.__class__] = inspect.signature(self.__init__)
+        default = lambda val : sig.parameters[val].default
 
         def parse_arg(arg):
             # Resolves the string value of any args that use keywords as their name
@@ -804,13 +824,22 @@ class Component(object):
         if callable(variable):
             variable = variable()
 
-        # Validate variable if parameter_validation is set and the function was called with a variable
-        if self.prefs.paramValidationPref and not variable is None:
+        # Validate variable if parameter_validation is set (and not in fast execution mode)
+        #    and the function was called with a variable
+        param_validation = not self._fast_execution and self.prefs.paramValidationPref
+        if param_validation and not variable is None:
             if context:
                 context = context + SEPARATOR_BAR + FUNCTION_CHECK_ARGS
             else:
                 context = FUNCTION_CHECK_ARGS
             self._validate_variable(variable, context=context)
+        # In fast execution mode, variable is still converted to the format required by the function
+        #    (by _validate_variable), unless it is an ndarray with the same format as the one last assigned
+        elif (self._fast_execution and not variable is None and
+                  not (self._fast_execution_skips_variable_conversion and
+                       isinstance(variable, np.ndarray) and isinstance(self.variable, np.ndarray) and
+                       variable.shape == self.variable.shape and variable.dtype == self.variable.dtype)):
+            self._validate_variable(variable, context=context)
         else:
             self.variable = variable
 
@@ -829,41 +858,66 @@ class Component(object):
         #   (relabel params as runtime_params for clarity)
         runtime_params = params
 
+        # IMPLEMENTATION NOTE:  the names of params assigned as runtime params are recorded in
+        #                       self._runtime_params_assigned, so that only those need to be reset to
+        #                       paramInstanceDefaults (rather than all of the params in user_params)
         if runtime_params and runtime_params is not None:
-            for param_name in self.user_params:
+            sticky_assignment = self.runtimeParamStickyAssignmentPref
+            runtime_params_assigned = set()
+            for param_name in runtime_params:
                 # IMPLEMENTATION NOTE: FUNCTION_RUNTIME_PARAM_NOT_SUPPORTED
                 #    At present, assignment of ``function`` as runtime param is not supported
                 #        (this is because paramInstanceDefaults[FUNCTION] could be a class rather than an bound method;
                 #        i.e., not yet instantiated;  could be rectified by assignment in _instantiate_function)
-                if param_name is FUNCTION:
+                if param_name is FUNCTION or not param_name in self.user_params:
                     continue
-                # If param is specified in runtime_params, then assign it
-                if param_name in runtime_params:
-                    self.paramsCurrent[param_name] = runtime_params[param_name]
-                # Otherwise, (re-)assign to paramInstanceDefaults
-                #    this insures that any params that were assigned as runtime on last execution are reset here
-                #    (unless they have been assigned another runtime value)
-                elif not self.runtimeParamStickyAssignmentPref:
+                # Param is specified in runtime_params, so assign it
+                self.paramsCurrent[param_name] = runtime_params[param_name]
+                runtime_params_assigned.add(param_name)
+            # (Re-)assign paramInstanceDefaults to any params that were assigned as runtime params on last execution
+            #    (unless they have been assigned another runtime value)
+            if not sticky_assignment:
+                for param_name in self._runtime_params_assigned - runtime_params_assigned:
                     self.paramsCurrent[param_name] = self.paramInstanceDefaults[param_name]
+            else:
+                runtime_params_assigned |= self._runtime_params_assigned
+            self._runtime_params_assigned = runtime_params_assigned
             self.runtime_params_in_use = True
-        # Otherwise, reset paramsCurrent to paramInstanceDefaults
+        # Otherwise, reset any params assigned as runtime params to paramInstanceDefaults
         elif self.runtime_params_in_use and not self.runtimeParamStickyAssignmentPref:
             # Can't do the following since function could still be a class ref rather than abound method (see below)
             # self.paramsCurrent = self.paramInstanceDefaults
-            for param_name in self.user_params:
-                # IMPLEMENTATION NOTE: FUNCTION_RUNTIME_PARAM_NOT_SUPPORTED
-                #    At present, assignment of ``function`` as runtime param is not supported
-                #        (this is because paramInstanceDefaults[FUNCTION] could be a class rather than an bound method;
-                #        i.e., not yet instantiated;  could be rectified by assignment in _instantiate_function)
-                if param_name is FUNCTION:
-                    continue
+            for param_name in self._runtime_params_assigned:
                 self.paramsCurrent[param_name] = self.paramInstanceDefaults[param_name]
+            self._runtime_params_assigned = set()
             self.runtime_params_in_use = False
 
         # If parameter_validation is set and they have changed, then validate requested values and assign to target_set
-        if self.prefs.paramValidationPref and params and not params is target_set:
-            self._validate_params(request_set=params, target_set=target_set, context=context)
+        if param_validation and params and not params is target_set:
+            self._validate_runtime_params(params, target_set, context=context)
+
+    def _validate_runtime_params(self, params, target_set, context=None):
+        """Validate runtime params and assign them to target_set, skipping validation of ones already validated
+
+        Runtime params with only numeric values that are assigned to paramsCurrent are validated only the first time
+            they are used (e.g., by each allocation policy evaluated in an EVC simulation);  the validated sets are
+            kept in self._validated_runtime_params (up to RUNTIME_PARAMS_VALIDATION_CACHE_SIZE of them), and the
+            params in a set that has already been validated are just assigned to paramsCurrent.
+        Any other params are validated on every call.
+        """
+        key = None
+        if target_set is self.paramsCurrent and all(isinstance(value, numbers.Number) for value in params.values()):
+            # Include type of each value, so that values that compare equal but have different types are kept distinct
+            key = tuple(sorted((param_name, type(value), value) for param_name, value in params.items()))
+            if key in self._validated_runtime_params:
+                for param_name, value in params.items():
+                    target_set[param_name] = value
+                return
 
+        self._validate_params(request_set=params, target_set=target_set, context=context)
+
+        if key is not None and len(self._validated_runtime_params) < RUNTIME_PARAMS_VALIDATION_CACHE_SIZE:
+            self._validated_runtime_params.add(key)
 
     def _assign_defaults(self,
                         variable=None,
@@ -1038,9 +1092,10 @@ class Component(object):
                 # # MODIFIED 11/30/16 OLD:
                 # function = request_set[FUNCTION]
                 # MODIFIED 11/30/16 NEW:
-                # Copy to keep record of request_set function for comparison below, after request_set has been updated
-                import copy
-                function = copy.deepcopy(request_set[FUNCTION])
+                # Keep record of request_set function for comparison below, after request_set has been updated
+                # Note: a reference is sufficient, since the entry in request_set may be replaced but the function
+                #       itself is not modified here;  only its user_params are used (and copied) below
+                function = request_set[FUNCTION]
                 # MODIFIED 11/30/16 END
             except KeyError:
                 # If there is no function specified, then allow functionParams
@@ -1083,7 +1138,7 @@ class Component(object):
                             from PsyNeuLink.Components.Functions.Function import Function_Base
                             if isinstance(function, Function_Base):
                                 request_set[FUNCTION] = function.__class__
-                            default_set[FUNCTION_PARAMS] = function.user_params
+                            default_set[FUNCTION_PARAMS] = function.user_params.copy()
                     # function not yet defined, so allow FUNCTION_PARAMS)
                     except UnboundLocalError:
                         pass
@@ -1337,6 +1392,20 @@ class Component(object):
                     target_set[param_name] = param_value
                 continue
 
+            # The value is the one in paramClassDefaults (i.e., it was not overridden for the instance),
+            #    so it is necessarily compatible:  assign it without type checking
+            # Note: dicts, tuples and classes are excluded, as they are processed (not just assigned) below
+            if (param_value is self.paramClassDefaults[param_name] and
+                    not isinstance(param_value, (dict, tuple)) and not inspect.isclass(param_value)):
+                if target_set is not None:
+                    # Copy any iterables (as below)
+                    from collections import Iterable
+                    if not isinstance(param_value, Iterable) or isinstance(param_value, str):
+                        target_set[param_name] = param_value
+                    else:
+                        target_set[param_name] = param_value.copy()
+                continue
+
             # If the value in paramClassDefault is a type, check if param value is an instance of it
             if inspect.isclass(self.paramClassDefaults[param_name]):
                 if isinstance(param_value, self.paramClassDefaults[param_name]):
@@ -425,6 +425,24 @@ class Function_Base(Function):
     def execute(self, variable=None, params=None, context=None):
         return self.function(variable=variable, params=params, context=context)
 
+    def batch_function(self, variable, params=None, context=None):
+        """Return an array with the result of `function <Function_Base.function>` for each item of variable
+
+        The first axis of variable is the batch axis (e.g., one item per trial in a batched run of a System).
+        This default calls function for each item;  subclasses that can operate on all of the items at once
+        override it.
+        """
+        return np.array([self.function(variable=item, params=params, context=context) for item in variable])
+
+    def _fast(self, variable, context=None):
+        """Return the result of `function <Function_Base.function>` for variable, without checking its arguments
+
+        For use by the execution engine in fast execution mode (see `ExecutionMode`):  variable must already be in the
+        format required by the function, and no runtime params can be specified.  This default simply calls
+        function;  subclasses override it to compute the result directly from their parameter attributes.
+        """
+        return self.function(variable=variable, context=context)
+
     @property
     def functionOutputType(self):
         if self.paramsCurrent[kwFunctionOutputTypeConversion]:
@@ -1333,6 +1351,64 @@ class LinearCombination(CombinationFunction): # --------------------------------
 # FIX: CONFIRM THAT RETURNS LIST IF GIVEN A LIST
         return result
 
+    def _fast(self, variable, context=None):
+        """Combine the arrays in variable (a list or 2d np.array) without checking arguments (see Function_Base._fast)
+        """
+        # Exponents require the check for zeros in function during initialization
+        if self.runtime_params_in_use or self.exponents is not None:
+            return self.function(variable=variable, context=context)
+
+        variable = np.asarray(variable)
+        if variable.ndim < 2 or variable.dtype == object:
+            return self.function(variable=variable, context=context)
+
+        self.variable = variable
+        weights = self.weights
+        if weights is not None:
+            variable = variable * weights
+
+        if (self.operation is SUM):
+            return sum(variable) * self.scale + self.offset
+        elif self.operation is PRODUCT:
+            return reduce(mul, variable, 1)
+        else:
+            raise FunctionError("Unrecognized operator ({0}) for LinearCombination function".format(self.operation))
+
+    def batch_function(self, variable, params=None, context=None):
+        """Combine the arrays in each item of variable (a 3d array, the first axis of which is the batch axis)
+        """
+
+        # Assign params as function does (variable is left as is)
+        self._check_args(variable=self.variable, params=params, context=context)
+
+        exponents = self.paramsCurrent[EXPONENTS]
+        weights = self.paramsCurrent[WEIGHTS]
+        operation = self.paramsCurrent[OPERATION]
+        offset = self.paramsCurrent[OFFSET]
+        scale = self.paramsCurrent[SCALE]
+
+        variable = np.asarray(variable)
+
+        # Arrays to be combined are along axis 1 (exponents and weights broadcast over batch axis as in function)
+        if exponents is not None:
+            if len(exponents) != variable.shape[1]:
+                raise FunctionError("Number of exponents ({0}) does not equal number of items in variable ({1})".
+                                   format(len(exponents), variable.shape[1]))
+            variable = variable ** exponents
+
+        if weights is not None:
+            if len(weights) != variable.shape[1]:
+                raise FunctionError("Number of weights ({0}) is not equal to number of items in variable ({1})".
+                                   format(len(weights), variable.shape[1]))
+            variable = variable * weights
+
+        if (operation is SUM):
+            return np.sum(variable, axis=1) * scale + offset
+        elif operation is PRODUCT:
+            return np.prod(variable, axis=1)
+        else:
+            raise FunctionError("Unrecognized operator ({0}) for LinearCombination function".format(operation))
+
 #region ***********************************  TRANSFER FUNCTIONS  ***********************************************
 #endregion
 
@@ -1529,6 +1605,16 @@ class Linear(TransferFunction): # ----------------------------------------------
 
         return result
 
+    def _fast(self, variable, context=None):
+        """Return `slope <Linear.slope>` * variable + `intercept <Linear.intercept>` without checking arguments
+        (see Function_Base._fast)
+        """
+        if self.runtime_params_in_use or self.functionOutputType is not None:
+            return self.function(variable=variable, context=context)
+
+        self.variable = variable
+        return variable * self.slope + self.intercept
+
     def derivative(self, input=None, output=None):
         """
         derivative()
@@ -1545,6 +1631,17 @@ class Linear(TransferFunction): # ----------------------------------------------
 
         return self.slope
 
+    def batch_function(self, variable, params=None, context=None):
+        """Return `slope <Linear.slope>` * variable + `intercept <Linear.intercept>` for all items of variable
+        """
+        self._check_args(variable=self.variable, params=params, context=context)
+
+        # Output type conversion is applied to each item
+        if self.functionOutputType is not None:
+            return super().batch_function(variable, params=params, context=context)
+
+        return np.asarray(variable) * self.paramsCurrent[SLOPE] + self.paramsCurrent[INTERCEPT]
+
 
 class Exponential(TransferFunction): # ---------------------------------------------------------------------------------
     """
@@ -1673,6 +1770,16 @@ class Exponential(TransferFunction): # -----------------------------------------
 
         return scale * np.exp(rate * self.variable)
 
+    def _fast(self, variable, context=None):
+        """Return `scale <Exponential.scale>` * e**(`rate <Exponential.rate>` * variable) without checking arguments
+        (see Function_Base._fast)
+        """
+        if self.runtime_params_in_use:
+            return self.function(variable=variable, context=context)
+
+        self.variable = variable
+        return self.scale * np.exp(self.rate * variable)
+
     def derivative(self, input, output=None):
         """
         derivative(input)
@@ -1818,6 +1925,24 @@ class Logistic(TransferFunction): # --------------------------------------------
 
         return 1 / (1 + np.exp(-(gain * self.variable) + bias))
 
+    def _fast(self, variable, context=None):
+        """Return logistic transformation of variable without checking arguments (see Function_Base._fast)
+        """
+        if self.runtime_params_in_use:
+            return self.function(variable=variable, context=context)
+
+        self.variable = variable
+        return 1 / (1 + np.exp(-(self.gain * variable) + self.bias))
+
+    def batch_function(self, variable, params=None, context=None):
+        """Return logistic transformation of all items of variable
+        """
+        self._check_args(variable=self.variable, params=params, context=context)
+        gain = self.paramsCurrent[GAIN]
+        bias = self.paramsCurrent[BIAS]
+
+        return 1 / (1 + np.exp(-(gain * np.asarray(variable)) + bias))
+
     def derivative(self, output, input=None):
         """
         derivative(output)
@@ -2016,6 +2141,31 @@ class SoftMax(TransferFunction): # ---------------------------------------------
         indicator = self.function(input, params={MAX_VAL:True})
         return output - indicator
 
+    def batch_function(self, variable, params=None, context=None):
+        """Return softmax transformation of each item of variable (normalized within each item)
+        """
+        self._check_args(variable=self.variable, params=params, context=context)
+
+        output = self.params[OUTPUT_TYPE]
+        gain = self.params[GAIN]
+
+        # Choice is made for each item in turn (so that random values are drawn in the same order as by function)
+        if output is PROB:
+            return super().batch_function(variable, params=params, context=context)
+
+        sm = np.exp(gain * np.asarray(variable))
+        sm = sm / np.sum(sm, axis=-1, keepdims=True)
+
+        if output is MAX_VAL:
+            max_value = np.max(sm, axis=-1, keepdims=True)
+            sm = np.where(sm == max_value, max_value, 0)
+
+        elif output is MAX_INDICATOR:
+            max_value = np.max(sm, axis=-1, keepdims=True)
+            sm = np.where(sm == max_value, 1, 0)
+
+        return sm
+
 
 class LinearMatrix(TransferFunction):  # -------------------------------------------------------------------------------
     """
@@ -2411,6 +2561,24 @@ class LinearMatrix(TransferFunction):  # ---------------------------------------
 
         return np.dot(self.variable, self.matrix)
 
+    def _fast(self, variable, context=None):
+        """Return dot product of variable and `matrix <LinearMatrix.matrix>` without checking arguments
+        (see Function_Base._fast)
+        """
+        if self.runtime_params_in_use:
+            return self.function(variable=variable, context=context)
+
+        self.variable = variable
+        return np.dot(variable, self.matrix)
+
+    def batch_function(self, variable, params=None, context=None):
+        """Return dot product of each item of variable (a 2d array, the first axis of which is the batch axis) and
+        `matrix <LinearMatrix.matrix>`
+        """
+        self._check_args(self.variable, params, context=context)
+
+        return np.dot(variable, self.matrix)
+
     def keyword(self, keyword):
 
         from PsyNeuLink.Components.Projections.MappingProjection import MappingProjection
@@ -2803,6 +2971,43 @@ class Integrator(IntegratorFunction): # ----------------------------------------
 
         return value
 
+    def batch_function(self, variable, params=None, context=None):
+        """Integrate each item of variable in turn, and return an array with the value after each
+
+        The integral is carried over from one item to the next, as it is between calls to function, and `old_value
+        <Integrator.old_value>` is left with the value for the last item.  If the noise is a function, the weighting
+        is DIFFUSION, or an INITIALIZER is specified in params, function is called for each item.
+        """
+
+        if self.noise_function or self.paramsCurrent[WEIGHTING] is DIFFUSION or (params and INITIALIZER in params):
+            return super().batch_function(variable, params=params, context=context)
+
+        # Assign params and variable as function does for the last item
+        self._check_args(variable=variable[-1], params=params, context=context)
+
+        rate = np.array(self.paramsCurrent[RATE]).astype(float)
+        weighting = self.paramsCurrent[WEIGHTING]
+        noise = self.noise
+
+        old_value = np.atleast_2d(self.old_value)
+        values = []
+        for new_value in variable:
+            if weighting is CONSTANT:
+                value = old_value + rate + noise
+            elif weighting is SIMPLE:
+                value = old_value + (new_value * rate) + noise
+            elif weighting is ADAPTIVE:
+                value = (1-rate)*old_value + rate*new_value + noise
+            else:
+                value = new_value
+            values.append(value)
+            old_value = np.atleast_2d(value)
+
+        if not context or not INITIALIZING in context:
+            self.old_value = values[-1]
+
+        return np.array(values)
+
 
 # FIX: SHOULD THIS EVEN ALLOW A WEIGHTING PARAM IF IT REQUIRES THAT IT BE DIFFUSION??
 class DDMIntegrator(Integrator): # -------------------------------------------------------------------------------------
@@ -3191,6 +3396,86 @@ class BogaczEtAl(IntegratorFunction): # ----------------------------------------
 
         return rt, er
 
+    def batch_function(self, variable, params=None, context=None):
+        """Return arrays with the mean response time (RT) and mean error rate (ER) for each item of variable
+
+        The value of each param in params can be a 1d array with one item for each item of variable (e.g., the
+        drift_rate for each execution of a batch), or a single value used for all of them;  params that are not
+        specified are the current values of the function's params.  The solutions are computed for all of the items
+        at once, using the same expressions as `function <BogaczEtAl.function>`.  If any of those overflows or is
+        invalid, function is instead called for each item in turn (so that the limit it uses for an overflow is
+        applied, and any error it raises is raised), and the results are the same either way.
+        """
+
+        num_items = len(variable)
+        params = params or {}
+        param_values = {}
+        for param_name in (DRIFT_RATE, STARTING_POINT, THRESHOLD, NOISE, NON_DECISION_TIME):
+            try:
+                values = params[param_name]
+            except KeyError:
+                values = float(getattr(self, param_name))
+            param_values[param_name] = np.broadcast_to(np.asarray(values, dtype=float), (num_items,))
+
+        drift_rate = param_values[DRIFT_RATE]
+        threshold = param_values[THRESHOLD]
+        starting_point = param_values[STARTING_POINT]
+        noise = param_values[NOISE]
+        t0 = param_values[NON_DECISION_TIME]
+
+        try:
+            with np.errstate(over='raise', divide='raise', invalid='raise'):
+
+                bias = (starting_point + threshold) / (2 * threshold)
+                last_bias = bias[-1]
+                bias = np.where(bias <= 0, 1e-8, np.where(bias >= 1, 1-1e-8, bias))
+
+                rt = np.empty(num_items)
+                er = np.empty(num_items)
+
+                # drift_rate close to or at 0 (as in function)
+                zero = abs(drift_rate) < 1e-8
+                bias_abs = bias[zero] * 2 * threshold[zero] - threshold[zero]
+                rt[zero] = t0[zero] + (threshold[zero]**2 - bias_abs**2)/(noise[zero]**2)
+                er[zero] = (threshold[zero] - bias_abs)/(2*threshold[zero])
+
+                nonzero = ~zero
+                drift_rate_normed = abs(drift_rate[nonzero])
+                threshold_nz = threshold[nonzero]
+                noise_nz = noise[nonzero]
+                ztilde = threshold_nz/drift_rate_normed
+                atilde = (drift_rate_normed/noise_nz)**2
+
+                is_neg_drift = drift_rate[nonzero]<0
+                bias_adj = (is_neg_drift==1)*(1 - bias[nonzero]) + (is_neg_drift==0)*bias[nonzero]
+                y0tilde = ((noise_nz**2)/2) * np.log(bias_adj / (1 - bias_adj))
+                y0tilde = np.where(abs(y0tilde) > threshold_nz,
+                                   -1*(is_neg_drift==1)*threshold_nz + (is_neg_drift==0)*threshold_nz,
+                                   y0tilde)
+                x0tilde = y0tilde/drift_rate_normed
+
+                rt_nz = ztilde * tanh(ztilde * atilde) + \
+                        ((2*ztilde*(1-exp(-2*x0tilde*atilde)))/(exp(2*ztilde*atilde)-exp(-2*ztilde*atilde))-x0tilde) + \
+                        t0[nonzero]
+                er_nz = 1/(1+exp(2*ztilde*atilde)) - \
+                        ((1-exp(-2*x0tilde*atilde))/(exp(2*ztilde*atilde)-exp(-2*ztilde*atilde)))
+                rt[nonzero] = rt_nz
+                er[nonzero] = (is_neg_drift==1)*(1 - er_nz) + (is_neg_drift==0)*(er_nz)
+
+        except FloatingPointError:
+            results = [self.function(params={param_name: values[i] for param_name, values in param_values.items()},
+                                     context=context)
+                       for i in range(num_items)]
+            return tuple(np.array(result, dtype=float) for result in zip(*results))
+
+        # Assign params and bias as function does for the last item
+        self._check_args(variable=None,
+                         params={param_name: values[-1] for param_name, values in param_values.items()},
+                         context=context)
+        self.bias = last_bias
+
+        return rt, er
+
 
 # Results from Navarro and Fuss DDM solution (indices for return value tuple)
 class NF_Results(AutoNumber):
@@ -3705,6 +3990,9 @@ class LearningFunction(Function_Base):
 
     componentType = LEARNING_FUNCTION_TYPE
 
+    # _validate_variable assigns the input values to attributes, so it must be called on every execution
+    _fast_execution_skips_variable_conversion = False
+
 
 LEARNING_ACTIVATION_FUNCTION = 'activation_function'
 LEARNING_ACTIVATION_INPUT = 0       # a(j)
@@ -430,9 +430,9 @@ class ControlMechanism_Base(Mechanism_Base):
 
         # Update controlSignalCosts to accommodate instantiated projection
         try:
-            self.controlSignalCosts = np.append(self.controlSignalCosts, np.empty((1,1)),axis=0)
+            self.controlSignalCosts = np.append(self.controlSignalCosts, np.zeros((1,1)),axis=0)
         except AttributeError:
-            self.controlSignalCosts = np.empty((1,1))
+            self.controlSignalCosts = np.zeros((1,1))
 
         return state
 
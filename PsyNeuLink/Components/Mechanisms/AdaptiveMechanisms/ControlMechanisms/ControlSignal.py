@@ -719,24 +719,13 @@ class ControlSignal(OutputState):
             # record info in log
 
 # FIX: ENCODE ALL OF THIS AS 1D ARRAYS IN 2D PROJECTION VALUE, AND PASS TO .value FOR LOGGING
-            controller.log.entries[self.name + " " +
-                                      kpIntensity] = LogEntry(CurrentTime(), context, float(self.intensity))
+            controller.log.record_value(self.name + " " + kpIntensity, float(self.intensity), context)
             if not self.ignoreIntensityFunction:
-                controller.log.entries[self.name + " " + kpAllocation] = LogEntry(CurrentTime(),
-                                                                                  context,
-                                                                                  float(self.allocation))
-                controller.log.entries[self.name + " " + kpIntensityCost] =  LogEntry(CurrentTime(),
-                                                                                      context,
-                                                                                      float(self.intensity_cost))
-                controller.log.entries[self.name + " " + kpAdjustmentCost] = LogEntry(CurrentTime(),
-                                                                                      context,
-                                                                                      float(self.adjustment_cost))
-                controller.log.entries[self.name + " " + kpDurationCost] = LogEntry(CurrentTime(),
-                                                                                    context,
-                                                                                    float(self.duration_cost))
-                controller.log.entries[self.name + " " + kpCost] = LogEntry(CurrentTime(),
-                                                                            context,
-                                                                            float(self.cost))
+                controller.log.record_value(self.name + " " + kpAllocation, float(self.allocation), context)
+                controller.log.record_value(self.name + " " + kpIntensityCost, float(self.intensity_cost), context)
+                controller.log.record_value(self.name + " " + kpAdjustmentCost, float(self.adjustment_cost), context)
+                controller.log.record_value(self.name + " " + kpDurationCost, float(self.duration_cost), context)
+                controller.log.record_value(self.name + " " + kpCost, float(self.cost), context)
     #endregion
 
         self.value = self.intensity
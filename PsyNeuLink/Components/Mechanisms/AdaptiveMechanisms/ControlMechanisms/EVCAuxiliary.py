@@ -9,14 +9,24 @@
 # *************************************************  EVCAuxiliary ******************************************************
 
 
+import multiprocessing
+from collections import OrderedDict
+from copy import deepcopy
+from itertools import product
+
 from PsyNeuLink.Components.ShellClasses import *
 from PsyNeuLink.Components.Functions.Function import Function_Base
+from PsyNeuLink.Globals.Context import ExecutionContext
 
 
+# Set PY_MULTIPROCESSING to True to run the simulations for a grid search in parallel processes
+#    (see _simulate_in_processes), using PY_MULTIPROCESSING_PROCESSES processes (None for one per CPU)
 PY_MULTIPROCESSING = False
+PY_MULTIPROCESSING_PROCESSES = None
 
-if PY_MULTIPROCESSING:
-    from multiprocessing import Pool
+# Set BATCH_SIMULATION to False to run the simulations for a grid search one at a time, even if the system supports
+#    running them all at once (see EVCMechanism.run_batch_simulation)
+BATCH_SIMULATION = True
 
 
 if MPI_IMPLEMENTATION:
@@ -26,11 +36,119 @@ kwEVCAuxFunction = "EVC AUXILIARY FUNCTION"
 kwEVCAuxFunctionType = "EVC AUXILIARY FUNCTION TYPE"
 kwValueFunction = "EVC VALUE FUNCTION"
 kwControlSignalGridSearchFunction = "EVC CONTROL SIGNAL GRID SEARCH FUNCTION"
+kwEVCOptimizerFunction = "EVC OPTIMIZER FUNCTION"
+kwControlSignalCoordinateAscentFunction = "EVC CONTROL SIGNAL COORDINATE ASCENT FUNCTION"
+kwControlSignalGridRefinementFunction = "EVC CONTROL SIGNAL GRID REFINEMENT FUNCTION"
+kwControlSignalGoldenSectionSearchFunction = "EVC CONTROL SIGNAL GOLDEN SECTION SEARCH FUNCTION"
 CONTROLLER = 'controller'
 OUTCOME = 'outcome'
 COSTS = 'costs'
 
 
+class ControlSignalSearchSpace(object):
+    """Set of all allocation policies for a set of ControlSignals, enumerated as needed
+
+    Each policy is a combination of one value from the allocation_samples of each ControlSignal.  Policies are
+    decoded from their index (as a mixed-radix number, with one digit for each ControlSignal) when they are accessed,
+    rather than all being constructed at once;  they are in the same order as the rows of
+    np.array(np.meshgrid(*samples)).T.reshape(-1, len(samples)), from which the search space was previously built
+    (i.e., the last digit is for the second ControlSignal, the one before it for the first, and the ones before that
+    for the others in reverse order).
+
+    Supports len, indexing by an int (returning a policy as a 1d np.array), or by a slice, array of ints or boolean
+    mask (returning a 2d np.array of policies, with an optional second index for the ControlSignals), iteration over the
+    policies or over chunks of them (see chunks), and conversion to a 2d np.array (using np.array).
+    """
+
+    chunkSize = 1024
+
+    def __init__(self, samples):
+        self.samples = [np.asarray(sample_values) for sample_values in samples]
+        self.dtype = np.result_type(*self.samples) if self.samples else np.float64
+        num_control_signals = len(self.samples)
+        # ControlSignals in order of their digit, from most to least significant (see above)
+        if num_control_signals > 1:
+            self._digit_order = list(range(num_control_signals - 1, 1, -1)) + [0, 1]
+        else:
+            self._digit_order = list(range(num_control_signals))
+        self._radices = tuple(len(self.samples[i]) for i in self._digit_order)
+        self._len = int(np.prod(self._radices)) if self.samples else 0
+
+    def has_samples(self, samples):
+        """Return True if samples are the same (i.e., the search space would be the same if constructed from them)
+        """
+        return (len(samples) == len(self.samples) and
+                all(np.array_equal(sample_values, own_sample_values)
+                    for sample_values, own_sample_values in zip(samples, self.samples)))
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def shape(self):
+        return (self._len, len(self.samples))
+
+    def _encode(self, sample_indices):
+        # Return the index of the policy with the sample indices (one for each ControlSignal)
+        return int(np.ravel_multi_index([sample_indices[i] for i in self._digit_order], self._radices))
+
+    def _decode(self, indices):
+        # Return a 2d array with the policy for each of indices (which must be in range)
+        policies = np.empty((len(indices), len(self.samples)), dtype=self.dtype)
+        if len(indices):
+            for i, digits in zip(self._digit_order, np.unravel_index(indices, self._radices)):
+                policies[:, i] = self.samples[i][digits]
+        return policies
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            policies = self[key[0]]
+            if policies.ndim == 2:
+                return policies[(slice(None),) + key[1:]]
+            return policies[key[1:]]
+        if isinstance(key, slice):
+            return self._decode(np.arange(*key.indices(self._len)))
+        if isinstance(key, (list, np.ndarray)):
+            indices = np.asarray(key)
+            if indices.dtype == bool:
+                # Boolean mask (as for indexing an np.array)
+                if indices.shape != (self._len,):
+                    raise IndexError("boolean index of shape {} does not match search space with {} policies".
+                                     format(indices.shape, self._len))
+                return self._decode(np.flatnonzero(indices))
+            if indices.size and not np.issubdtype(indices.dtype, np.integer):
+                raise IndexError("arrays used as indices into search space must be of integer or boolean type")
+            indices = indices.astype(int)
+            if np.any((indices < -self._len) | (indices >= self._len)):
+                raise IndexError("index out of range for search space with {} policies".format(self._len))
+            return self._decode(indices % max(self._len, 1))
+        index = int(key)
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("index {} out of range for search space with {} policies".format(key, self._len))
+        return self._decode([index])[0]
+
+    def chunks(self, start=0, end=None, chunk_size=None):
+        """Generate 2d np.arrays with the policies from start to end, with (at most) chunk_size policies in each
+        """
+        start, end, step = slice(start, end).indices(self._len)
+        chunk_size = chunk_size or self.chunkSize
+        for chunk_start in range(start, end, chunk_size):
+            yield self[chunk_start:min(chunk_start + chunk_size, end)]
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            for policy in chunk:
+                yield policy
+
+    def __array__(self, dtype=None):
+        policies = self[:]
+        if dtype is not None:
+            policies = policies.astype(dtype)
+        return policies
+
+
 class EVCAuxiliaryFunction(Function_Base):
     """Base class for EVC auxiliary functions
     """
@@ -139,6 +257,9 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
                 for each `allocation_policy`.
             * Call `_compute_EVC` for each allocation_policy to calculate the EVC, identify the  maximum,
                 and assign to `EVC_max`.
+            * If PY_MULTIPROCESSING is True (and more than one process is used), the simulations are run in parallel
+                processes (see _simulate_in_processes);  otherwise, if BATCH_SIMULATION is True and the system
+                supports it, they are all run at once (see EVCMechanism.run_batch_simulation).
             * Set `EVC_max_policy` to the `allocation_policy` (outputState.values) corresponding to EVC_max.
             * Set value for each controlSignal (outputState.value) to the values in `EVC_max_policy`.
             * Return an allocation_policy.
@@ -190,7 +311,7 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
         controller.EVC_policies = []
 
         # Reset context so that System knows this is a simulation (to avoid infinitely recursive loop)
-        context = context.replace(EXECUTING, '{0} {1}'.format(controller.name, EVC_SIMULATION))
+        context = ExecutionContext.from_string(context).for_simulation(controller)
 
         # Print progress bar
         if controller.prefs.reportOutputPref:
@@ -207,134 +328,167 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
         controller.EVC_max_state_values = controller.variable.copy()
         controller.EVC_max_policy = controller.controlSignalSearchSpace[0] * 0.0
 
-        # Parallelize using multiprocessing.Pool
-        # NOTE:  currently fails on attempt to pickle lambda functions
-        #        preserved here for possible future restoration
-        if PY_MULTIPROCESSING:
-            EVC_pool = Pool()
-            results = EVC_pool.map(_compute_EVC, [(controller, arg, runtime_params, time_scale, context)
-                                                 for arg in controller.controlSignalSearchSpace])
-
-        else:
-
-            # Parallelize using MPI
-            if MPI_IMPLEMENTATION:
-                Comm = MPI.COMM_WORLD
-                rank = Comm.Get_rank()
-                size = Comm.Get_size()
-
-                chunk_size = (len(controller.controlSignalSearchSpace) + (size-1)) // size
-                print("Rank: {}\nChunk size: {}".format(rank, chunk_size))
-                start = chunk_size * rank
-                end = chunk_size * (rank+1)
-                if start > len(controller.controlSignalSearchSpace):
-                    start = len(controller.controlSignalSearchSpace)
-                if end > len(controller.controlSignalSearchSpace):
-                    end = len(controller.controlSignalSearchSpace)
-            else:
-                start = 0
+        # Parallelize using MPI
+        if MPI_IMPLEMENTATION:
+            Comm = MPI.COMM_WORLD
+            rank = Comm.Get_rank()
+            size = Comm.Get_size()
+
+            chunk_size = (len(controller.controlSignalSearchSpace) + (size-1)) // size
+            print("Rank: {}\nChunk size: {}".format(rank, chunk_size))
+            start = chunk_size * rank
+            end = chunk_size * (rank+1)
+            if start > len(controller.controlSignalSearchSpace):
+                start = len(controller.controlSignalSearchSpace)
+            if end > len(controller.controlSignalSearchSpace):
                 end = len(controller.controlSignalSearchSpace)
-
-            if MPI_IMPLEMENTATION:
-                print("START: {0}\nEND: {1}".format(start,end))
-
-            #region EVALUATE EVC
-
-            # Compute EVC for each allocation policy in controlSignalSearchSpace
-            # Notes on MPI:
-            # * breaks up search into chunks of size chunk_size for each process (rank)
-            # * each process computes max for its chunk and returns
-            # * result for each chunk contains EVC max and associated allocation policy for that chunk
-
-            result = None
-            EVC_max = float('-Infinity')
-            EVC_max_policy = np.empty_like(controller.controlSignalSearchSpace[0])
-            EVC_max_state_values = np.empty_like(controller.inputValue)
-            max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
-            # FIX:  INITIALIZE TO FULL LENGTH AND ASSIGN DEFAULT VALUES (MORE EFFICIENT):
-            EVC_values = np.array([])
-            EVC_policies = np.array([[]])
-
-            for allocation_vector in controller.controlSignalSearchSpace[start:end,:]:
-            # for iter in range(rank, len(controller.controlSignalSearchSpace), size):
-            #     allocation_vector = controller.controlSignalSearchSpace[iter,:]:
-
+        else:
+            start = 0
+            end = len(controller.controlSignalSearchSpace)
+
+        if MPI_IMPLEMENTATION:
+            print("START: {0}\nEND: {1}".format(start,end))
+
+        #region EVALUATE EVC
+
+        # Compute EVC for each allocation policy in controlSignalSearchSpace
+        # Notes on MPI:
+        # * breaks up search into chunks of size chunk_size for each process (rank)
+        # * each process computes max for its chunk and returns
+        # * result for each chunk contains EVC max and associated allocation policy for that chunk
+
+        result = None
+        EVC_max = float('-Infinity')
+        EVC_max_policy = np.empty_like(controller.controlSignalSearchSpace[0])
+        EVC_max_state_values = np.empty_like(controller.inputValue)
+        max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
+        # EVC of each policy (assigned by index)
+        EVC_values = np.empty(end - start)
+
+        # Run the simulations in parallel processes if specified, or all at once if the system supports it,
+        #    and then compute the EVCs below
+        simulated_state_values = []
+        policies = (policy for chunk in controller.controlSignalSearchSpace.chunks(start, end) for policy in chunk)
+        if PY_MULTIPROCESSING and _num_simulation_processes(end - start) > 1:
+            simulated_state_values, simulated_costs = _simulate_in_processes(controller,
+                                                                             start, end,
+                                                                             runtime_params,
+                                                                             time_scale,
+                                                                             context)
+            policies = []
+        elif BATCH_SIMULATION and end - start > 1 and _supports_batch_simulation(controller):
+            simulated_state_values, simulated_costs = controller.run_batch_simulation(inputs=controller.predictedInput,
+                                                                                      allocation_policies=policies,
+                                                                                      runtime_params=runtime_params,
+                                                                                      time_scale=time_scale,
+                                                                                      context=context)
+            policies = []
+
+        for allocation_vector in policies:
+        # for iter in range(rank, len(controller.controlSignalSearchSpace), size):
+        #     allocation_vector = controller.controlSignalSearchSpace[iter,:]:
+
+            if controller.prefs.reportOutputPref:
+                increment_progress_bar = (progress_bar_rate < 1) or not (sample % progress_bar_rate)
+                if increment_progress_bar:
+                    print(kwProgressBarChar, end='', flush=True)
+            policy_index = sample
+            sample +=1
+
+            # Calculate EVC for specified allocation policy
+            result_tuple = _compute_EVC(args=(controller, allocation_vector,
+                                              runtime_params,
+                                              time_scale,
+                                              context))
+            EVC, outcome, cost = result_tuple
+
+            EVC_max = max(EVC, EVC_max)
+            # max_result([t1, t2], key=lambda x: x1)
+
+            EVC_values[policy_index] = EVC
+
+            # If EVC is greater than the previous value:
+            # - store the current set of monitored state value in EVC_max_state_values
+            # - store the current set of controlSignals in EVC_max_policy
+            # if EVC_max > EVC:
+            # FIX: PUT ERROR HERE IF EVC AND/OR EVC_MAX ARE EMPTY (E.G., WHEN EXECUTION_ID IS WRONG)
+            if EVC == EVC_max:
+                # Keep track of state values and allocation policy associated with EVC max
+                # EVC_max_state_values = controller.inputValue.copy()
+                # EVC_max_policy = allocation_vector.copy()
+                # Note: inputValue is copied, since it is updated in place by each simulation
+                EVC_max_state_values = deepcopy(controller.inputValue)
+                EVC_max_policy = allocation_vector
+                max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
+
+        if simulated_state_values:
+            # Simulations were run in parallel processes or all at once, so compute the EVC for each policy from
+            #    its outcome and costs (as _compute_EVC does when they are run one at a time)
+            value_function = controller.paramsCurrent[VALUE_FUNCTION]
+            EVCs = []
+            for state_values, costs in zip(simulated_state_values, simulated_costs):
                 if controller.prefs.reportOutputPref:
                     increment_progress_bar = (progress_bar_rate < 1) or not (sample % progress_bar_rate)
                     if increment_progress_bar:
                         print(kwProgressBarChar, end='', flush=True)
-                sample +=1
-
-                # Calculate EVC for specified allocation policy
-                result_tuple = _compute_EVC(args=(controller, allocation_vector,
-                                                  runtime_params,
-                                                  time_scale,
-                                                  context))
-                EVC, outcome, cost = result_tuple
-
-                EVC_max = max(EVC, EVC_max)
-                # max_result([t1, t2], key=lambda x: x1)
-
-                # Add to list of EVC values and allocation policies if save option is set
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    # FIX:  ASSIGN BY INDEX (MORE EFFICIENT)
-                    EVC_values = np.append(EVC_values, np.atleast_1d(EVC), axis=0)
-                    # Save policy associated with EVC for each process, as order of chunks
-                    #     might not correspond to order of policies in controlSignalSearchSpace
-                    if len(EVC_policies[0])==0:
-                        EVC_policies = np.atleast_2d(allocation_vector)
-                    else:
-                        EVC_policies = np.append(EVC_policies, np.atleast_2d(allocation_vector), axis=0)
-
-                # If EVC is greater than the previous value:
-                # - store the current set of monitored state value in EVC_max_state_values
-                # - store the current set of controlSignals in EVC_max_policy
-                # if EVC_max > EVC:
-                # FIX: PUT ERROR HERE IF EVC AND/OR EVC_MAX ARE EMPTY (E.G., WHEN EXECUTION_ID IS WRONG)
-                if EVC == EVC_max:
-                    # Keep track of state values and allocation policy associated with EVC max
-                    # EVC_max_state_values = controller.inputValue.copy()
-                    # EVC_max_policy = allocation_vector.copy()
-                    EVC_max_state_values = controller.inputValue
-                    EVC_max_policy = allocation_vector
-                    max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
-
-            #endregion
-
-            # Aggregate, reduce and assign global results
-
-            if MPI_IMPLEMENTATION:
-                # combine max result tuples from all processes and distribute to all processes
-                max_tuples = Comm.allgather(max_value_state_policy_tuple)
-                # get tuple with "EVC max of maxes"
-                max_of_max_tuples = max(max_tuples, key=lambda max_tuple: max_tuple[0])
-                # get EVC_max, state values and allocation policy associated with "max of maxes"
-                controller.EVC_max = max_of_max_tuples[0]
-                controller.EVC_max_state_values = max_of_max_tuples[1]
-                controller.EVC_max_policy = max_of_max_tuples[2]
-
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    controller.EVC_values = np.concatenate(Comm.allgather(EVC_values), axis=0)
-                    controller.EVC_policies = np.concatenate(Comm.allgather(EVC_policies), axis=0)
-            else:
-                controller.EVC_max = EVC_max
-                controller.EVC_max_state_values = EVC_max_state_values
-                controller.EVC_max_policy = EVC_max_policy
-                if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
-                    controller.EVC_values = EVC_values
-                    controller.EVC_policies = EVC_policies
-            # # TEST PRINT:
-            # import re
-            # print("\nFINAL:\n\tmax tuple:\n\t\tEVC_max: {}\n\t\tEVC_max_state_values: {}\n\t\tEVC_max_policy: {}".
-            #       format(re.sub('[\[,\],\n]','',str(max_value_state_policy_tuple[0])),
-            #              re.sub('[\[,\],\n]','',str(max_value_state_policy_tuple[1])),
-            #              re.sub('[\[,\],\n]','',str(max_value_state_policy_tuple[2]))),
-            #       flush=True)
-
-            # FROM MIKE ANDERSON (ALTERNTATIVE TO allgather:  REDUCE USING A FUNCTION OVER LOCAL VERSION)
-            # a = np.random.random()
-            # mymax=Comm.allreduce(a, MPI.MAX)
-            # print(mymax)
+                sample += 1
+                EVCs.append(value_function.function(controller=controller,
+                                                    outcome=state_values,
+                                                    costs=costs,
+                                                    context=context)[0])
+            EVC_values[:] = [float(EVC) for EVC in EVCs]
+            # Use last of any policies with the maximum EVC (as for the evaluation of one policy at a time above)
+            max_index = len(EVC_values) - 1 - np.argmax(EVC_values[::-1])
+            EVC_max = EVCs[max_index]
+            EVC_max_state_values = simulated_state_values[max_index]
+            EVC_max_policy = controller.controlSignalSearchSpace[start + max_index]
+            max_value_state_policy_tuple = (EVC_max, EVC_max_state_values, EVC_max_policy)
+
+        # Save values and policies, for all of the policies or only the max_saved_policies with the greatest EVC
+        if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
+            saved_indices = _saved_policy_indices(EVC_values, controller.paramsCurrent[MAX_SAVED_POLICIES])
+            EVC_values = EVC_values[saved_indices]
+            EVC_policies = controller.controlSignalSearchSpace[start + saved_indices]
+
+        #endregion
+
+        # Aggregate, reduce and assign global results
+
+        if MPI_IMPLEMENTATION:
+            # combine max result tuples from all processes and distribute to all processes
+            max_tuples = Comm.allgather(max_value_state_policy_tuple)
+            # get tuple with "EVC max of maxes"
+            max_of_max_tuples = max(max_tuples, key=lambda max_tuple: max_tuple[0])
+            # get EVC_max, state values and allocation policy associated with "max of maxes"
+            controller.EVC_max = max_of_max_tuples[0]
+            controller.EVC_max_state_values = max_of_max_tuples[1]
+            controller.EVC_max_policy = max_of_max_tuples[2]
+
+            if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
+                EVC_values = np.concatenate(Comm.allgather(EVC_values), axis=0)
+                EVC_policies = np.concatenate(Comm.allgather(EVC_policies), axis=0)
+                saved_indices = _saved_policy_indices(EVC_values, controller.paramsCurrent[MAX_SAVED_POLICIES])
+                controller.EVC_values = EVC_values[saved_indices]
+                controller.EVC_policies = EVC_policies[saved_indices]
+        else:
+            controller.EVC_max = EVC_max
+            controller.EVC_max_state_values = EVC_max_state_values
+            controller.EVC_max_policy = EVC_max_policy
+            if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
+                controller.EVC_values = EVC_values
+                controller.EVC_policies = EVC_policies
+        # # TEST PRINT:
+        # import re
+        # print("\nFINAL:\n\tmax tuple:\n\t\tEVC_max: {}\n\t\tEVC_max_state_values: {}\n\t\tEVC_max_policy: {}".
+        #       format(re.sub('[\[,\],\n]','',str(max_value_state_policy_tuple[0])),
+        #              re.sub('[\[,\],\n]','',str(max_value_state_policy_tuple[1])),
+        #              re.sub('[\[,\],\n]','',str(max_value_state_policy_tuple[2]))),
+        #       flush=True)
+
+        # FROM MIKE ANDERSON (ALTERNTATIVE TO allgather:  REDUCE USING A FUNCTION OVER LOCAL VERSION)
+        # a = np.random.random()
+        # mymax=Comm.allreduce(a, MPI.MAX)
+        # print(mymax)
 
         if controller.prefs.reportOutputPref:
             print("\nEVC simulation completed")
@@ -342,43 +496,317 @@ class ControlSignalGridSearch(EVCAuxiliaryFunction):
 
         # -----------------------------------------------------------------
 
-        #region ASSIGN CONTROL SIGNAL VALUES
+        # TEST PRINT:
+        # print ("\nEND OF TRIAL 1 EVC outputState: {0}\n".format(controller.outputState.value))
+
+        return _assign_EVC_max_policy(controller)
+
+
+class EVCOptimizer(EVCAuxiliaryFunction):
+    """Base class for functions that search for the allocation_policy with the maximum EVC without simulating every
+    policy in controlSignalSearchSpace
+
+    Subclasses implement _search, which simulates policies using a _PolicyEvaluator (that keeps track of the one with
+    the maximum EVC).  The search starts again with each execution of the EVCMechanism, and ends early if the EVC_max
+    increases by less than tolerance in an iteration (as defined by the subclass), or after max_iterations iterations
+    (if it is not None).  The results are assigned to the same attributes of the EVCMechanism as by
+    ControlSignalGridSearch (EVC_max, EVC_max_state_values, EVC_max_policy, and EVC_values and EVC_policies for the
+    policies simulated, if save_all_values_and_policies is True), and the allocation_policy is returned.
+
+    IMPLEMENTATION NOTE:  the policies are simulated one at a time, in the order determined by the search, so they are
+        not run in parallel processes if PY_MULTIPROCESSING is True (and are run in full by each process if
+        MPI_IMPLEMENTATION is True).  Since the cost of a ControlSignal can depend on its previous intensity, the EVC
+        of a policy can differ from the one computed for it by ControlSignalGridSearch.
+    """
+
+    componentName = kwEVCOptimizerFunction
+
+    paramClassDefaults = EVCAuxiliaryFunction.paramClassDefaults.copy()
+    paramClassDefaults.update({TOLERANCE: 0.0,
+                               MAX_ITERATIONS: None})
+
+    def __init__(self,
+                 variable_default=None,
+                 tolerance=0.0,
+                 max_iterations=None,
+                 params=None,
+                 function=None,
+                 owner=None,
+                 context=None):
+        params = self._assign_args_to_param_dicts(tolerance=tolerance,
+                                                  max_iterations=max_iterations,
+                                                  params=params)
+        function = function or self.function
+        super().__init__(function=function,
+                         params=params,
+                         owner=owner,
+                         context=self.componentName+INITIALIZING)
+
+    def function(self, **kwargs):
+        """Search for the allocation_policy with the maximum EVC, assign the results to the controller, and return it
 
-        # Assign allocations to controlSignals for optimal allocation policy:
-        EVC_maxStateValue = iter(controller.EVC_max_state_values)
+        Return (2D np.array): allocation_policy for EVC_max
+        """
 
-        # Assign max values for optimal allocation policy to controller.inputStates (for reference only)
-        for i in range(len(controller.inputStates)):
-            controller.inputStates[list(controller.inputStates.keys())[i]].value = np.atleast_1d(next(EVC_maxStateValue))
+        context = kwargs[CONTEXT]
 
+        if INITIALIZING in context:
+            return defaultControlAllocation
+
+        try:
+            controller = kwargs[CONTROLLER]
+        except KeyError:
+            from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCMechanism import EVCError
+            raise EVCError("Call to {}() missing controller argument".format(self.__class__.__name__))
+        runtime_params = kwargs.get(PARAMS)
+        time_scale = kwargs.get(TIME_SCALE, TimeScale.TRIAL)
+
+        # Reset context so that System knows this is a simulation (to avoid infinitely recursive loop)
+        context = ExecutionContext.from_string(context).for_simulation(controller)
 
-        # Report EVC max info
         if controller.prefs.reportOutputPref:
-            print ("\nMaximum EVC for {0}: {1}".format(controller.system.name, float(controller.EVC_max)))
-            print ("ControlProjection allocation(s) for maximum EVC:")
-            for i in range(len(controller.controlSignals)):
-                print("\t{0}: {1}".format(controller.controlSignals[i].name,
-                                        controller.EVC_max_policy[i]))
-            print()
+            print("\n{0} evaluating EVC for {1} (one dot for each sample): ".
+                  format(controller.name, controller.system.name))
+
+        evaluator = _PolicyEvaluator(controller, runtime_params, time_scale, context)
+        self._search(evaluator,
+                     tolerance=self.paramsCurrent[TOLERANCE],
+                     max_iterations=self.paramsCurrent[MAX_ITERATIONS])
+
+        controller.EVC_max = evaluator.EVC_max
+        controller.EVC_max_state_values = evaluator.EVC_max_state_values
+        controller.EVC_max_policy = evaluator.EVC_max_policy
+        if controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES]:
+            EVC_values = np.array([float(EVC) for EVC in evaluator.EVCs.values()])
+            EVC_policies = np.array([evaluator.policy(indices) for indices in evaluator.EVCs])
+            saved_indices = _saved_policy_indices(EVC_values, controller.paramsCurrent[MAX_SAVED_POLICIES])
+            controller.EVC_values = EVC_values[saved_indices]
+            controller.EVC_policies = EVC_policies[saved_indices]
 
-        #endregion
+        if controller.prefs.reportOutputPref:
+            print("\nEVC simulation completed ({} of {} samples)".
+                  format(len(evaluator.EVCs), len(controller.controlSignalSearchSpace)))
 
-        # TEST PRINT:
-        # print ("\nEND OF TRIAL 1 EVC outputState: {0}\n".format(controller.outputState.value))
+        return _assign_EVC_max_policy(controller)
 
-        #region ASSIGN AND RETURN allocation_policy
-        # Convert EVC_max_policy into 2d array with one controlSignal allocation per item,
-        #     assign to controller.allocation_policy, and return (where it will be assigned to controller.value).
-        #     (note:  the conversion is to be consistent with use of controller.value for assignments to controlSignals.value)
-        controller.allocation_policy = np.array(controller.EVC_max_policy).reshape(len(controller.EVC_max_policy), -1)
-        return controller.allocation_policy
-        #endregion
+    def _search(self, evaluator, tolerance, max_iterations):
+        """Simulate policies using evaluator.evaluate until the one with the maximum EVC has been found
+
+        Must be implemented by subclasses.
+        """
+        from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCMechanism import EVCError
+        raise EVCError("{} class must implement _search".format(self.__class__.__name__))
+
+
+class ControlSignalCoordinateAscent(EVCOptimizer):
+    """Search for the allocation_policy with the maximum EVC by varying the allocation of one ControlSignal at a time
+
+    Starting from the middle sample of each ControlSignal, each iteration evaluates every one of the allocation_samples
+    of each ControlSignal in turn, with the others held at their allocation in the policy with the maximum EVC so far
+    (which is updated after each ControlSignal).  The search ends when an iteration does not change the policy with
+    the maximum EVC, or increases EVC_max by less than tolerance.  Each iteration simulates at most the sum (rather
+    than the product) of the number of allocation_samples of the ControlSignals.  The policy found is optimal if the
+    EVC is a unimodal function of each ControlSignal's allocation, and of their combinations.
+    """
+
+    componentName = kwControlSignalCoordinateAscentFunction
+
+    paramClassDefaults = EVCOptimizer.paramClassDefaults.copy()
+
+    def _search(self, evaluator, tolerance, max_iterations):
+        evaluator.evaluate([(len(samples) - 1) // 2 for samples in evaluator.samples])
+        iteration = 0
+        while max_iterations is None or iteration < max_iterations:
+            iteration += 1
+            previous_EVC_max = float(evaluator.EVC_max)
+            previous_indices = evaluator.EVC_max_indices
+            for i, samples in enumerate(evaluator.samples):
+                indices = list(evaluator.EVC_max_indices)
+                for sample_index in range(len(samples)):
+                    indices[i] = sample_index
+                    evaluator.evaluate(indices)
+            if (evaluator.EVC_max_indices == previous_indices or
+                    float(evaluator.EVC_max) - previous_EVC_max < tolerance):
+                break
+
+
+class ControlSignalGridRefinement(EVCOptimizer):
+    """Search for the allocation_policy with the maximum EVC using a coarse grid, refined around the best policy
+
+    The search starts with a grid of (about) coarse_samples evenly spaced allocation_samples for each ControlSignal.
+    Each iteration then evaluates the policies that differ from the one with the maximum EVC so far by a step (of the
+    current spacing of the grid, in allocation_samples) up or down in the allocation of one ControlSignal.  If that
+    does not change the policy with the maximum EVC, or increases EVC_max by less than tolerance, the spacing is
+    halved;  the search ends when that happens at a spacing of one sample.
+    """
+
+    componentName = kwControlSignalGridRefinementFunction
+
+    paramClassDefaults = EVCOptimizer.paramClassDefaults.copy()
+    paramClassDefaults.update({COARSE_SAMPLES: 3})
+
+    def __init__(self,
+                 variable_default=None,
+                 tolerance=0.0,
+                 max_iterations=None,
+                 coarse_samples=3,
+                 params=None,
+                 function=None,
+                 owner=None,
+                 context=None):
+        params = self._assign_args_to_param_dicts(coarse_samples=coarse_samples,
+                                                  params=params)
+        super().__init__(variable_default=variable_default,
+                         tolerance=tolerance,
+                         max_iterations=max_iterations,
+                         params=params,
+                         function=function,
+                         owner=owner,
+                         context=context)
+
+    def _validate_params(self, request_set, target_set=None, context=None):
+        super()._validate_params(request_set=request_set, target_set=target_set, context=context)
+        if COARSE_SAMPLES in target_set and target_set[COARSE_SAMPLES] < 2:
+            from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCMechanism import EVCError
+            raise EVCError("{} param for {} ({}) must be at least 2".
+                           format(COARSE_SAMPLES, self.__class__.__name__, target_set[COARSE_SAMPLES]))
+
+    def _search(self, evaluator, tolerance, max_iterations):
+        coarse_samples = self.paramsCurrent[COARSE_SAMPLES]
+        steps = [max(1, int(np.ceil((len(samples) - 1) / (coarse_samples - 1)))) for samples in evaluator.samples]
+
+        # Evaluate the coarse grid
+        coarse_indices = [sorted(set(range(0, len(samples), step)) | {len(samples) - 1})
+                          for samples, step in zip(evaluator.samples, steps)]
+        for indices in product(*coarse_indices):
+            evaluator.evaluate(indices)
+
+        # Refine around the policy with the maximum EVC
+        iteration = 0
+        while max_iterations is None or iteration < max_iterations:
+            iteration += 1
+            previous_EVC_max = float(evaluator.EVC_max)
+            previous_indices = evaluator.EVC_max_indices
+            for i, samples in enumerate(evaluator.samples):
+                for sample_index in (previous_indices[i] - steps[i], previous_indices[i] + steps[i]):
+                    if 0 <= sample_index < len(samples):
+                        indices = list(previous_indices)
+                        indices[i] = sample_index
+                        evaluator.evaluate(indices)
+            if (evaluator.EVC_max_indices == previous_indices or
+                    float(evaluator.EVC_max) - previous_EVC_max < tolerance):
+                if max(steps) == 1:
+                    break
+                steps = [max(1, step // 2) for step in steps]
+
+
+class ControlSignalGoldenSectionSearch(EVCOptimizer):
+    """Search for the allocation with the maximum EVC for a single ControlSignal using golden-section search
+
+    Each iteration evaluates the allocation_samples at two points in the interval that brackets the maximum (initially
+    all of them), that divide it in the golden ratio, and narrows the interval to the part on the side of the one with
+    the greater EVC.  The search ends when the interval contains at most three samples (all of which are then
+    evaluated), or the EVCs at the two points differ by less than tolerance.  It simulates a number of policies that
+    is logarithmic in the number of allocation_samples, and finds the maximum if the EVC is a unimodal function of
+    the allocation (in the order of allocation_samples).
+    """
+
+    componentName = kwControlSignalGoldenSectionSearchFunction
+
+    paramClassDefaults = EVCOptimizer.paramClassDefaults.copy()
+
+    def _search(self, evaluator, tolerance, max_iterations):
+        if len(evaluator.samples) != 1:
+            from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCMechanism import EVCError
+            raise EVCError("{} can only be used for an EVCMechanism with a single ControlSignal ({} has {})".
+                           format(self.__class__.__name__, evaluator.controller.name, len(evaluator.samples)))
+        ratio = (np.sqrt(5) - 1) / 2
+        low = 0
+        high = len(evaluator.samples[0]) - 1
+        iteration = 0
+        while high - low > 2 and (max_iterations is None or iteration < max_iterations):
+            iteration += 1
+            step = int(round(ratio * (high - low)))
+            lower = min(high - step, high - 2)
+            upper = max(low + step, lower + 1)
+            lower_EVC = float(evaluator.evaluate([lower]))
+            upper_EVC = float(evaluator.evaluate([upper]))
+            if abs(upper_EVC - lower_EVC) < tolerance:
+                return
+            if lower_EVC >= upper_EVC:
+                high = upper
+            else:
+                low = lower
+        for sample_index in range(low, high + 1):
+            evaluator.evaluate([sample_index])
+
+
+class _PolicyEvaluator(object):
+    """Simulate allocation policies for an EVC search, and keep track of the one with the maximum EVC
+
+    Policies are specified by the index of an allocation sample for each ControlSignal (in the samples of its
+    controlSignalSearchSpace);  each is simulated only once, and its EVC is saved in EVCs (in the order they are
+    simulated).  Of any policies with equal EVCs, the one that comes last in controlSignalSearchSpace is kept, as by
+    ControlSignalGridSearch, so that the result does not depend on the order in which they are simulated.  EVC_max
+    is the value returned for it by the controller's value_function, as for ControlSignalGridSearch.
+    """
+
+    def __init__(self, controller, runtime_params, time_scale, context):
+        self.controller = controller
+        self.runtime_params = runtime_params
+        self.time_scale = time_scale
+        self.context = context
+        self.search_space = controller.controlSignalSearchSpace
+        self.samples = self.search_space.samples
+        self.dtype = self.search_space.dtype
+        self.EVCs = OrderedDict()
+        self.EVC_max = float('-Infinity')
+        self.EVC_max_indices = None
+        self._EVC_max_position = None
+        self.EVC_max_policy = None
+        self.EVC_max_state_values = None
+
+    def policy(self, indices):
+        """Return the allocation policy for the sample indices (one for each ControlSignal)
+        """
+        return np.array([samples[i] for samples, i in zip(self.samples, indices)], dtype=self.dtype)
+
+    def evaluate(self, indices):
+        """Return the EVC of the policy for the sample indices, simulating it if it has not already been
+        """
+        indices = tuple(int(i) for i in indices)
+        try:
+            return self.EVCs[indices]
+        except KeyError:
+            pass
+
+        controller = self.controller
+        if controller.prefs.reportOutputPref:
+            print(kwProgressBarChar, end='', flush=True)
+
+        allocation_vector = self.policy(indices)
+        EVC, outcome, cost = _compute_EVC(args=(controller, allocation_vector,
+                                                self.runtime_params,
+                                                self.time_scale,
+                                                self.context))
+        self.EVCs[indices] = EVC
+
+        # Keep track of the policy with the maximum EVC (the last in the search space, of any with equal EVCs)
+        position = self.search_space._encode(indices)
+        if (self.EVC_max_indices is None or
+                (float(EVC), position) > (float(self.EVC_max), self._EVC_max_position)):
+            self.EVC_max = EVC
+            self.EVC_max_indices = indices
+            self._EVC_max_position = position
+            self.EVC_max_policy = allocation_vector
+            # Note: inputValue is copied, since it is updated in place by each simulation
+            self.EVC_max_state_values = deepcopy(controller.inputValue)
+
+        return EVC
 
 def _compute_EVC(args):
     """compute EVC for a specified allocation policy
 
-    IMPLEMENTATION NOTE:  implemented as a function so it can be used with multiprocessing Pool
-
     Args:
         ctlr (EVCMechanism)
         allocation_vector (1D np.array): allocation policy for which to compute EVC
@@ -404,9 +832,205 @@ def _compute_EVC(args):
                                                               costs=ctlr.controlSignalCosts,
                                                               context=context)
 
+    return (EVC_current)
+
+
+def _assign_EVC_max_policy(controller):
+    """Assign the values for controller.EVC_max_policy to its inputStates, and return it as its allocation_policy
 
-    if PY_MULTIPROCESSING:
-        return
+    Called by ControlSignalGridSearch and EVCOptimizer, after they have assigned EVC_max, EVC_max_state_values and
+        EVC_max_policy.
 
+    Return (2D np.array): allocation_policy for EVC_max
+    """
+
+    #region ASSIGN CONTROL SIGNAL VALUES
+
+    # Assign allocations to controlSignals for optimal allocation policy:
+    EVC_maxStateValue = iter(controller.EVC_max_state_values)
+
+    # Assign max values for optimal allocation policy to controller.inputStates (for reference only)
+    for i in range(len(controller.inputStates)):
+        controller.inputStates[list(controller.inputStates.keys())[i]].value = np.atleast_1d(next(EVC_maxStateValue))
+
+
+    # Report EVC max info
+    if controller.prefs.reportOutputPref:
+        print ("\nMaximum EVC for {0}: {1}".format(controller.system.name, float(controller.EVC_max)))
+        print ("ControlProjection allocation(s) for maximum EVC:")
+        for i in range(len(controller.controlSignals)):
+            print("\t{0}: {1}".format(controller.controlSignals[i].name,
+                                    controller.EVC_max_policy[i]))
+        print()
+
+    #endregion
+
+    #region ASSIGN AND RETURN allocation_policy
+    # Convert EVC_max_policy into 2d array with one controlSignal allocation per item,
+    #     assign to controller.allocation_policy, and return (where it will be assigned to controller.value).
+    #     (note:  the conversion is to be consistent with use of controller.value for assignments to controlSignals.value)
+    controller.allocation_policy = np.array(controller.EVC_max_policy).reshape(len(controller.EVC_max_policy), -1)
+    return controller.allocation_policy
+    #endregion
+
+
+def _saved_policy_indices(EVC_values, max_saved_policies):
+    """Return the indices of the policies to save: all of them (in order), or the max_saved_policies with the
+    greatest values in EVC_values (in descending order of EVC, and in order of the search space for equal values)
+    """
+    if max_saved_policies is None:
+        return np.arange(len(EVC_values))
+    return np.argsort(-EVC_values, kind='mergesort')[:max_saved_policies]
+
+
+def _supports_batch_simulation(controller):
+    """Return True if the simulations for controller can be run all at once (see EVCMechanism.run_batch_simulation)
+    """
+    from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCMechanism import EVCError
+    try:
+        controller._validate_batch_simulation(controller.predictedInput)
+    except EVCError:
+        return False
+    return True
+
+
+def _num_simulation_processes(num_policies):
+    """Return the number of processes in which to run the simulations for num_policies allocation policies
+    """
+    return min(PY_MULTIPROCESSING_PROCESSES or multiprocessing.cpu_count(), num_policies)
+
+
+def _simulate_in_processes(controller, start, end, runtime_params, time_scale, context):
+    """run simulations for the allocation policies in controlSignalSearchSpace[start:end] in parallel processes
+
+    IMPLEMENTATION NOTE:  the processes are forked for each execution of the controller, so that each has a replica of
+        the system in its current state (including the state of its mechanisms and of the controller), without any of
+        it having to be pickled (which fails for lambda functions) or kept in sync between executions;  each process
+        simulates a contiguous chunk of the policies (all at once if the system supports it;  see
+        EVCMechanism.run_batch_simulation), and returns the outcome and the ControlSignal costs for each in
+        shared-memory arrays.  The first chunk is simulated in this process, while the forked ones simulate the others.
+
+    The cost of a ControlSignal can depend on the policies that precede the one being simulated:  its adjustment_cost
+        depends on its intensity for the previous policy, and its duration_cost integrates its cost over all of them.
+        Each process therefore first implements (without simulating) the policy that precedes its chunk or, if any
+        ControlSignal has a duration_cost, all of the policies that precede its chunk;  and after the simulations,
+        this process implements the policies that follow its chunk in the same way, so that the ControlSignals are left
+        in the state they would have after the serial search (the mechanisms of the system, and its results, reflect
+        only the simulations of the first chunk).  The results are the same as for the serial search, as long as the
+        outcome of a simulation does not depend on the ones that preceded it (e.g., by way of random noise, or the
+        state of an integrator).
+
+    Only the replay of the policies for a duration_cost is serial, so that (without one) the time for the simulations
+        is divided by the number of processes, plus the time to fork them (a few ms each);  with one, the process
+        that simulates the last chunk implements (P-1)/P of the policies before simulating its own 1/P of them (where
+        P is the number of processes), as does this process after simulating the first chunk.  The speedup requires
+        as many CPUs as processes:  with fewer, the processes share them, and the search is slower than in a single
+        process (see "EVC Parallel Grid Search Benchmark Script.py").
+
+    Args:
+        controller (EVCMechanism)
+        start, end (int): range of policies in controller.controlSignalSearchSpace to simulate
+        runtime_params (dict): runtime params passed to controller.run_simulation
+        time_scale (TimeScale): time_scale passed to controller.run_simulation
+        context (value): context passed to controller.run_simulation
+
+    Returns (list, 3d np.array):
+        (state_values, costs), with one item per policy:  the value of controller.inputValue after its simulation,
+        and the value of controller.controlSignalCosts
+    """
+
+    from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCMechanism \
+        import EVCError, ControlSignalCostOptions
+
+    try:
+        fork_context = multiprocessing.get_context('fork')
+    except ValueError:
+        raise EVCError("PY_MULTIPROCESSING requires the 'fork' start method for processes, "
+                       "which is not available on this platform")
+
+    search_space = controller.controlSignalSearchSpace
+    num_policies = end - start
+    num_processes = _num_simulation_processes(num_policies)
+    chunk_size = (num_policies + num_processes - 1) // num_processes
+    batch_simulation = BATCH_SIMULATION and _supports_batch_simulation(controller)
+    duration_cost = any(control_signal.controlSignalCostOptions & ControlSignalCostOptions.DURATION_COST
+                        for control_signal in controller.controlSignals)
+
+    input_shapes = [np.shape(value) for value in controller.inputValue]
+    input_splits = np.cumsum([int(np.prod(shape)) for shape in input_shapes])
+    costs_shape = np.shape(controller.controlSignalCosts)
+
+    shared_outcomes = fork_context.RawArray('d', num_policies * int(input_splits[-1]))
+    shared_costs = fork_context.RawArray('d', num_policies * int(np.prod(costs_shape)))
+    outcomes = np.frombuffer(shared_outcomes).reshape(num_policies, -1)
+    costs = np.frombuffer(shared_costs).reshape(num_policies, -1)
+
+    def get_policies(policies_start, policies_end):
+        return (allocation_vector
+                for policies in search_space.chunks(start + policies_start, start + policies_end)
+                for allocation_vector in policies)
+
+    def implement_policies(policies_start, policies_end):
+        # Bring the ControlSignals to the state they would have after the policies in [policies_start, policies_end)
+        #    (only the last of them matters unless a ControlSignal has a duration_cost;  see above)
+        if not duration_cost:
+            policies_start = max(policies_start, policies_end - 1)
+        for allocation_vector in get_policies(policies_start, policies_end):
+            controller._implement_allocation_vector(allocation_vector=allocation_vector,
+                                                    runtime_params=runtime_params,
+                                                    time_scale=time_scale,
+                                                    context=context)
+
+    def simulate_chunk(chunk_start, chunk_end):
+        implement_policies(0, chunk_start)
+        if batch_simulation:
+            state_values, chunk_costs = controller.run_batch_simulation(inputs=controller.predictedInput,
+                                                                        allocation_policies=get_policies(chunk_start,
+                                                                                                         chunk_end),
+                                                                        runtime_params=runtime_params,
+                                                                        time_scale=time_scale,
+                                                                        context=context)
+            for i, (state_value, policy_costs) in enumerate(zip(state_values, chunk_costs), chunk_start):
+                outcomes[i] = np.concatenate([np.ravel(value) for value in state_value])
+                costs[i] = np.ravel(policy_costs)
+            return
+        for i, allocation_vector in enumerate(get_policies(chunk_start, chunk_end), chunk_start):
+            controller.run_simulation(inputs=controller.predictedInput,
+                                      allocation_vector=allocation_vector,
+                                      runtime_params=runtime_params,
+                                      time_scale=time_scale,
+                                      context=context)
+            outcomes[i] = np.concatenate([np.ravel(value) for value in controller.inputValue])
+            costs[i] = np.ravel(controller.controlSignalCosts)
+
+    # Simulate the first chunk in this process and the others in forked processes,
+    #    and then leave the ControlSignals in the state they would have after the serial search
+    chunks = [(chunk_start, min(chunk_start + chunk_size, num_policies))
+              for chunk_start in range(0, num_policies, chunk_size)]
+    processes = [fork_context.Process(target=simulate_chunk, args=chunk) for chunk in chunks[1:]]
+    for process in processes:
+        process.start()
+
+    try:
+        simulate_chunk(*chunks[0])
+    finally:
+        for process in processes:
+            process.join()
+
+    if any(process.exitcode for process in processes):
+        raise EVCError("Simulation of allocation policies for {} failed in {} of {} processes".
+                       format(controller.name, len([p for p in processes if p.exitcode]), len(processes)))
+
+    implement_policies(chunks[0][1], num_policies)
+
+    # Assign the outcomes to values in the same format as controller.inputValue
+    outcomes = outcomes.copy()
+    if isinstance(controller.inputValue, np.ndarray) and controller.inputValue.dtype != object:
+        state_values = list(outcomes.reshape((num_policies,) + controller.inputValue.shape))
     else:
-        return (EVC_current)
+        state_values = [[value.reshape(shape) for value, shape in zip(np.split(outcome, input_splits[:-1]),
+                                                                      input_shapes)]
+                        for outcome in outcomes]
+    costs = costs.reshape((num_policies,) + costs_shape).copy()
+
+    return state_values, costs
@@ -94,7 +94,27 @@ number of ControlSignals in the EVCMechanism's `controlSignals` attribute, using
 value of each ControlSignal). The default function is `ControlSignalGridSearch`, which evaluates the performance of the
 system under a range of specified allocationPolicies, and returns the `allocation_policy` that generates the best
 performance (the greatest EVC). This evaluation and selection procedure, including the four evaluation functions that it
-uses (all of which are customizable), is described below.
+uses (all of which are customizable), is described below.  Since it simulates every combination of the
+`allocation_samples` of the ControlSignals, the number of simulations grows with the product of their number of samples.
+The following functions (in EVCAuxiliary) can be used instead, to search for the `allocation_policy` with the greatest
+EVC by simulating only some of those combinations (using the same `value_function`, and assigning the same attributes):
+
+* `ControlSignalCoordinateAscent` -- varies the allocation of one ControlSignal at a time, with the others held at the
+  best policy found so far, until doing so no longer improves the EVC;  each iteration simulates at most the sum of
+  the number of `allocation_samples` of the ControlSignals.
+..
+* `ControlSignalGridRefinement` -- simulates a coarse grid of the `allocation_samples` (specified by its
+  **coarse_samples** argument), and then refines the search around the best policy found so far, by steps of
+  decreasing size in the allocation of each ControlSignal.
+..
+* `ControlSignalGoldenSectionSearch` -- for an EVCMechanism with a single ControlSignal, uses golden-section search
+  to find the maximum of the EVC over its `allocation_samples` (assuming it has a single peak);  the number of
+  simulations is logarithmic in the number of `allocation_samples`.
+
+Each of these ends the search early if an iteration improves the EVC by less than its **tolerance** argument, or after
+the number of iterations specified by its **max_iterations** argument.  Since they do not evaluate every policy, they
+are not guaranteed to find the one with the greatest EVC (unless the EVC changes smoothly with the allocation of each
+ControlSignal).
 
 .. _EVC_Calculation:
 
@@ -250,7 +270,8 @@ following steps:
       aggregated cost from the aggregated outcome.
 
 If the `save_all_values_and_policies` attribute is `True`, the allocation policy is saved in the
-EVCMechanism's `EVC_policies` attribute, and its value is saved in the `EVC_values` attribute. The
+EVCMechanism's `EVC_policies` attribute, and its value is saved in the `EVC_values` attribute (if `max_saved_policies`
+is specified, only that number of the policies with the greatest EVC are saved). The
 `function <EVCMechanism.function>` returns the allocation_policy that yielded the maximum EVC. This is then
 implemented by assigning the `allocation` specified for each ControlSignal by the designated allocation_policy.
 These allocations determine the value of the parameters being controlled in the next round of the system's execution.
@@ -289,8 +310,11 @@ Class Reference
 ---------------
 
 """
+from collections import OrderedDict
+from copy import deepcopy
+
 from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCAuxiliary import \
-    ControlSignalGridSearch, ValueFunction
+    ControlSignalGridSearch, ControlSignalSearchSpace, ValueFunction
 
 from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.ControlMechanism import *
 from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.IntegratorMechanism import IntegratorMechanism
@@ -360,6 +384,7 @@ class EVCMechanism(ControlMechanism_Base):
     cost_function=LinearCombination(operation=SUM),                    \
     combine_outcome_and_cost_function=LinearCombination(operation=SUM) \
     save_all_values_and_policies:bool=:keyword:`False`,                \
+    max_saved_policies=None,                                           \
     params=None,                                                       \
     name=None,                                                         \
     prefs=None)
@@ -452,6 +477,11 @@ class EVCMechanism(ControlMechanism_Base):
         when it is :keyword:`True`, saves all of the control allocation policies tested in `EVC_policies` and their
         values in `EVC_values`.
 
+    max_saved_policies : int : default None
+        specifies the number of allocation policies saved when `save_all_values_and_policies` is :keyword:`True`;
+        if it is specified, only that number of the policies with the greatest EVC are saved (see
+        `max_saved_policies <EVCMechanism.max_saved_policies>`).
+
     params : Optional[Dict[param keyword, param value]]
         a `parameter dictionary <ParameterState_Specifying_Parameters>` that can be used to specify the parameters for
         the mechanism, its function, and/or a custom function and its parameters.  Values specified
@@ -543,7 +573,9 @@ class EVCMechanism(ControlMechanism_Base):
         combinations of the `allocation_samples` of its ControlSignals (and contained in its
         `controlSignalSearchSpace` attribute), by executing the system (using `run_simulation`) for each
         combination, evaluating the result using `value_function`, and returning the allocation_policy that generated
-        the highest value.  If a custom function is specified, it must accommodate a :keyword:`controller` argument that
+        the highest value.  `ControlSignalCoordinateAscent`, `ControlSignalGridRefinement` and
+        `ControlSignalGoldenSectionSearch` search for that policy by simulating only some of those combinations.
+        If a custom function is specified, it must accommodate a :keyword:`controller` argument that
         specifies an EVCMechanism (and provides access to its attributes, including `controlSignalSearchSpace`),
         and must return an array with the same format (number and type of elements) as the EVCMechanism's
         `allocation_policy` attribute.
@@ -649,10 +681,11 @@ class EVCMechanism(ControlMechanism_Base):
         :keyword:`outcome` argument that is a 1d array with the outcome of the current `allocation_policy`; and a
         :keyword:`cost` argument that is 1d array with the cost of the current `allocation_policy`.
 
-    controlSignalSearchSpace : 2d np.array
-        an array that contains arrays of allocation policies.  Each allocation policy contains one value for each of
-        the mechanism's ControlSignals.  By default, it is assigned a set of all possible allocation policies
-        (using np.meshgrid to construct all permutations of ControlSignal values).
+    controlSignalSearchSpace : ControlSignalSearchSpace
+        the set of allocation policies, each of which contains one value for each of the mechanism's ControlSignals.
+        By default, it is assigned a set of all possible allocation policies (all permutations of ControlSignal
+        values).  Policies are generated as they are needed, rather than stored;  it can be indexed like a 2d
+        np.array, with one allocation policy in each row, and converted to one using np.array.
 
     EVC_max : 1d np.array with single value
         the maximum EVC value over all allocation policies in `controlSignalSearchSpace`.
@@ -669,6 +702,11 @@ class EVCMechanism(ControlMechanism_Base):
         If it is specified, each policy tested in the `controlSignalSearchSpace` is saved in `EVC_policies` and their
         values are saved in `EVC_values`.
 
+    max_saved_policies : int or None
+        if it is not `None`, only the specified number of policies with the greatest EVC are saved in `EVC_policies`
+        (in descending order of EVC), and their values in `EVC_values`, when `save_all_values_and_policies` is
+        :keyword:`True`.
+
     EVC_policies : 2d np.array
         array of allocation policies tested in `controlSignalSearchSpace`.  The values of each are stored in
         `EVC_values`.
@@ -714,6 +752,7 @@ class EVCMechanism(ControlMechanism_Base):
                  combine_outcome_and_cost_function=LinearCombination(operation=SUM,
                                                                      context=componentType+FUNCTION),
                  save_all_values_and_policies:bool=False,
+                 max_saved_policies:tc.optional(int)=None,
                  params=None,
                  name=None,
                  prefs:is_pref_set=None,
@@ -732,6 +771,7 @@ class EVCMechanism(ControlMechanism_Base):
                                               cost_function=cost_function,
                                               combine_outcome_and_cost_function=combine_outcome_and_cost_function,
                                               save_all_values_and_policies=save_all_values_and_policies,
+                                              max_saved_policies=max_saved_policies,
                                               params=params)
 
         super(EVCMechanism, self).__init__(# default_input_value=default_input_value,
@@ -1267,8 +1307,9 @@ class EVCMechanism(ControlMechanism_Base):
         Update prediction mechanisms
         Construct controlSignalSearchSpace (from allocation_samples of each item in controlSignals):
             * get `allocation_samples` for each ControlSignal in `controlSignals`
-            * construct `controlSignalSearchSpace`: a 2D np.array of control allocation policies, each policy of which
-              is a different combination of values, one from the `allocation_samples` of each ControlSignal.
+            * construct `controlSignalSearchSpace`: a ControlSignalSearchSpace of control allocation policies, each
+              policy of which is a different combination of values, one from the `allocation_samples` of each
+              ControlSignal (unless they are the same as for the existing one).
         Call self.function -- default is ControlSignalGridSearch
         Return an allocation_policy
         """
@@ -1278,20 +1319,19 @@ class EVCMechanism(ControlMechanism_Base):
 
         #region CONSTRUCT SEARCH SPACE
         control_signal_sample_lists = []
-        control_signals = self.controlSignals
 
         # Get allocation_samples for all ControlSignals
-        num_control_signals = len(control_signals)
-
         for control_signal in self.controlSignals:
             control_signal_sample_lists.append(control_signal.allocation_samples)
 
         # Construct controlSignalSearchSpace:  set of all permutations of ControlProjection allocations
         #                                     (one sample from the allocationSample of each ControlProjection)
-        # Reference for implementation below:
-        # http://stackoverflow.com/questions/1208118/using-numpy-to-build-an-array-of-all-combinations-of-two-arrays
-        self.controlSignalSearchSpace = \
-            np.array(np.meshgrid(*control_signal_sample_lists)).T.reshape(-1,num_control_signals)
+        # Note: policies are enumerated as they are needed (see ControlSignalSearchSpace), and the search space is
+        #       only constructed again if the allocation_samples have changed since the last execution
+        search_space = getattr(self, 'controlSignalSearchSpace', None)
+        if not (isinstance(search_space, ControlSignalSearchSpace) and
+                search_space.has_samples(control_signal_sample_lists)):
+            self.controlSignalSearchSpace = ControlSignalSearchSpace(control_signal_sample_lists)
         #endregion
 
         allocation_policy = self.function(controller=self,
@@ -1374,16 +1414,10 @@ class EVCMechanism(ControlMechanism_Base):
 
         """
 
-        if self.value is None:
-            # Initialize value if it is None
-            self.value = self.allocation_policy
-
-        # Implement the current allocation_policy over ControlSignals (outputStates),
-        #    by assigning allocation values to EVCMechanism.value, and then calling _update_output_states
-        for i in range(len(self.controlSignals)):
-            # self.controlSignals[list(self.controlSignals.values())[i]].value = np.atleast_1d(allocation_vector[i])
-            self.value[i] = np.atleast_1d(allocation_vector[i])
-        self._update_output_states(runtime_params=runtime_params, time_scale=time_scale,context=context)
+        self._implement_allocation_vector(allocation_vector=allocation_vector,
+                                          runtime_params=runtime_params,
+                                          time_scale=time_scale,
+                                          context=context)
 
         # Execute simulation run of system for the current allocation_policy
         sim_clock = Clock('EVC SIMULATION CLOCK')
@@ -1397,8 +1431,145 @@ class EVCMechanism(ControlMechanism_Base):
         self._update_input_states(runtime_params=runtime_params, time_scale=time_scale,context=context)
 
         # Get cost of each controlSignal
+        # Note: controlSignalCosts is overwritten (rather than appended to) by each simulation
+        for i in range(len(self.controlSignals)):
+            self.controlSignalCosts[i] = self.controlSignals[i].cost
+
+    def run_batch_simulation(self,
+                             inputs,
+                             allocation_policies,
+                             runtime_params=None,
+                             time_scale=TimeScale.TRIAL,
+                             context=None):
+        """
+        Run simulations of `system <System>` for a sequence of allocation policies at once.
+
+        Gives the same results as calling `run_simulation` for each of the policies in turn, but executes each
+        mechanism of the system only once for all of them (as for a `batch <Run.run>` run of the system), with the
+        values of the parameters controlled by the EVCMechanism for each policy.  This requires that the
+        system can be executed in batch mode for a single set of inputs (see `_validate_batch_simulation`).
+
+        Arguments
+        ----------
+
+        inputs : List[input] or ndarray(input) : default default_input_value
+            the inputs used for the simulations (see `run_simulation`);  these must be for a single execution.
+
+        allocation_policies : Iterable[1D np.array]
+            the allocation policies to simulate (see `run_simulation`).
+
+        runtime_params : Optional[Dict[str, Dict[str, Dict[str, value]]]]
+            see `run_simulation`.
+
+        time_scale :  TimeScale : default TimeScale.TRIAL
+            see `run_simulation`.
+
+        Returns
+        -------
+
+        (list, np.array) :  the value of `inputValue` and of `controlSignalCosts` for each policy, as they are after a
+        call to `run_simulation` for it.
+
+        """
+
+        from PsyNeuLink.Globals.Run import _construct_stimulus_sets, _validate_stimuli
+
+        inputs = _validate_stimuli(self.system, _construct_stimulus_sets(self.system, inputs), context=context)
+
+        # Implement each allocation_policy over ControlSignals in turn (since their costs can depend on the previous
+        #    ones), and get their costs and the value of each parameterState they control
+        parameter_values = OrderedDict((state, []) for state in self._get_controlled_parameter_states())
+        costs = []
+        for allocation_vector in allocation_policies:
+            self._implement_allocation_vector(allocation_vector=allocation_vector,
+                                              runtime_params=runtime_params,
+                                              time_scale=time_scale,
+                                              context=context)
+            for i in range(len(self.controlSignals)):
+                self.controlSignalCosts[i] = self.controlSignals[i].cost
+            costs.append(self.controlSignalCosts.copy())
+            for state, values in parameter_values.items():
+                state.update(params=runtime_params, time_scale=time_scale, context=context)
+                values.append(np.array(state.value))
+        num_policies = len(costs)
+
+        # Execute system once for all of the allocation policies
+        state_values = {}
+        self.system.results.extend(self.system._execute_batch(inputs=inputs,
+                                                              num_executions=num_policies,
+                                                              parameter_values=parameter_values,
+                                                              state_values=state_values,
+                                                              time_scale=time_scale,
+                                                              context=context))
+
+        # Get outcomes for each allocation_policy from the values of the monitored outputStates
+        self.system._execute_mechanism_for_each_trial(self.monitoring_mechanism,
+                                                      num_policies,
+                                                      state_values,
+                                                      context=EVC_SIMULATION)
+        outcomes = []
+        for value in state_values[self.monitoring_mechanism.outputState]:
+            self.monitoring_mechanism.outputState.value = value
+            self._update_input_states(runtime_params=runtime_params, time_scale=time_scale, context=context)
+            # Note: inputValue is copied, since it is updated in place
+            outcomes.append(deepcopy(self.inputValue))
+
+        return outcomes, np.array(costs)
+
+    def _validate_batch_simulation(self, inputs):
+        """Raise EVCError if the system can't be simulated by run_batch_simulation for inputs
+        """
+        from PsyNeuLink.Globals.Run import _construct_stimulus_sets
+
+        if np.shape(_construct_stimulus_sets(self.system, inputs))[0] != 1:
+            raise EVCError("Batch simulation of {} is only supported for the input to a single execution".
+                           format(self.system.name))
+        try:
+            self.system._validate_batch_execution(parameter_states=self._get_controlled_parameter_states())
+        except SystemError as error:
+            raise EVCError(error)
+        if len(self.monitoring_mechanism.outputStates) != 1:
+            raise EVCError("Batch simulation of {} is not supported since {} has more than one outputState".
+                           format(self.system.name, self.monitoring_mechanism.name))
+        for input_state in self.monitoring_mechanism.inputStates.values():
+            for projection in input_state.receivesFromProjections:
+                if not projection.sender.owner in self.system.execution_graph_mechs:
+                    raise EVCError("Batch simulation of {} is not supported since {} monitors {}, "
+                                   "which is not in the system".
+                                   format(self.system.name, self.monitoring_mechanism.name, projection.sender.name))
+        if self.monitoring_mechanism._stochastic and any(mechanism._stochastic
+                                                         for mechanism in self.system.execution_graph_mechs):
+            raise EVCError("Batch simulation of {} is not supported since {} and another mechanism sample "
+                           "random values".format(self.system.name, self.monitoring_mechanism.name))
+
+    def _get_controlled_parameter_states(self):
+        """Return the parameterStates that receive ControlProjections from the EVCMechanism's ControlSignals
+        """
+        parameter_states = []
         for control_signal in self.controlSignals:
-            self.controlSignalCosts = np.append(self.controlSignalCosts, np.atleast_2d(control_signal.cost),axis=0)
+            for projection in control_signal.sendsToProjections:
+                if not projection.receiver in parameter_states:
+                    parameter_states.append(projection.receiver)
+        return parameter_states
+
+    def _implement_allocation_vector(self, allocation_vector, runtime_params=None, time_scale=TimeScale.TRIAL,
+                                     context=None):
+        """Implement allocation_vector over ControlSignals, without running a simulation
+
+        Called by run_simulation;  also used by ControlSignalGridSearch to bring the ControlSignals (and their costs)
+            to the state they would have after a sequence of simulations that were run in other processes.
+        """
+
+        if self.value is None:
+            # Initialize value if it is None
+            self.value = self.allocation_policy
+
+        # Implement the current allocation_policy over ControlSignals (outputStates),
+        #    by assigning allocation values to EVCMechanism.value, and then calling _update_output_states
+        for i in range(len(self.controlSignals)):
+            # self.controlSignals[list(self.controlSignals.values())[i]].value = np.atleast_1d(allocation_vector[i])
+            self.value[i] = np.atleast_1d(allocation_vector[i])
+        self._update_output_states(runtime_params=runtime_params, time_scale=time_scale,context=context)
 
     # The following implementation of function attributes as properties insures that even if user sets the value of a
     #    function directly (i.e., without using assign_params), it will still be wrapped as a UserDefinedFunction.
@@ -381,6 +381,32 @@ its states (inputStates, parameterStates and/or outputStates); those dictionarie
 entries for the values of the runtime parameters for the function, a state, or its projection(s) (see the
 `runtime_params` argument of the `execute <Mechanism_Base.execute>` method below for more details).
 
+.. _Mechanism_Memoization:
+
+Memoization
+~~~~~~~~~~~
+
+A mechanism that receives the same input on many executions (for example, a unit that represents a constant task
+demand, or a prediction mechanism that has reached a steady state) can be made to reuse its previous result, by
+specifying :keyword:`True` for the **memoize** argument of its constructor (for mechanisms that support it, such as
+the `TransferMechanism`), or by setting its `memoize <Mechanism_Base.memoize>` attribute to `True`.  When it is
+executed as part of a process or system (without runtime parameters), the mechanism's `function
+<Mechanism_Base.function>` is then called only if its `variable <Mechanism_Base.variable>`, the value of any of its
+`parameterStates <Mechanism_ParameterStates>`, or the value of any numeric parameter of the mechanism or its function
+(including ones assigned directly, e.g., ``my_mechanism.function_object.gain = 5.0``) has changed since its last
+execution;  otherwise its `value <Mechanism_Base.value>` and the values of its `outputStates <Mechanism_OutputStates>`
+are left as they are.  This propagates to mechanisms that receive projections from it:  if all of the mechanisms that
+project to a mechanism that is memoized have reused their values, and the matrices of those projections have not
+changed, then the projections (e.g., the matrix multiplications of `MappingProjections <MappingProjection>`) are not
+executed either, and its `variable <Mechanism_Base.variable>` is left as it is.
+
+.. note::
+   Memoization should be used only for mechanisms whose result is fully determined by their variable and parameters.
+   It is never used by mechanisms that integrate their input over time_steps (i.e., with a `time_scale
+   <Mechanism_Base.time_scale>` of `TimeScale.TIME_STEP`, or an `Integrator` function), and a mechanism that is
+   stochastic (e.g., the `DDM`, which samples its decision variable) cannot be memoized:  setting its `memoize
+   <Mechanism_Base.memoize>` attribute to `True` generates an error.
+
 
 .. _Mechanism_Class_Reference:
 
@@ -674,6 +700,11 @@ class Mechanism_Base(Mechanism):
                    (i.e., it does not implement self.execute) and it returns a value with len > 1
                    it MUST also specify kwFunctionOutputStateValueMapping.
 
+    memoize : bool : default False
+        determines whether the mechanism reuses its `value <Mechanism_Base.value>` when its variable and parameters
+        are unchanged since its last execution (see `Mechanism_Memoization`);  it cannot be `True` for a
+        stochastic mechanism (such as the `DDM`).
+
     phaseSpec : int or float :  default 0
         determines the time_step(s) at which the mechanism is executed as part of a system
         (see :ref:`Process_Mechanisms` for specification, and :ref:`System Phase <System_Execution_Phase>`
@@ -747,6 +778,23 @@ class Mechanism_Base(Mechanism):
     variableEncodingDim = 2
     valueEncodingDim = 2
 
+    # Used to identify the parameterStates that must be updated on each execution (see _get_parameter_states_to_update)
+    _parameter_states_signature = None
+    _modulated_parameter_states = None
+    _runtime_params_in_parameter_states = False
+    # (shape, dtype) of value on first execution, if it is a 2d np.array (see execute)
+    _value_format = None
+
+    # Used for memoization (see Mechanism_Memoization)
+    _memoize = False
+    # Mechanisms for which the value is not determined by their variable and parameters cannot be memoized
+    _stochastic = False
+    _memo_variable = None
+    _memo_parameter_values = None
+    _memo_param_values = None
+    _memo_sender_values = None
+    _memo_matrices = None
+
     # Category specific defaults:
     paramClassDefaults = Component.paramClassDefaults.copy()
     paramClassDefaults.update({
@@ -793,7 +841,8 @@ class Mechanism_Base(Mechanism):
 
 # IMPLEMENT **args (PER State)
 
-        self._execution_id = None
+        # System or Process from which the mechanism gets its _execution_id (see Run._assign_execution_owner)
+        self._execution_owner = None
 
         # Register with MechanismRegistry or create one
         if not context is kwValidate:
@@ -1361,7 +1410,7 @@ class Mechanism_Base(Mechanism):
 
         #region VALIDATE RUNTIME PARAMETER SETS
         # Insure that param set is for a States:
-        if self.prefs.paramValidationPref:
+        if not self._fast_execution and self.prefs.paramValidationPref:
             if runtime_params:
                 # runtime_params can have entries with any of these keys
                 #     (each of which should be for a params dictionary for the corresponding state type)
@@ -1381,9 +1430,16 @@ class Mechanism_Base(Mechanism):
                         target_set=runtime_params)
         #endregion
 
+        # Memoization can be used only when executing or simulating a process or system without runtime_params
+        memoize = (self.memoize and input is None and not runtime_params and not INITIALIZING in context and
+                   (EXECUTING in context or EVC_SIMULATION in context))
+
         #region UPDATE INPUT STATE(S)
         # Executing or simulating process or system, get input by updating inputStates
-        if input is None and (EXECUTING in context or EVC_SIMULATION in context):
+        # (unless memoizing and the values of all of the senders of their projections are unchanged)
+        if memoize and self._input_states_unchanged():
+            pass
+        elif input is None and (EXECUTING in context or EVC_SIMULATION in context):
             self._update_input_states(runtime_params=runtime_params, time_scale=time_scale, context=context)
 
         # Direct call to execute mechanism with specified input, so assign input to mechanism's inputStates
@@ -1401,75 +1457,106 @@ class Mechanism_Base(Mechanism):
         self._update_parameter_states(runtime_params=runtime_params, time_scale=time_scale, context=context)
         #endregion
 
-        #region CALL SUBCLASS _execute method AND ASSIGN RESULT TO self.value
-
-        # # MODIFIED 2/23/17 OLD:
-        # self.value = self._execute(variable=self.inputValue,
-        # MODIFIED 2/23/17 NEW:
-        self.value = self._execute(variable=self.variable,
-        # MODIFIED 2/23/17 END
-                                      runtime_params=runtime_params,
-                                      clock=clock,
-                                      time_scale=time_scale,
-                                      context=context)
-
-        # MODIFIED 1/28/17 NEW:
-        # # context = context + ' ' + ASSIGN_VALUE
-        # context = EXECUTING + ' ' + self.name + ASSIGN_VALUE
-        # MODIFIED 1/28/17 END
-
-
-        # # MODIFIED 3/3/17 OLD:
-        # self.value = np.atleast_2d(self.value)
-        # # MODIFIED 3/3/17 NEW:
-        # converted_to_2d = np.atleast_2d(self.value)
-        # # If self.value is a list of heterogenous elements, leave as is;
-        # # Otherwise, use converted value (which is a genuine 2d array)
-        # if converted_to_2d.dtype != object:
-        #     self.value = converted_to_2d
-        # MODIFIED 3/8/17 NEWER:
-        # IMPLEMENTATION NOTE:  THIS IS HERE BECAUSE IF return_value IS A LIST, AND THE LENGTH OF ALL OF ITS
-        #                       ELEMENTS ALONG ALL DIMENSIONS ARE EQUAL (E.G., A 2X2 MATRIX PAIRED WITH AN
-        #                       ARRAY OF LENGTH 2), np.array (AS WELL AS np.atleast_2d) GENERATES A ValueError
-        if (isinstance(self.value, list) and
-            (all(isinstance(item, np.ndarray) for item in self.value) and
-                all(
-                        all(item.shape[i]==self.value[0].shape[0]
-                            for i in range(len(item.shape)))
-                        for item in self.value))):
-                # return self.value
-                pass
+        # If memoizing and the mechanism's variable and parameter values are the same as on its last execution,
+        #    then its value and the values of its outputStates are too, so skip to report
+        if memoize and self._memoized_value_is_current():
+            self.status = self.value
+
         else:
-            converted_to_2d = np.atleast_2d(self.value)
-            # If return_value is a list of heterogenous elements, return as is
-            #     (satisfies requirement that return_value be an array of possibly multidimensional values)
-            if converted_to_2d.dtype == object:
-                # return self.value
+            #region CALL SUBCLASS _execute method AND ASSIGN RESULT TO self.value
+
+            # # MODIFIED 2/23/17 OLD:
+            # self.value = self._execute(variable=self.inputValue,
+            # MODIFIED 2/23/17 NEW:
+            self.value = self._execute(variable=self.variable,
+            # MODIFIED 2/23/17 END
+                                          runtime_params=runtime_params,
+                                          clock=clock,
+                                          time_scale=time_scale,
+                                          context=context)
+
+            # MODIFIED 1/28/17 NEW:
+            # # context = context + ' ' + ASSIGN_VALUE
+            # context = EXECUTING + ' ' + self.name + ASSIGN_VALUE
+            # MODIFIED 1/28/17 END
+
+
+            # # MODIFIED 3/3/17 OLD:
+            # self.value = np.atleast_2d(self.value)
+            # # MODIFIED 3/3/17 NEW:
+            # converted_to_2d = np.atleast_2d(self.value)
+            # # If self.value is a list of heterogenous elements, leave as is;
+            # # Otherwise, use converted value (which is a genuine 2d array)
+            # if converted_to_2d.dtype != object:
+            #     self.value = converted_to_2d
+            # MODIFIED 3/8/17 NEWER:
+            # If self.value has the same shape and type as on the first execution (a 2d np.array),
+            #    or is a 1d np.array that matches the single row of one (as returned by most mechanisms with one outputState),
+            #    then it is already in (or can simply be reshaped to) the required format, so skip the checks below
+            if self._value_format is not None and type(self.value) is np.ndarray:
+                value_shape, value_dtype = self._value_format
+                value_matches_format = self.value.dtype == value_dtype and self.value.shape == value_shape
+                row_matches_format = (self.value.dtype == value_dtype and
+                                      value_shape[0] == 1 and self.value.shape == value_shape[1:])
+            else:
+                value_matches_format = row_matches_format = False
+
+            if value_matches_format:
                 pass
-            # Otherwise, return value converted to 2d np.array
+            elif row_matches_format:
+                self.value = self.value.reshape(value_shape)
             else:
-                # return converted_to_2d
-                self.value = converted_to_2d
-        # MODIFIED 3/3/17 END
+                # IMPLEMENTATION NOTE:  THIS IS HERE BECAUSE IF return_value IS A LIST, AND THE LENGTH OF ALL OF ITS
+                #                       ELEMENTS ALONG ALL DIMENSIONS ARE EQUAL (E.G., A 2X2 MATRIX PAIRED WITH AN
+                #                       ARRAY OF LENGTH 2), np.array (AS WELL AS np.atleast_2d) GENERATES A ValueError
+                if (isinstance(self.value, list) and
+                    (all(isinstance(item, np.ndarray) for item in self.value) and
+                        all(
+                                all(item.shape[i]==self.value[0].shape[0]
+                                    for i in range(len(item.shape)))
+                                for item in self.value))):
+                        # return self.value
+                        pass
+                else:
+                    converted_to_2d = np.atleast_2d(self.value)
+                    # If return_value is a list of heterogenous elements, return as is
+                    #     (satisfies requirement that return_value be an array of possibly multidimensional values)
+                    if converted_to_2d.dtype == object:
+                        # return self.value
+                        pass
+                    # Otherwise, return value converted to 2d np.array
+                    else:
+                        # return converted_to_2d
+                        self.value = converted_to_2d
+                # MODIFIED 3/3/17 END
 
-        # Set status based on whether self.value has changed
-        self.status = self.value
+                # Record format of value on first execution, for use in the checks above
+                if (self._value_format is None and
+                        isinstance(self.value, np.ndarray) and self.value.ndim == 2 and self.value.dtype != object):
+                    self._value_format = (self.value.shape, self.value.dtype)
 
-        #endregion
+            # Set status based on whether self.value has changed
+            self.status = self.value
 
+            #endregion
 
-        #region UPDATE OUTPUT STATE(S)
-        self._update_output_states(runtime_params=runtime_params, time_scale=time_scale, context=context)
-        #endregion
+
+            #region UPDATE OUTPUT STATE(S)
+            self._update_output_states(runtime_params=runtime_params, time_scale=time_scale, context=context)
+            #endregion
+
+            # Record variable and parameter values used for this execution (or clear them if not memoizing)
+            self._record_memoized_execution(memoize)
 
         #region REPORT EXECUTION
-        if self.prefs.reportOutputPref and context and EXECUTING in context:
+        if not self._fast_execution and self.prefs.reportOutputPref and context and EXECUTING in context:
             self._report_mechanism_execution(self.inputValue, self.user_params, self.outputState.value)
         #endregion
 
         #region RE-SET STATE_VALUES AFTER INITIALIZATION
         # If this is (the end of) an initialization run, restore state values to initial condition
         if '_init_' in context:
+            self._record_memoized_execution(False)
             for state in self.inputStates:
                 self.inputStates[state].value = self.inputStates[state].variable
             for state in self.parameterStates:
@@ -1544,8 +1631,7 @@ class Mechanism_Base(Mechanism):
                 raise SystemError("Number of inputs ({0}) to {1} does not match "
                                   "its number of inputStates ({2})".
                                   format(num_inputs, self.name,  num_input_states ))
-        for i in range(num_input_states):
-            input_state = list(self.inputStates.values())[i]
+        for i, input_state in enumerate(self.inputStates.values()):
             # input_item = np.ndarray(input[i])
             input_item = input[i]
             if len(input_state.variable) == len(input_item):
@@ -1566,15 +1652,16 @@ class Mechanism_Base(Mechanism):
         Aggregate results (using inputState execute method)
         Update inputState.value
         """
-        for i in range(len(self.inputStates)):
-            state_name, state = list(self.inputStates.items())[i]
+        for i, state in enumerate(self.inputStates.values()):
             state.update(params=runtime_params, time_scale=time_scale, context=context)
             self.inputValue[i] = state.value
+        # IMPLEMENTATION NOTE:  a new array is assigned on each execution (rather than updating self.variable in place)
+        #                       since functions (e.g., Integrator) and the EVCMechanism may retain references to it
         self.variable = np.array(self.inputValue)
 
     def _update_parameter_states(self, runtime_params=None, time_scale=None, context=None):
 
-        for state_name, state in self.parameterStates.items():
+        for state_name, state in self._get_parameter_states_to_update(runtime_params):
 
             state.update(params=runtime_params, time_scale=time_scale, context=context)
 
@@ -1613,17 +1700,143 @@ class Mechanism_Base(Mechanism):
             #    to runtime param or paramsCurrent (per above)
             param[state_name] = type_match(state.value, param_type)
 
+    def _get_parameter_states_to_update(self, runtime_params=None):
+        """Return (name, parameterState) tuples for the parameterStates to be updated in the current execution
+
+        ParameterStates that do not receive any projections ("static" parameterStates) always assign their baseValue
+            to the parameter, so they are updated only when their values may need to be (re)assigned:  on the first
+            execution after the mechanism's parameterStates (or the projections they receive) have changed, and on any
+            execution for which runtime_params are specified (as well as the one after, to restore their values).
+        On all other executions, only parameterStates that receive projections ("modulated" parameterStates) are
+            updated.
+        """
+        signature = tuple((state_name, len(state.receivesFromProjections))
+                          for state_name, state in self.parameterStates.items())
+
+        if runtime_params or self._runtime_params_in_parameter_states or signature != self._parameter_states_signature:
+            self._parameter_states_signature = signature
+            self._modulated_parameter_states = [(state_name, state)
+                                                for state_name, state in self.parameterStates.items()
+                                                if state.receivesFromProjections]
+            self._runtime_params_in_parameter_states = bool(runtime_params)
+            return self.parameterStates.items()
+
+        return self._modulated_parameter_states
+
+    def _get_memo_sender_values(self):
+        """Return list of the values of the senders of all projections to the mechanism's inputStates
+
+        Returns None if any of the senders does not belong to a mechanism that executed in the same round
+            (i.e., has the same execution_id), or if any projection is subject to learning
+            (in which case the inputStates must be updated even if the values of the senders are unchanged)
+        """
+        sender_values = []
+        for input_state in self.inputStates.values():
+            for projection in input_state.receivesFromProjections:
+                sender_owner = projection.sender.owner
+                if (not isinstance(sender_owner, Mechanism_Base) or
+                        sender_owner._execution_id != self._execution_id or
+                        getattr(projection, 'learning_mechanism', None)):
+                    return None
+                sender_values.append(projection.sender.value)
+        return sender_values or None
+
+    def _get_memo_matrices(self):
+        """Return list of the matrices of the projections to the mechanism's inputStates (None for ones without one)
+        """
+        return [getattr(projection, MATRIX, None)
+                for input_state in self.inputStates.values()
+                for projection in input_state.receivesFromProjections]
+
+    def _get_memo_param_values(self):
+        """Return list of the values of the params of the mechanism and its function that are numbers, arrays or strings
+
+        These are compared in addition to the values of the parameterStates, since a param can be assigned directly
+            (e.g., <mechanism>.function_object.gain = 5.0) without being assigned to its parameterState
+            (see _get_parameter_states_to_update).  The first item is the function_object, compared by identity.
+        """
+        param_values = [self.function_object]
+        for owner in (self, self.function_object):
+            for param_name in owner.user_params:
+                value = getattr(owner, param_name, None)
+                if isinstance(value, (numbers.Number, np.ndarray, str)):
+                    # Copied, so that changes made in place are detected
+                    param_values.append(np.array(value))
+        return param_values
+
+    def _input_states_unchanged(self):
+        """Return True if the values of the inputStates are the same as when they were last updated
+
+        This is so if the values of all of their senders are the same objects as then (that is, the senders belong to
+            mechanisms that have reused their value;  see Mechanism_Memoization), and the matrices of the projections
+            from them are the same (whether they were assigned or changed in place).
+        """
+        if self._memo_sender_values is None:
+            return False
+        sender_values = self._get_memo_sender_values()
+        if (sender_values is None or
+                len(sender_values) != len(self._memo_sender_values) or
+                any(value is not memo_value for value, memo_value in zip(sender_values, self._memo_sender_values))):
+            return False
+        try:
+            return all(np.array_equal(matrix, memo_matrix)
+                       for matrix, memo_matrix in zip(self._get_memo_matrices(), self._memo_matrices))
+        # Values that can't be compared are treated as changed
+        except (ValueError, TypeError):
+            return False
+
+    def _memoized_value_is_current(self):
+        """Return True if variable, the values of the parameterStates, and the values of the params of the mechanism
+        and its function are the same as on the last execution
+        """
+        if self._memo_variable is None:
+            return False
+        param_values = self._get_memo_param_values()
+        if len(param_values) != len(self._memo_param_values) or param_values[0] is not self._memo_param_values[0]:
+            return False
+        try:
+            return (np.array_equal(self.variable, self._memo_variable) and
+                    all(np.array_equal(state.value, memo_value)
+                        for state, memo_value in zip(self.parameterStates.values(), self._memo_parameter_values)) and
+                    all(np.array_equal(value, memo_value)
+                        for value, memo_value in zip(param_values[1:], self._memo_param_values[1:])))
+        # Values that can't be compared are treated as changed
+        except (ValueError, TypeError):
+            return False
+
+    def _record_memoized_execution(self, memoize):
+        """Record the variable, parameter values and sender values used for the current execution
+
+        They are recorded only if memoize is True and the mechanism does not integrate over time_steps;
+            otherwise, any previously recorded values are cleared, so that the next execution is not memoized.
+        """
+        if memoize:
+            from PsyNeuLink.Components.Functions.Function import Integrator
+            memoize = (not getattr(self, 'time_scale', None) is TimeScale.TIME_STEP and
+                       not isinstance(self.function_object, Integrator))
+        if memoize:
+            self._memo_variable = self.variable
+            self._memo_parameter_values = [state.value for state in self.parameterStates.values()]
+            self._memo_param_values = self._get_memo_param_values()
+            self._memo_sender_values = self._get_memo_sender_values()
+            # Copied, so that changes made in place are detected
+            self._memo_matrices = [None if matrix is None else np.array(matrix)
+                                   for matrix in self._get_memo_matrices()]
+        elif self._memo_variable is not None:
+            self._memo_variable = self._memo_parameter_values = self._memo_param_values = None
+            self._memo_sender_values = self._memo_matrices = None
+
     def _update_output_states(self, runtime_params=None, time_scale=None, context=None):
         """Execute function for each outputState and assign result of each to corresponding item of self.outputValue
 
         """
-        for i in range(len(self.outputStates)):
-            state = list(self.outputStates.values())[i]
+        output_value = []
+        for state in self.outputStates.values():
             state.update(params=runtime_params, time_scale=time_scale, context=context)
-            # self.outputValue[i] = state.value
+            output_value.append(state.value)
 
         # Assign value of each outputState to corresponding item in self.outputValue
-        self.outputValue = list(state.value for state in list(self.outputStates.values()))
+        self.outputValue = output_value
 
 
     def initialize(self, value):
@@ -1656,6 +1869,27 @@ class Mechanism_Base(Mechanism):
                     context=None):
         return self.function(variable=variable, params=runtime_params, time_scale=time_scale, context=context)
 
+    def _validate_batch_execution(self, parameter_names=()):
+        """Raise MechanismError if the mechanism can't be executed by _execute_batch
+
+        parameter_names are the names of the mechanism's parameterStates that have a different value for each
+            execution (see _execute_batch).
+        Called by System._validate_batch_execution;  subclasses that support batch execution override this.
+        """
+        raise MechanismError("{} does not support batch execution".format(append_type_to_name(self)))
+
+    def _execute_batch(self, variable, parameter_values=None, context=None):
+        """Execute mechanism for a batch of inputs, and return the result for each
+
+        variable is a 2d array with the value of the primary inputState for each execution (one per row);
+            parameter_values is a dict with an array of values (one per execution) for any parameterStates that have
+            a different value for each execution, keyed by their names.  The array returned has an item for each
+            execution, in the format of the mechanism's value.
+        Called by System._execute_batch;  subclasses that support batch execution override this (along with
+            _validate_batch_execution).
+        """
+        raise MechanismError("{} does not support batch execution".format(append_type_to_name(self)))
+
     def _report_mechanism_execution(self, input=None, params=None, output=None):
 
         if input is None:
@@ -1786,6 +2020,24 @@ class Mechanism_Base(Mechanism):
         #     self.log.entries[self.name] = LogEntry(CurrentTime(), context, assignment)
         # # MODIFIED 1/28/17 END
 
+    @property
+    def _execution_id(self):
+        """Return the execution_id of the System or Process that most recently executed the mechanism"""
+        if self._execution_owner is None:
+            return None
+        return self._execution_owner._execution_id
+
+    @property
+    def memoize(self):
+        return self._memoize
+
+    @memoize.setter
+    def memoize(self, assignment):
+        if assignment and self._stochastic:
+            raise MechanismError("{} cannot be memoized, as {}s are stochastic (see Mechanism_Memoization)".
+                                 format(self.name, self.__class__.__name__))
+        self._memoize = assignment
+
     @property
     def status(self):
         return self._status
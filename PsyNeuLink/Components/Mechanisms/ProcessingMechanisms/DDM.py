@@ -474,6 +474,9 @@ class DDM(ProcessingMechanism_Base):
     # Assigned in __init__ to match default staring_point
     variableClassDefault = None
 
+    # The decision variable is sampled on each execution, so the DDM cannot be memoized (see Mechanism_Memoization)
+    _stochastic = True
+
     paramClassDefaults = Mechanism_Base.paramClassDefaults.copy()
     paramClassDefaults.update({
         TIME_SCALE: TimeScale.TRIAL,
@@ -765,6 +768,62 @@ class DDM(ProcessingMechanism_Base):
         else:
             raise MechanismError("time_scale not specified for DDM")
 
+    def _validate_batch_execution(self, parameter_names=()):
+        """Batch execution is only supported for the analytic solution of BogaczEtAl (TRIAL time scale)
+        """
+        if self.timeScale != TimeScale.TRIAL or not isinstance(self.function_object, BogaczEtAl):
+            raise MechanismError("{} only supports batch execution with time_scale = TimeScale.TRIAL and {} "
+                                 "as its function".format(append_type_to_name(self), BogaczEtAl.__name__))
+        for param_name in parameter_names:
+            if not param_name in {DRIFT_RATE, STARTING_POINT, THRESHOLD, NOISE, NON_DECISION_TIME}:
+                raise MechanismError("{} does not support batch execution with values of {} that differ across "
+                                     "executions".format(append_type_to_name(self), param_name))
+
+    def _execute_batch(self, variable, parameter_values=None, context=None):
+        """Execute DDM for each row of variable, computing the solutions for all of them at once
+
+        Returns the value for each execution, as _execute does;  the params of the function are the values of the
+            DDM's parameterStates, or of parameter_values for the executions (in a simulation run by a controller).
+        The decision variable is sampled for each execution in turn, so the samples are the same as for the
+            executions one at a time.
+        """
+
+        parameter_values = parameter_values or {}
+        num_executions = len(variable)
+
+        variable = np.array(variable, dtype=float)
+        variable[np.isnan(variable)] = np.ravel(self.variableInstanceDefault)[0]
+
+        def get_values(param_name):
+            try:
+                values = parameter_values[param_name]
+            except KeyError:
+                return np.full(num_executions, float(self.parameterStates[param_name].value))
+            return np.array([float(value) for value in values])
+
+        # - convolve inputState.value (signal) w/ driftRate param value (attentional contribution to the process)
+        drift_rate = np.ravel(variable) * get_values(DRIFT_RATE)
+        threshold = get_values(THRESHOLD)
+
+        rt, er = self.function_object.batch_function(variable,
+                                                     params={DRIFT_RATE:drift_rate,
+                                                             STARTING_POINT:get_values(STARTING_POINT),
+                                                             THRESHOLD:threshold,
+                                                             NOISE:get_values(NOISE),
+                                                             NON_DECISION_TIME:get_values(NON_DECISION_TIME)},
+                                                     context=context)
+
+        value = np.zeros((num_executions, 4, 1))
+        value[:, DDM_Output.RESPONSE_TIME.value, 0] = rt
+        value[:, DDM_Output.P_LOWER_MEAN.value, 0] = er
+        value[:, DDM_Output.P_UPPER_MEAN.value, 0] = 1 - er
+
+        # Convert ER to decision variable:
+        samples = np.array([random() for i in range(num_executions)])
+        value[:, DDM_Output.DECISION_VARIABLE.value, 0] = np.where(samples < er, -1 * threshold, threshold)
+
+        return value
+
     # def _out_update(self, particle, drift, noise, time_step_size, decay):
     #     ''' Single update for OU (special case l=0 is DDM)'''
     #     return particle + time_step_size * (decay * particle + drift) + random.normal(0, noise) * sqrt(time_step_size)
@@ -226,6 +226,22 @@ class IntegratorMechanism(ProcessingMechanism_Base):
 
         # IMPLEMENT: INITIALIZE LOG ENTRIES, NOW THAT ALL PARTS OF THE MECHANISM HAVE BEEN INSTANTIATED
 
+    def _validate_batch_execution(self, parameter_names=()):
+        """Batch execution is only supported for an Integrator function, with the same params for all executions
+        """
+        if not isinstance(self.function_object, self.Integrator):
+            raise MechanismError("{} only supports batch execution with {} as its function".
+                                 format(append_type_to_name(self), self.Integrator.__name__))
+        if parameter_names:
+            raise MechanismError("{} does not support batch execution with values of {} that differ across "
+                                 "executions".format(append_type_to_name(self), ", ".join(parameter_names)))
+
+    def _execute_batch(self, variable, parameter_values=None, context=None):
+        """Integrate each row of variable in turn and return the results (one per execution)
+        """
+        # Each item is integrated in the format of the mechanism's variable (a single inputState)
+        return self.function_object.batch_function(np.asarray(variable)[:, np.newaxis], context=context)
+
 
 
 
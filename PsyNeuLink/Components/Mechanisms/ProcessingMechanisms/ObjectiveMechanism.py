@@ -244,6 +244,7 @@ class ObjectiveMechanism(ProcessingMechanism_Base):
     names=None,                   \
     function=LinearCombination,   \
     role=None                     \
+    memoize=False,                \
     params=None,                  \
     name=None,                    \
     prefs=None)
@@ -304,6 +305,10 @@ class ObjectiveMechanism(ProcessingMechanism_Base):
     role: Optional[LEARNING, CONTROL]
         specifies if the ObjectiveMechanism is being used for learning or control (see `role` for details).
 
+    memoize : bool : default False
+        specifies whether the ObjectiveMechanism reuses its `value <ObjectiveMechanism.value>` when its variable and
+        parameters are unchanged since its last execution (see `memoize <Mechanism_Base.memoize>`).
+
     params : Optional[Dict[param keyword, param value]]
         a `parameter dictionary <ParameterState_Specifying_Parameters>` that can be used to specify the parameters for
         the mechanism, its function, and/or a custom function and its parameters. Values specified for parameters in
@@ -400,6 +405,7 @@ class ObjectiveMechanism(ProcessingMechanism_Base):
                  names:tc.optional(list)=None,
                  function=LinearCombination,
                  role:tc.optional(str)=None,
+                 memoize:bool=False,
                  params=None,
                  name=None,
                  prefs:is_pref_set=None,
@@ -423,6 +429,9 @@ class ObjectiveMechanism(ProcessingMechanism_Base):
                          prefs=prefs,
                          context=self)
 
+        # Not a param, so that it is not included in user_params (or reported with them)
+        self.memoize = memoize
+
         # IMPLEMENATION NOTE: THIS IS HERE UNTIL Composition IS IMPLEMENTED,
         # SO THAT SYSTEMS AND PROCESSES CAN FIND THE OBJECTIVE MECHANISSMS SERVING AS TARGETS
 
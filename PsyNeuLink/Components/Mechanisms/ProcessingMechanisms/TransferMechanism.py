@@ -148,6 +148,7 @@ class TransferMechanism(ProcessingMechanism_Base):
     time_constant=1.0,                    \
     range=(float:min, float:max),\
     time_scale=TimeScale.TRIAL,  \
+    memoize=False,               \
     params=None,                 \
     name=None,                   \
     prefs=None)
@@ -226,6 +227,10 @@ class TransferMechanism(ProcessingMechanism_Base):
         This must be set to `TimeScale.TIME_STEP` for the `time_constant <TransferMechanism.time_constant>`
         parameter to have an effect.
 
+    memoize : bool : default False
+        specifies whether the mechanism reuses its `value <TransferMechanism.value>` when its variable and
+        parameters are unchanged since its last execution (see `memoize <Mechanism_Base.memoize>`).
+
     name : str : default TransferMechanism-<index>
         a string used for the name of the mechanism.
         If not is specified, a default is assigned by `MechanismRegistry`
@@ -359,6 +364,7 @@ class TransferMechanism(ProcessingMechanism_Base):
                  time_constant=1.0,
                  range=np.array([]),
                  time_scale=TimeScale.TRIAL,
+                 memoize=False,
                  params=None,
                  name=None,
                  prefs:is_pref_set=None,
@@ -390,6 +396,9 @@ class TransferMechanism(ProcessingMechanism_Base):
                                        prefs=prefs,
                                        context=self)
 
+        # Not a param, so that it is not included in user_params (or reported with them)
+        self.memoize = memoize
+
     def _validate_params(self, request_set, target_set=None, context=None):
         """Validate FUNCTION and mechanism params
 
@@ -538,7 +547,11 @@ class TransferMechanism(ProcessingMechanism_Base):
         self.previous_input = current_input
 
         # Apply TransferMechanism function
-        output_vector = self.function(variable=current_input, params=runtime_params)
+        # (in fast execution mode, without checking arguments if no runtime params were specified)
+        if self._fast_execution and not runtime_params:
+            output_vector = self.function.__self__._fast(current_input, context=context)
+        else:
+            output_vector = self.function(variable=current_input, params=runtime_params)
 
         if list(range):
             minCapIndices = np.where(output_vector < range[0])
@@ -550,6 +563,34 @@ class TransferMechanism(ProcessingMechanism_Base):
 
         #endregion
 
+    def _validate_batch_execution(self, parameter_names=()):
+        """Batch execution is only supported for TimeScale.TRIAL (since integration over time_steps depends on
+        previous_input), and with the same params for all executions
+        """
+        if self.time_scale is not TimeScale.TRIAL:
+            raise MechanismError("{} does not support batch execution with time_scale = {}".
+                                 format(append_type_to_name(self), self.time_scale))
+        if parameter_names:
+            raise MechanismError("{} does not support batch execution with values of {} that differ across "
+                                 "executions".format(append_type_to_name(self), ", ".join(parameter_names)))
+
+    def _execute_batch(self, variable, parameter_values=None, context=None):
+        """Execute TransferMechanism function on each row of variable and return the results (one per execution)
+        """
+
+        current_input = variable + self.noise
+        self.previous_input = current_input[-1]
+
+        output = self.function_object.batch_function(current_input, context=context)
+
+        range = self.range
+        if list(range):
+            output[np.where(output < range[0])] = np.min(range)
+            output[np.where(output > range[1])] = np.max(range)
+
+        # The value of a TransferMechanism has a single item
+        return output[:, np.newaxis]
+
 
     def _report_mechanism_execution(self, input, params, output):
         """Override super to report previous_input rather than input, and selected params
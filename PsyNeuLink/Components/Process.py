@@ -336,6 +336,7 @@ from PsyNeuLink.Components.Projections.Projection import _is_projection_spec, _i
 from PsyNeuLink.Components.ShellClasses import *
 from PsyNeuLink.Components.States.ParameterState import ParameterState
 from PsyNeuLink.Components.States.State import _instantiate_state_list, _instantiate_state
+from PsyNeuLink.Globals.Context import ExecutionContext
 from PsyNeuLink.Globals.Registry import register_category
 
 # *****************************************    PROCESS CLASS    ********************************************************
@@ -848,6 +849,7 @@ class Process_Base(Process):
                                                   params=params)
 
         self._execution_id = None
+        self._execution_owner_assigned = False
         self.pathway = None
         # # MODIFIED 2/17/17 OLD:
         # self.input = None
@@ -2013,14 +2015,15 @@ class Process_Base(Process):
 
         if not context:
             context = EXECUTING + " " + PROCESS + " " + self.name
+        # Use ExecutionContext (rather than string) for context along the execution path
+        context = ExecutionContext.from_string(context, owner=self)
 
-        from PsyNeuLink.Globals.Run import _get_unique_id
+        from PsyNeuLink.Globals.Run import _get_unique_id, _assign_execution_owner
         self._execution_id = execution_id or _get_unique_id()
-        for mech in self.mechanisms:
-            mech._execution_id = self._execution_id
+        _assign_execution_owner(self, self.mechanisms)
 
         # Report output if reporting preference is on and this is not an initialization run
-        report_output = self.prefs.reportOutputPref and context and EXECUTING in context
+        report_output = not self._fast_execution and self.prefs.reportOutputPref and context and EXECUTING in context
 
 
         # FIX: CONSOLIDATE/REARRANGE _assign_input_values, _check_args, AND ASIGNMENT OF input TO self.variable
@@ -2179,11 +2182,13 @@ class Process_Base(Process):
             initialize=False,
             targets=None,
             learning=None,
+            learning_rate=None,
             call_before_trial=None,
             call_after_trial=None,
             call_before_time_step=None,
             call_after_time_step=None,
-            time_scale=None):
+            time_scale=None,
+            results='list'):
         """Run a sequence of executions
 
         COMMENT:
@@ -2214,6 +2219,10 @@ class Process_Base(Process):
             If it is not specified, current state is left intact.
             If :keyword:`True`, learning is forced on; if :keyword:`False`, learning is forced off.
 
+        learning_rate : float : default None
+            the learning_rate assigned to all of the LearningProjections in the process before the executions;  if it
+            is not specified, the process' `learning_rate <Process_Base.learning_rate>` is used.
+
         call_before_trial : Function : default None
             called before each trial in the sequence is executed.
 
@@ -2229,12 +2238,15 @@ class Process_Base(Process):
         time_scale : TimeScale :  default TimeScale.TRIAL
             specifies whether mechanisms are executed for a single `time_step or a trial <Run_Timing>`.
 
+        results : 'list', 'array', 'none' or ResultReducer : default 'list'
+            determines how the result of each execution is stored (see `Run_Results`).
+
         Returns
         -------
 
         <process>.results : List[outputState.value]
             list of the value of the outputState for each `TERMINAL` mechanism of the system returned for
-            each execution.
+            each execution (or, if **results** is not ``'list'``, the value described in `Run_Results`).
 
         """
         from PsyNeuLink.Globals.Run import run
@@ -2245,11 +2257,13 @@ class Process_Base(Process):
                    initialize=initialize,
                    targets=targets,
                    learning=learning,
+                   learning_rate=learning_rate,
                    call_before_trial=call_before_trial,
                    call_after_trial=call_after_trial,
                    call_before_time_step=call_before_time_step,
                    call_after_time_step=call_after_time_step,
-                   time_scale=time_scale)
+                   time_scale=time_scale,
+                   results=results)
     def _report_process_initiation(self, input=None, separator=False):
         """
         Parameters
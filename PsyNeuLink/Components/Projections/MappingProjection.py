@@ -484,6 +484,10 @@ class MappingProjection(Projection_Base):
             # # print("\n@@@ WEIGHTS CHANGED FOR {} TRIAL {}".format(self.name, CentralClock.trial))
 
 
+        # In fast execution mode, call function without checking arguments (if no runtime params were specified)
+        if self._fast_execution and not params:
+            return self.function.__self__._fast(self.sender.value, context=context)
+
         return self.function(self.sender.value, params=params, context=context)
 
     @property
@@ -530,6 +530,8 @@ class OutputState(State_Base):
 
         if not self.value:
             self.value = type_match(self.calculate(self.owner.value[self.index]), type(self.owner.value[self.index]))
+            if not self._fast_execution:
+                self._log_value(context)
 
 
 def _instantiate_output_states(owner, context=None):
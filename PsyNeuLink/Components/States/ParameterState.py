@@ -762,6 +762,10 @@ class ParameterState(State_Base):
     @value.setter
     def value(self, assignment):
         self._value = assignment
+
+    def _log_value(self, context=None):
+        # Values of parameterStates are not logged
+        pass
         # # MODIFIED 2/21/17 NEW:
         # # If this parameterState is for a parameter of its owner's function, then assign the value there as well
         # if self.name in self.owner.function_params:
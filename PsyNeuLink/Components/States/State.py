@@ -385,6 +385,8 @@ class State_Base(State):
 
         self.receivesFromProjections = []
         self.sendsToProjections = []
+        # Built from receivesFromProjections when it is first needed (see _get_projection_dispatch_table)
+        self._projection_dispatch_table = None
 
         # VALIDATE VARIABLE, PARAM_SPECS, AND INSTANTIATE self.function
         super(State_Base, self).__init__(variable_default=variable,
@@ -1124,6 +1126,43 @@ class State_Base(State):
 #
 
 
+    def _get_projection_dispatch_table(self):
+        """Return list of (projection, projection_type) tuples for the projections in receivesFromProjections
+
+        projection_type is MAPPING_PROJECTION, CONTROL_PROJECTION, LEARNING_PROJECTION or None (for any other type).
+        The table is built the first time it is needed, and rebuilt whenever the projections in receivesFromProjections
+            are not the ones (or in the same order as) in the table (i.e., projections have been added, removed or
+            replaced);  projections are compared by identity, since receivesFromProjections is a list that can be
+            modified in place.
+        """
+        dispatch_table = self._projection_dispatch_table
+        projections = self.receivesFromProjections
+        if (dispatch_table is None or len(dispatch_table) != len(projections) or
+                any(entry[0] is not projection for entry, projection in zip(dispatch_table, projections))):
+
+            from PsyNeuLink.Components.Projections.MappingProjection import MappingProjection
+            from PsyNeuLink.Components.Projections.ControlProjection import ControlProjection
+            from PsyNeuLink.Components.Projections.LearningProjection import LearningProjection
+
+            dispatch_table = []
+            for projection in projections:
+                if isinstance(projection, MappingProjection):
+                    projection_type = MAPPING_PROJECTION
+                elif isinstance(projection, ControlProjection):
+                    projection_type = CONTROL_PROJECTION
+                elif isinstance(projection, LearningProjection):
+                    projection_type = LEARNING_PROJECTION
+                else:
+                    projection_type = None
+                dispatch_table.append((projection, projection_type))
+            self._projection_dispatch_table = dispatch_table
+
+        return dispatch_table
+
+    def _owner_is_mapping_projection(self):
+        from PsyNeuLink.Components.Projections.MappingProjection import MappingProjection
+        return isinstance(self.owner, MappingProjection)
+
     def update(self, params=None, time_scale=TimeScale.TRIAL, context=None):
         """Update each projection, combine them, and assign result to value
 
@@ -1162,34 +1201,40 @@ class State_Base(State):
         #region AGGREGATE INPUT FROM PROJECTION_SPECS
 
         #region Get type-specific params from PROJECTION_PARAMS
-        mapping_params = merge_param_dicts(self.stateParams, MAPPING_PROJECTION_PARAMS, PROJECTION_PARAMS)
-        control_projection_params = merge_param_dicts(self.stateParams, CONTROL_PROJECTION_PARAMS, PROJECTION_PARAMS)
-        learning_projection_params = merge_param_dicts(self.stateParams, LEARNING_PROJECTION_PARAMS, PROJECTION_PARAMS)
+        # Note: merge_param_dicts returns None if there are no stateParams, so skip merging altogether in that case
+        if self.stateParams:
+            type_params = {
+                MAPPING_PROJECTION:
+                    merge_param_dicts(self.stateParams, MAPPING_PROJECTION_PARAMS, PROJECTION_PARAMS),
+                CONTROL_PROJECTION:
+                    merge_param_dicts(self.stateParams, CONTROL_PROJECTION_PARAMS, PROJECTION_PARAMS),
+                LEARNING_PROJECTION:
+                    merge_param_dicts(self.stateParams, LEARNING_PROJECTION_PARAMS, PROJECTION_PARAMS)}
         #endregion
 
         #region For each projection: get its params, pass them to it, and get the projection's value
         projection_value_list = []
 
-        for projection in self.receivesFromProjections:
+        from PsyNeuLink.Components.Process import ProcessInputState
 
-            from PsyNeuLink.Components.Process import ProcessInputState
-            from PsyNeuLink.Components.Projections.MappingProjection import MappingProjection
-            sender = projection.sender
+        # MODIFIED 2/19/17 NEW:
+        # Only update if sender has also executed in this round (i.e., has matching execution_id)
+        if isinstance(self.owner, (Mechanism, Process)):
+            execution_id = self.owner._execution_id
+        elif self.receivesFromProjections and self._owner_is_mapping_projection():
+            execution_id = self.owner.sender.owner._execution_id
+        elif self.receivesFromProjections:
+            raise StateError("PROGRAM ERROR: Object ({}) of type {} has a {}, but this is only allowed for "
+                             "Mechanisms and MappingProjections".
+                             format(self.owner.name, self.owner.__class__.__name__, self.__class__.__name__,))
+        # MODIFIED 2/19/17 END
 
-            # MODIFIED 2/19/17 NEW:
-            # Only update if sender has also executed in this round (i.e., has matching execution_id)
-            if isinstance(self.owner, (Mechanism, Process)):
-                if sender.owner._execution_id != self.owner._execution_id:
-                    continue
-            elif isinstance(self.owner, MappingProjection):
-                if sender.owner._execution_id != self.owner.sender.owner._execution_id:
-                    continue
-            else:
-                raise StateError("PROGRAM ERROR: Object ({}) of type {} has a {}, but this is only allowed for "
-                                 "Mechanisms and MappingProjections".
-                                 format(self.owner.name, self.owner.__class__.__name__, self.__class__.__name__,))
+        for projection, projection_type in self._get_projection_dispatch_table():
 
-            # MODIFIED 2/19/17 END
+            sender = projection.sender
+
+            if sender.owner._execution_id != execution_id:
+                continue
 
             # FIX: FOR EACH PROJECTION TO INPUT_STATE, CHECK IF SENDER IS FROM PROCESS INPUT OR TARGET INPUT
             # FIX: IF SO, ONLY INCLUDE IF THEY BELONG TO CURRENT PROCESS;
@@ -1197,24 +1242,18 @@ class State_Base(State):
                 if not sender.owner in self.owner.processes.keys():
                     continue
 
-            from PsyNeuLink.Components.Projections.MappingProjection import MappingProjection
-            from PsyNeuLink.Components.Projections.ControlProjection import ControlProjection
-            from PsyNeuLink.Components.Projections.LearningProjection import LearningProjection
-
             # Merge with relevant projection type-specific params
-            if isinstance(projection, MappingProjection):
-                projection_params = merge_param_dicts(self.stateParams, projection.name, mapping_params, )
-            elif isinstance(projection, ControlProjection):
-                projection_params = merge_param_dicts(self.stateParams, projection.name, control_projection_params)
-            elif isinstance(projection, LearningProjection):
-                projection_params = merge_param_dicts(self.stateParams, projection.name, learning_projection_params)
-            if not projection_params:
+            if self.stateParams and projection_type in type_params:
+                projection_params = merge_param_dicts(self.stateParams,
+                                                      projection.name,
+                                                      type_params[projection_type]) or None
+            else:
                 projection_params = None
 
             # MODIFIED 2/21/17 OLD:
             # Update LearningSignals only if context == LEARNING;  otherwise, just get current value
             # Note: done here rather than in its own method in order to exploit parsing of params above
-            if isinstance(projection, LearningProjection):
+            if projection_type is LEARNING_PROJECTION:
                 if LEARNING in context:
                     projection_value = projection.execute(time_scale=time_scale,
                                                           params=projection_params,
@@ -1259,9 +1298,13 @@ class State_Base(State):
                 function_params = None
 
             # Combine projection values
-            combined_values = self.function(variable=projection_value_list,
-                                            params=function_params,
-                                            context=context)
+            # (in fast execution mode, without checking arguments if no function params were specified)
+            if self._fast_execution and function_params is None:
+                combined_values = self.function.__self__._fast(projection_value_list, context=context)
+            else:
+                combined_values = self.function(variable=projection_value_list,
+                                                params=function_params,
+                                                context=context)
 
             # If self.value is a number, convert combined_values back to number
             if value_is_number and combined_values:
@@ -1275,8 +1318,9 @@ class State_Base(State):
         #endregion
 
         #region ASSIGN STATE VALUE
-        context = context + kwAggregate + ' Projection Inputs'
         self.value = combined_values
+        if not self._fast_execution:
+            self._log_value(context + kwAggregate + ' Projection Inputs')
         #endregion
 
     def execute(self, input=None, time_scale=None, params=None, context=None):
@@ -1296,32 +1340,26 @@ class State_Base(State):
 
     @value.setter
     def value(self, assignment):
-
-        from math import isnan
-        if isinstance(assignment, np.ndarray) and assignment.ndim == 2 and isnan(assignment[0][0]):
-                    TEST = True
-
+        # IMPLEMENTATION NOTE:  assignment is not logged here (so that it is a simple attribute assignment);
+        #                       values assigned by update are logged by _log_value, which is passed their context
         self._value = assignment
 
-        # Store value in log if specified
-        # Get logPref
-        if self.prefs:
-            log_pref = self.prefs.logPref
+    def _log_value(self, context=None):
+        """Record value in owner's log if context is consistent with logPref
 
-        # Get context
-        try:
-            curr_frame = inspect.currentframe()
-            prev_frame = inspect.getouterframes(curr_frame, 2)
-            context = inspect.getargvalues(prev_frame[1][0]).locals['context']
-        except KeyError:
-            context = ""
+        Called by update (with the context of the assignment) after value has been assigned
+        """
+        log_pref = self.prefs.logPref
+        if log_pref is LogLevel.OFF:
+            return
+
+        context = context or ""
 
         # If context is consistent with log_pref, record value to log
         if (log_pref is LogLevel.ALL_ASSIGNMENTS or
                 (log_pref is LogLevel.EXECUTION and EXECUTING in context) or
                 (log_pref is LogLevel.VALUE_ASSIGNMENT and (EXECUTING in context and kwAssign in context))):
-            self.owner.log.entries[self.name] = LogEntry(CurrentTime(), context, assignment)
-            # self.owner.log.entries[self.name] = LogEntry(CentralClock, context, assignment)
+            self.owner.log.record_value(self.name, self._value, context)
 
     @property
     def baseValue(self):
@@ -247,7 +247,7 @@ Class Reference
 import math
 import re
 from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.LearningMechanisms.LearningMechanism import LearningMechanism
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from collections import UserList, Iterable
 from toposort import *
 
@@ -258,7 +258,9 @@ from PsyNeuLink.Components.Mechanisms.Mechanism import MonitoredOutputStatesOpti
 from PsyNeuLink.Components.Process import ProcessInputState, ProcessList, ProcessTuple
 from PsyNeuLink.Components.Projections.LearningProjection import LearningProjection, _is_learning_spec
 from PsyNeuLink.Components.ShellClasses import *
+from PsyNeuLink.Globals.Context import ExecutionContext
 from PsyNeuLink.Globals.Registry import register_category
+from PsyNeuLink.Globals.Utilities import IncrementalTopologicalOrder
 
 # ProcessRegistry ------------------------------------------------------------------------------------------------------
 
@@ -285,6 +287,10 @@ SystemRegistry = {}
 
 kwSystemInputState = 'SystemInputState'
 
+# Precompiled entry for a mechanism in System._execution_plan (see System._instantiate_execution_plan)
+ExecutionPlanEntry = namedtuple('ExecutionPlanEntry',
+                                'mechanism, params, phase, execute, context_label, origin_processes, terminal_processes')
+
 
 class SystemWarning(Warning):
      def __init__(self, error_value):
@@ -512,6 +518,7 @@ class System_Base(System):
         - _instantiate_attributes_before_function(context):  calls self._instantiate_graph
         - _instantiate_function(context): validates only if self.prefs.paramValidationPref is set
         - _instantiate_graph(input, context):  instantiates Processes in self.process and constructs executionList
+        - _instantiate_execution_plan():  constructs _execution_plan from executionList
         - identify_origin_and_terminal_mechanisms():  assign self.originMechanisms and self.terminalMechanisms
         - _assign_output_states():  assign outputStates of System (currently = terminalMechanisms)
         - execute(input, time_scale, context):  executes Mechanisms in order specified by executionList
@@ -587,6 +594,13 @@ class System_Base(System):
         contains a list of mechanisms in the order in which they are executed.
         The list is a random sample of the permissible orders constrained by the `executionGraph`.
 
+        .. _execution_plan : Dict[int, List[ExecutionPlanEntry]]
+               precompiled version of executionList used by _execute_processing;  the key of each entry is a phase,
+               and its value is a list of the mechanisms (in the order of executionList) to be executed in that phase,
+               along with their runtime_params, bound execute methods, context labels and the sorted lists of
+               processes used for reporting.  It is (re)built by _instantiate_execution_plan whenever the graph is
+               (re)instantiated.
+
     mechanisms : list of Mechanism objects
         contains a list of all mechanisms in the system.
 
@@ -790,6 +804,7 @@ class System_Base(System):
                          context=context)
 
         self._execution_id = None
+        self._execution_owner_assigned = False
 
         # Get/assign controller
 
@@ -1140,7 +1155,8 @@ class System_Base(System):
                 begin with process.firstMechanism (assign as ORIGIN if it doesn't receive any projections)
                 traverse all projections
                 for each mechanism encountered (receiver), assign to its dependency set the previous (sender) mechanism
-                for each assignment, use toposort to test whether the dependency introduced a cycle; if so:
+                for each assignment, test whether the dependency introduced a cycle
+                    (using an IncrementalTopologicalOrder, which is updated as dependencies are added); if so:
                     eliminate the dependent from the executionGraph, and designate it as CYCLE (unless it is an ORIGIN)
                     designate the sender as INITIALIZE_CYCLE (it can receive and initial_value specification)
                 if a mechanism doe not project to any other ProcessingMechanisms (ignore monitoring and control mechs):
@@ -1218,6 +1234,8 @@ class System_Base(System):
                     sender_mech.systems[self] = TERMINAL
                 return
 
+            sender_tuple = self._allMechanisms._get_tuple_for_mech(sender_mech)
+
             for outputState in sender_mech.outputStates.values():
 
                 for projection in outputState.sendsToProjections:
@@ -1232,11 +1250,11 @@ class System_Base(System):
                     # MODIFIED 2/8/17 END
 
                     try:
-                        self.graph[receiver_tuple].add(self._allMechanisms._get_tuple_for_mech(sender_mech))
+                        self.graph[receiver_tuple].add(sender_tuple)
                     except KeyError:
-                        self.graph[receiver_tuple] = {self._allMechanisms._get_tuple_for_mech(sender_mech)}
+                        self.graph[receiver_tuple] = {sender_tuple}
 
-                    # Use toposort to test whether the added dependency produced a cycle (feedback loop)
+                    # Test whether the added dependency produced a cycle (feedback loop)
                     # Do not include dependency (or receiver on sender) in executionGraph for this projection
                     #  and end this branch of the traversal if the receiver has already been encountered,
                     #  but do mark for initialization
@@ -1248,25 +1266,17 @@ class System_Base(System):
                     # * Check for receiver mechanism and not its tuple,
                     #     since the same mechanism can appear in more than one tuple (e.g., with different phases)
                     #     and would introduce a cycle irrespective of the tuple in which it appears in the graph
-                    # FIX: MODIFY THIS TO (GO BACK TO) USING if receiver_tuple in self.executionGraph
-                    # FIX  BUT CHECK THAT THEY ARE IN DIFFERENT PHASES
-                    if receiver in self.execution_graph_mechs:
-                        # Try assigning receiver as dependent of current mechanism and test toposort
-                        try:
-                            # If receiver_tuple already has dependencies in its set, add sender_mech to set
-                            if self.executionGraph[receiver_tuple]:
-                                self.executionGraph[receiver_tuple].\
-                                    add(self._allMechanisms._get_tuple_for_mech(sender_mech))
-                            # If receiver_tuple set is empty, assign sender_mech to set
-                            else:
-                                self.executionGraph[receiver_tuple] = \
-                                    {self._allMechanisms._get_tuple_for_mech(sender_mech)}
-                            # Use toposort to test whether the added dependency produced a cycle (feedback loop)
-                            list(toposort(self.executionGraph))
-                        # If making receiver dependent on sender produced a cycle (feedback loop), remove from graph
-                        except ValueError:
-                            self.executionGraph[receiver_tuple].\
-                                remove(self._allMechanisms._get_tuple_for_mech(sender_mech))
+                    # * The test uses execution_order (rather than toposort of the entire executionGraph),
+                    #     which maintains a topological order of the executionGraph as dependencies are added to it
+                    # Note: the tuple for a mechanism in the graph is always the one returned by _get_tuple_for_mech,
+                    #       so testing for receiver_tuple is equivalent to testing for receiver in execution_graph_mechs
+                    # FIX  CHECK THAT THEY ARE IN DIFFERENT PHASES
+                    if receiver_tuple in self.executionGraph:
+                        # Try assigning receiver as dependent of current mechanism
+                        if execution_order.add_dependency(sender_tuple, receiver_tuple):
+                            self.executionGraph[receiver_tuple].add(sender_tuple)
+                        # If making receiver dependent on sender would produce a cycle (feedback loop), don't add it
+                        else:
                             # Assign sender_mech INITIALIZE_CYCLE as system status if not ORIGIN or not yet assigned
                             if not sender_mech.systems or not (sender_mech.systems[self] in {ORIGIN, SINGLETON}):
                                 sender_mech.systems[self] = INITIALIZE_CYCLE
@@ -1276,14 +1286,9 @@ class System_Base(System):
 
                     else:
                         # Assign receiver as dependent on sender mechanism
-                        try:
-                            # FIX: THIS WILL ADD SENDER_MECH IF RECEIVER IS IN GRAPH BUT = set()
-                            # FIX: DOES THAT SCREW UP ORIGINS?
-                            self.executionGraph[receiver_tuple].\
-                                add(self._allMechanisms._get_tuple_for_mech(sender_mech))
-                        except KeyError:
-                            self.executionGraph[receiver_tuple] = \
-                                {self._allMechanisms._get_tuple_for_mech(sender_mech)}
+                        # Note: receiver has no dependencies yet, so this can't produce a cycle
+                        execution_order.add_dependency(sender_tuple, receiver_tuple)
+                        self.executionGraph[receiver_tuple] = {sender_tuple}
 
                     if not sender_mech.systems:
                         sender_mech.systems[self] = INTERNAL
@@ -1293,6 +1298,7 @@ class System_Base(System):
 
         self.graph = OrderedDict()
         self.executionGraph = OrderedDict()
+        execution_order = IncrementalTopologicalOrder()
 
 
         # Sort for consistency of output
@@ -1337,6 +1343,8 @@ class System_Base(System):
                 mech_tuple = self._allMechanisms._get_tuple_for_mech(first_mech)
                 self.graph[mech_tuple] = set()
                 self.executionGraph[mech_tuple] = set()
+                execution_order.add_node(mech_tuple)
+                execution_order.remove_dependencies(mech_tuple)
                 first_mech.systems[self] = ORIGIN
 
             build_dependency_sets_by_traversing_projections(first_mech)
@@ -1430,10 +1438,14 @@ class System_Base(System):
         # MODIFIED 10/31/16 OLD:
         # self.executionList = toposort_flatten(self.executionGraph, sort=False)
         # MODIFIED 10/31/16 NEW:
-        temp = toposort_flatten(self.executionGraph, sort=False)
-        self.executionList = self._toposort_with_ordered_mech_tuples(self.executionGraph)
+        self.executionList = self._toposort_with_ordered_mech_tuples(self.execution_sets)
         # MODIFIED 10/31/16 END
 
+        # Precompile executionList into phase-indexed lists (rebuilt each time the graph is instantiated)
+        self._instantiate_execution_plan()
+        # Reassign the system as execution owner of its mechanisms on its next execution (see Run._assign_execution_owner)
+        self._execution_owner_assigned = False
+
         # MODIFIED 2/8/17 NEW:
         # Construct self.variable from inputs to ORIGIN mechanisms
         self.variable = []
@@ -1461,6 +1473,58 @@ class System_Base(System):
                 raise SystemError("{} (in initial_values arg for \'{}\') is not a valid value for {}".
                                   format(value, self.name, append_type_to_name(self)))
 
+    def _get_execution_owned_mechanisms(self):
+        """Return the mechanisms that get their _execution_id from the system
+
+        These are the mechanisms in the graph (including learning), the controller, and the mechanisms that project
+            to the controller
+        """
+        mechanisms = list(self.execution_graph_mechs)
+        mechanisms.extend(component for component in self.learningExecutionList
+                          if isinstance(component, Mechanism))
+        mechanisms.append(self.controller)
+        if self.controller.inputStates:
+            for state in self.controller.inputStates.values():
+                for projection in state.receivesFromProjections:
+                    mechanisms.append(projection.sender.owner)
+        return mechanisms
+
+    def _instantiate_execution_plan(self):
+        """Construct _execution_plan from executionList
+
+        Assign each mech_tuple in executionList to the list for its phase in _execution_plan (preserving the order of
+            executionList), along with:
+            - the mechanism's bound execute method
+            - the label appended to the context for its execution
+            - the sorted lists of processes for which it is an ORIGIN (or SINGLETON) or TERMINAL (used for reporting)
+
+        IMPLEMENTATION NOTE:  this is called by _instantiate_graph, so that the plan is rebuilt only when the
+                              graph changes, rather than having _execute_processing recompute it on every execution.
+        """
+
+        self._execution_plan = {}
+
+        for mechanism, params, phase_spec in self.executionList:
+
+            # Sort for consistency of reporting:
+            process_keys_sorted = sorted(mechanism.processes.keys(), key=lambda process : process.name)
+            process_names = list(p.name for p in process_keys_sorted)
+
+            entry = ExecutionPlanEntry(mechanism=mechanism,
+                                       params=params,
+                                       phase=phase_spec,
+                                       execute=mechanism.execute,
+                                       context_label="| mechanism: " + mechanism.name +
+                                                     " [in processes: " + str(process_names) + "]",
+                                       origin_processes=[process for process in process_keys_sorted
+                                                         if mechanism.processes[process] in {ORIGIN, SINGLETON}],
+                                       terminal_processes=[process for process in process_keys_sorted
+                                                           if mechanism.processes[process] == TERMINAL])
+            try:
+                self._execution_plan[phase_spec].append(entry)
+            except KeyError:
+                self._execution_plan[phase_spec] = [entry]
+
     def _instantiate_stimulus_inputs(self, context=None):
 
 # FIX: ZERO VALUE OF ALL ProcessInputStates BEFORE EXECUTING
@@ -1505,6 +1569,7 @@ class System_Base(System):
 
         self.learningGraph = OrderedDict()
         self.learningExecutionGraph = OrderedDict()
+        learning_execution_order = IncrementalTopologicalOrder()
 
         def build_dependency_sets_by_traversing_projections(sender_mech, process):
 
@@ -1674,7 +1739,7 @@ class System_Base(System):
                     except KeyError:
                         self.learningGraph[receiver] = {sender_mech}
 
-                    # Use toposort to test whether the added dependency produced a cycle (feedback loop)
+                    # Test whether the added dependency produced a cycle (feedback loop)
                     # Do not include dependency (or receiver on sender) in learningExecutionGraph for this projection
                     #  and end this branch of the traversal if the receiver has already been encountered,
                     #  but do mark for initialization
@@ -1687,32 +1752,24 @@ class System_Base(System):
                     #     since the same mechanism can appear in more than one tuple (e.g., with different phases)
                     #     and would introduce a cycle irrespective of the tuple in which it appears in the learningGraph
 
+                    # * As in _instantiate_graph, the test uses learning_execution_order
+                    #     (rather than toposort of the entire learningExecutionGraph)
+
                     if receiver in self.learningExecutionGraph:
                     # if receiver in self.learning_execution_graph_mechs:
-                        # Try assigning receiver as dependent of current mechanism and test toposort
-                        try:
-                            # If receiver already has dependencies in its set, add sender_mech to set
-                            if self.learningExecutionGraph[receiver]:
-                                self.learningExecutionGraph[receiver].add(sender_mech)
-                            # If receiver set is empty, assign sender_mech to set
-                            else:
-                                self.learningExecutionGraph[receiver] = {sender_mech}
-                            # Use toposort to test whether the added dependency produced a cycle (feedback loop)
-                            list(toposort(self.learningExecutionGraph))
-                        # If making receiver dependent on sender produced a cycle, remove from learningGraph
-                        except ValueError:
-                            self.learningExecutionGraph[receiver].remove(sender_mech)
+                        # Try assigning receiver as dependent of current mechanism
+                        if learning_execution_order.add_dependency(sender_mech, receiver):
+                            self.learningExecutionGraph[receiver].add(sender_mech)
+                        # If making receiver dependent on sender would produce a cycle, don't add it
+                        else:
                             receiver.systems[self] = CYCLE
                             continue
 
                     else:
                         # Assign receiver as dependent on sender mechanism
-                        try:
-                            # FIX: THIS WILL ADD SENDER_MECH IF RECEIVER IS IN GRAPH BUT = set()
-                            # FIX: DOES THAT SCREW UP ORIGINS?
-                            self.learningExecutionGraph[receiver].add(sender_mech)
-                        except KeyError:
-                            self.learningExecutionGraph[receiver] = {sender_mech}
+                        # Note: receiver has no dependencies yet, so this can't produce a cycle
+                        learning_execution_order.add_dependency(sender_mech, receiver)
+                        self.learningExecutionGraph[receiver] = {sender_mech}
 
                     if not sender_mech.systems:
                         sender_mech.systems[self] = MONITORING
@@ -1731,6 +1788,7 @@ class System_Base(System):
 
         # FIX: USE TOPOSORT TO FIND, OR AT LEAST CONFIRM, TARGET MECHANISMS, WHICH SHOULD EQUAL COMPARATOR MECHANISMS
         self.learningExecutionList = toposort_flatten(self.learningExecutionGraph, sort=False)
+        self._learning_context_labels = {}
         # self.learningExecutionList = self._toposort_with_ordered_mech_tuples(self.learningExecutionGraph)
 
         # Construct monitoringMechanisms and targetMechanisms MechanismLists
@@ -1882,23 +1940,18 @@ class System_Base(System):
 
         if not context:
             context = EXECUTING + " " + SYSTEM + " " + self.name
+        # Use ExecutionContext (rather than string) for context along the execution path
+        context = ExecutionContext.from_string(context, owner=self)
 
-        # Update execution_id for self and all mechanisms in graph (including learning) and controller
-        from PsyNeuLink.Globals.Run import _get_unique_id
+        # Update execution_id for self;  mechanisms in graph (including learning) and controller get it from self
+        # IMPLEMENTATION NOTE:  the system is only assigned as the execution owner of its mechanisms if another
+        #                       System or Process has been executed since its last execution (or its graph has changed)
+        from PsyNeuLink.Globals.Run import _get_unique_id, _assign_execution_owner
         self._execution_id = execution_id or _get_unique_id()
-        # FIX: GO THROUGH LEARNING GRAPH HERE AND ASSIGN EXECUTION TOKENS FOR ALL MECHANISMS IN IT
-        # self.learningExecutionList
-        for mech in self.execution_graph_mechs:
-            mech._execution_id = self._execution_id
-        for learning_mech in self.learningExecutionList:
-            learning_mech._execution_id = self._execution_id
-        self.controller._execution_id = self._execution_id
-        if self.controller.inputStates:
-            for state in self.controller.inputStates.values():
-                for projection in state.receivesFromProjections:
-                    projection.sender.owner._execution_id = self._execution_id
+        _assign_execution_owner(self, self._get_execution_owned_mechanisms())
 
-        self._report_system_output = self.prefs.reportOutputPref and context and EXECUTING in context
+        self._report_system_output = (not self._fast_execution and
+                                      self.prefs.reportOutputPref and context and EXECUTING in context)
         if self._report_system_output:
             self._report_process_output = any(process.reportOutputPref for process in self.processes)
 
@@ -1998,57 +2051,41 @@ class System_Base(System):
 
     def _execute_processing(self, clock=CentralClock, context=None):
     # def _execute_processing(self, clock=CentralClock, time_scale=TimeScale.Trial, context=None):
-        # Execute each Mechanism in self.executionList, in the order listed during its phase
-        for i in range(len(self.executionList)):
-
-            mechanism, params, phase_spec = self.executionList[i]
+        # Execute each Mechanism in self._execution_plan for the current phase, in the order listed in executionList
+        # Note: entries are precompiled by _instantiate_execution_plan, so there is no per-execution bookkeeping here
 
-            # Only update Mechanism on time_step(s) determined by its phaseSpec (specified in Mechanism's Process entry)
+        # Only update Mechanisms on time_step(s) determined by their phaseSpec (specified in Mechanism's Process entry)
 # FIX: NEED TO IMPLEMENT FRACTIONAL UPDATES (IN Mechanism.update()) FOR phaseSpec VALUES THAT HAVE A DECIMAL COMPONENT
-            if phase_spec == (clock.time_step % self.numPhases):
-                # Note:  DON'T include input arg, as that will be resolved by mechanism from its sender projections
+        for entry in self._execution_plan.get(clock.time_step % self.numPhases, ()):
 
-                processes = list(mechanism.processes.keys())
-                process_keys_sorted = sorted(processes, key=lambda i : processes[processes.index(i)].name)
-                process_names = list(p.name for p in process_keys_sorted)
-
-                mechanism.execute(clock=clock,
-                                  time_scale=self.timeScale,
-                                  # time_scale=time_scale,
-                                  runtime_params=params,
-                                  context=context +
-                                          "| mechanism: " + mechanism.name +
-                                          " [in processes: " + str(process_names) + "]")
-
-
-                if self._report_system_output and  self._report_process_output:
-
-                    # REPORT COMPLETION OF PROCESS IF ORIGIN:
-                    # Report initiation of process(es) for which mechanism is an ORIGIN
-                    # Sort for consistency of reporting:
-                    processes = list(mechanism.processes.keys())
-                    process_keys_sorted = sorted(processes, key=lambda i : processes[processes.index(i)].name)
-                    for process in process_keys_sorted:
-                        if mechanism.processes[process] in {ORIGIN, SINGLETON} and process.reportOutputPref:
-                            process._report_process_initiation(input=mechanism.inputValue[0])
-
-                    # REPORT COMPLETION OF PROCESS IF TERMINAL:
-                    # Report completion of process(es) for which mechanism is a TERMINAL
-                    # Sort for consistency of reporting:
-                    processes = list(mechanism.processes.keys())
-                    process_keys_sorted = sorted(processes, key=lambda i : processes[processes.index(i)].name)
-                    for process in process_keys_sorted:
-                        if process.learning and process._learning_enabled:
-                            continue
-                        if mechanism.processes[process] == TERMINAL and process.reportOutputPref:
-                            process._report_process_completion()
+            # Note:  DON'T include input arg, as that will be resolved by mechanism from its sender projections
+            entry.execute(clock=clock,
+                          time_scale=self.timeScale,
+                          # time_scale=time_scale,
+                          runtime_params=entry.params,
+                          context=context.for_owner(entry.mechanism, entry.context_label))
+
+            if self._report_system_output and  self._report_process_output:
+
+                # REPORT COMPLETION OF PROCESS IF ORIGIN:
+                # Report initiation of process(es) for which mechanism is an ORIGIN
+                for process in entry.origin_processes:
+                    if process.reportOutputPref:
+                        process._report_process_initiation(input=entry.mechanism.inputValue[0])
+
+                # REPORT COMPLETION OF PROCESS IF TERMINAL:
+                # Report completion of process(es) for which mechanism is a TERMINAL
+                for process in entry.terminal_processes:
+                    if process.learning and process._learning_enabled:
+                        continue
+                    if process.reportOutputPref:
+                        process._report_process_completion()
 
-            if not i:
-                # Zero input to first mechanism after first run (in case it is repeated in the pathway)
-                # IMPLEMENTATION NOTE:  in future version, add option to allow Process to continue to provide input
-                # FIX: USE clamp_input OPTION HERE, AND ADD HARD_CLAMP AND SOFT_CLAMP
-                self.variable = convert_to_np_array(self.input, 2) * 0
-            i += 1
+        if self.executionList:
+            # Zero input to first mechanism after first run (in case it is repeated in the pathway)
+            # IMPLEMENTATION NOTE:  in future version, add option to allow Process to continue to provide input
+            # FIX: USE clamp_input OPTION HERE, AND ADD HARD_CLAMP AND SOFT_CLAMP
+            self.variable = convert_to_np_array(self.input, 2) * 0
 
     def _execute_learning(self, clock=CentralClock, context=None):
         # Execute each monitoringMechanism as well as learning projections in self.learningExecutionList
@@ -2074,26 +2111,15 @@ class System_Base(System):
 
             params = None
 
-            component_type = component.componentType
-
-            processes = list(component.processes.keys())
-
-            # Sort for consistency of reporting:
-            process_keys_sorted = sorted(processes, key=lambda i : processes[processes.index(i)].name)
-            process_names = list(p.name for p in process_keys_sorted)
-
-            context_str = str("{} | {}: {} [in processes: {}]".
-                              format(context,
-                                     component_type,
-                                     component.name,
-                                     re.sub('[\[,\],\n]','',str(process_names))))
-
             # Note:  DON'T include input arg, as that will be resolved by mechanism from its sender projections
             component.execute(clock=clock,
                               time_scale=self.timeScale,
                               runtime_params=params,
                               # time_scale=time_scale,
-                              context=context_str)
+                              context=context.for_owner(component,
+                                                        self._get_learning_context_label(component,
+                                                                                         component.componentType,
+                                                                                         component.processes)))
             # # TEST PRINT:
             # print ("EXECUTING MONITORING UPDATES: ", component.name)
 
@@ -2105,21 +2131,11 @@ class System_Base(System):
             if not isinstance(component, MappingProjection):
                 raise SystemError("PROGRAM ERROR:  Attempted learning on non-MappingProjection")
 
-            component_type = "mappingProjection"
-            processes = list(component.sender.owner.processes.keys())
-
-
-            # Sort for consistency of reporting:
-            process_keys_sorted = sorted(processes, key=lambda i : processes[processes.index(i)].name)
-            process_names = list(p.name for p in process_keys_sorted)
-
-            context_str = str("{} | {}: {} [in processes: {}]".
-                              format(context,
-                                     component_type,
-                                     component.name,
-                                     re.sub('[\[,\],\n]','',str(process_names))))
-
-            component.parameterStates[MATRIX].update(time_scale=TimeScale.TRIAL, context=context_str)
+            context_label = self._get_learning_context_label(component,
+                                                             "mappingProjection",
+                                                             component.sender.owner.processes)
+            component.parameterStates[MATRIX].update(time_scale=TimeScale.TRIAL,
+                                                     context=context.for_owner(component, context_label))
 
             # TEST PRINT:
             # print ("EXECUTING WEIGHT UPDATES: ", component.name)
@@ -2142,6 +2158,241 @@ class System_Base(System):
                              ))
                              # process_names))
 
+    def _validate_batch_execution(self, parameter_states=None):
+        """Check that the system can be executed in batch mode (see _execute_batch)
+
+        Batch execution requires that the system:
+            - has no mechanism that is executed more than once, or that receives a projection from one that is
+              executed after it (i.e., no recurrence);
+            - has no learning, and its controller is not enabled (unless parameter_states is specified);
+            - has no runtime_params specified in its mech_tuples, and no projections to parameterStates other than
+              the ones in parameter_states;
+            - has no more than one mechanism that samples random values (so that they are sampled in the same order as
+              when the system is executed one trial at a time);
+            - only has mechanisms that either support batch execution (i.e., implement _execute_batch), in which case
+              they must have a single inputState, or that are executed for each trial in turn (which is not possible
+              for ones with parameterStates in parameter_states).
+
+        parameter_states are the parameterStates that have a value for each trial, for a simulation run by the
+            system's controller (which is then not executed).
+        """
+        from PsyNeuLink.Components.Mechanisms.Mechanism import MechanismError
+        from PsyNeuLink.Components.Projections.MappingProjection import MappingProjection
+
+        def not_supported(reason):
+            raise SystemError("{} can't be executed in batch mode since {}".format(self.name, reason))
+
+        parameter_states = parameter_states or ()
+
+        if self.recurrentInitMechanisms or len(self.executionList) != len(self.execution_graph_mechs):
+            not_supported("it has recurrent projections")
+        if self.learningExecutionList:
+            not_supported("it has learning")
+        if self.enable_controller and not parameter_states:
+            not_supported("its controller is enabled")
+        if len([mechanism for mechanism, params, phase_spec in self.executionList if mechanism._stochastic]) > 1:
+            not_supported("more than one of its mechanisms samples random values")
+
+        executed_mechanisms = {}
+        for mechanism, params, phase_spec in self.executionList:
+            if params:
+                not_supported("runtime_params are specified for {}".format(mechanism.name))
+            parameter_names = []
+            for state in mechanism.parameterStates.values():
+                if state in parameter_states:
+                    parameter_names.append(state.name)
+                elif state.receivesFromProjections:
+                    not_supported("parameters of {} receive projections".format(mechanism.name))
+            try:
+                mechanism._validate_batch_execution(parameter_names)
+            except MechanismError as error:
+                # The mechanism is executed for each trial in turn, which requires the same params for all trials
+                if parameter_names:
+                    not_supported(error.args[0] if error.args else error)
+            else:
+                # Only the primary inputState is executed in batch mode
+                if len(mechanism.inputStates) > 1:
+                    not_supported("{} has more than one inputState".format(mechanism.name))
+            for input_state in mechanism.inputStates.values():
+                for projection in input_state.receivesFromProjections:
+                    if not isinstance(projection, MappingProjection):
+                        not_supported("{} receives a {}".format(mechanism.name, projection.__class__.__name__))
+                    if any(state.receivesFromProjections for state in projection.parameterStates.values()):
+                        not_supported("parameters of {} receive projections".format(projection.name))
+                    sender_owner = projection.sender.owner
+                    if (sender_owner in self.execution_graph_mechs and
+                            (not sender_owner in executed_mechanisms or executed_mechanisms[sender_owner] > phase_spec)):
+                        not_supported("{} receives a projection from {}, which has not yet executed".
+                                      format(mechanism.name, sender_owner.name))
+            executed_mechanisms[mechanism] = phase_spec
+
+    def _execute_batch(self, inputs, num_executions, parameter_values=None, state_values=None,
+                       time_scale=TimeScale.TRIAL, context=None):
+        """Execute the system for num_executions trials at once, and return the result for each trial
+
+        The inputs for all of the trials are assigned to an array (with one row per trial) for each SystemInputState,
+            which is passed to the MappingProjections from it;  each mechanism is then executed once (in the order of
+            executionList), with an array of the inputs for all trials, using the batch_function of its function and
+            those of its inputState and of the projections to it.  Mechanisms that don't support batch execution
+            are executed for each trial in turn (see _execute_mechanism_for_each_trial).
+        Inputs are cycled if num_executions is greater than the number of input sets (as in run).
+        parameter_values is a dict with the value of parameterStates for each trial (keyed by parameterState), for a
+            simulation run by the system's controller (see EVCMechanism.run_batch_simulation).
+        The values of mechanisms and states are those of the last trial when execution is complete;  the values of
+            all of the states for all of the trials are assigned to state_values (if it is specified).
+
+        Returns a list with the outputStateValues of the TERMINAL mechanisms for each trial (as assigned to results by
+            run), without generating any reports.
+
+        Called by run (if its batch argument is True), which calls _validate_batch_execution first.
+        """
+
+        from PsyNeuLink.Components.Mechanisms.Mechanism import MechanismError
+
+        self.timeScale = time_scale or TimeScale.TRIAL
+        trials = np.arange(num_executions) % len(inputs)
+        parameter_values = parameter_values or {}
+
+        # Batch values for states (one item per trial), including SystemInputStates and outputStates of mechanisms
+        if state_values is None:
+            state_values = {}
+
+        # Assign inputs to the SystemInputState for each inputState of each ORIGIN mechanism
+        #    (from the input for the time_step of the phase in which the mechanism executes)
+        phases = {mechanism: phase_spec for mechanism, params, phase_spec in self.executionList}
+        for i, origin_mech in zip(range(len(self.originMechanisms)), self.originMechanisms):
+            phase = phases[origin_mech]
+            for j, input_state in zip(range(len(origin_mech.inputStates)), origin_mech.inputStates.values()):
+                system_input_state = next(projection.sender for projection in input_state.receivesFromProjections
+                                          if isinstance(projection.sender, SystemInputState))
+                input_sets = np.array([np.atleast_1d(input_set[phase][i][j]) for input_set in inputs])
+                state_values[system_input_state] = input_sets[trials]
+
+        for mechanism, params, phase_spec in self.executionList:
+
+            mechanism_context = context.for_owner(mechanism, "| batch mechanism: " + mechanism.name)
+
+            mechanism_parameter_values = {state.name: values for state, values in parameter_values.items()
+                                          if state.owner is mechanism}
+            try:
+                mechanism._validate_batch_execution(list(mechanism_parameter_values))
+            except MechanismError:
+                self._execute_mechanism_for_each_trial(mechanism, num_executions, state_values, mechanism_context)
+                continue
+
+            # Note: projections from outside the system (e.g., from ProcessInputStates) are ignored,
+            #       as they are when the system is executed one trial at a time
+            input_state = mechanism.inputState
+            input_values = self._get_batch_input_state_values(input_state, state_values, mechanism_context)
+
+            values = mechanism._execute_batch(input_values,
+                                              parameter_values=mechanism_parameter_values,
+                                              context=mechanism_context)
+            state_values[mechanism] = values
+
+            # Leave mechanism in state of last trial
+            input_state.value = input_values[-1]
+            mechanism.value = np.atleast_2d(values[-1])
+            for output_state in mechanism.outputStates.values():
+                output_state.value = self._get_batch_output_state_values(output_state, state_values, context)[-1]
+
+        # Assign input for the last time_step to each SystemInputState (as when executed one trial at a time)
+        last_input = inputs[trials[-1]][-1]
+        for i, origin_mech in zip(range(len(self.originMechanisms)), self.originMechanisms):
+            for j, input_state in zip(range(len(origin_mech.inputStates)), origin_mech.inputStates.values()):
+                for projection in input_state.receivesFromProjections:
+                    if isinstance(projection.sender, SystemInputState):
+                        projection.sender.value = last_input[i][j]
+        self.input = last_input
+
+        # Get outputStateValues of TERMINAL mechanisms for each trial
+        terminal_values = [self._get_batch_output_state_values(output_state, state_values, context)
+                           for mechanism in self.terminalMechanisms.mechanisms
+                           for output_state in mechanism.outputStates.values()]
+        return [[values[trial] for values in terminal_values] for trial in range(num_executions)]
+
+    def _get_batch_output_state_values(self, output_state, state_values, context=None):
+        """Return values of output_state for all trials of a batch (calculated from those of its owner)
+        """
+        from PsyNeuLink.Components.Functions.Function import Function_Base
+
+        try:
+            return state_values[output_state]
+        except KeyError:
+            owner_values = np.asarray(state_values[output_state.owner])[:, output_state.index]
+            calculate = output_state.calculate
+            if isinstance(getattr(calculate, '__self__', None), Function_Base):
+                values = calculate.__self__.batch_function(owner_values, context=context)
+            else:
+                values = [type_match(calculate(value), type(value)) for value in owner_values]
+            state_values[output_state] = values
+            return values
+
+    def _get_batch_input_state_values(self, input_state, state_values, context=None):
+        """Return values of input_state for all trials of a batch, from those of the projections to it
+
+        Projections from senders that have no values in state_values (i.e., from outside the system) are ignored
+        """
+        projection_values = []
+        for projection in input_state.receivesFromProjections:
+            sender = projection.sender
+            if not (sender in state_values or sender.owner in state_values):
+                continue
+            sender_values = np.asarray(self._get_batch_output_state_values(sender, state_values, context))
+            projection_values.append(projection.function_object.batch_function(sender_values, context=context))
+
+        # Combine projection values for each trial (projections are along axis 1)
+        return input_state.function_object.batch_function(np.stack(projection_values, axis=1), context=context)
+
+    def _execute_mechanism_for_each_trial(self, mechanism, num_executions, state_values, context=None):
+        """Execute mechanism for each trial of a batch in turn, and assign the values of its outputStates to state_values
+
+        Before each execution, the senders of the projections to the mechanism are assigned their values for the
+            trial, so that it executes as it does when the system is executed one trial at a time (including changes
+            in its state from one trial to the next, e.g., of an integrator);  the senders are left with the values
+            of the last trial.
+        Used by _execute_batch for mechanisms that don't support batch execution, and by
+            EVCMechanism.run_batch_simulation for its monitoring_mechanism.
+        """
+        sender_values = []
+        for input_state in mechanism.inputStates.values():
+            for projection in input_state.receivesFromProjections:
+                sender = projection.sender
+                if sender in state_values or sender.owner in state_values:
+                    sender_values.append((sender, self._get_batch_output_state_values(sender, state_values, context)))
+
+        values = []
+        output_state_values = OrderedDict((output_state, []) for output_state in mechanism.outputStates.values())
+        for trial in range(num_executions):
+            for sender, trial_values in sender_values:
+                sender.value = trial_values[trial]
+            mechanism.execute(time_scale=self.timeScale, context=context)
+            values.append(mechanism.value)
+            for output_state, trial_values in output_state_values.items():
+                trial_values.append(np.array(output_state.value))
+
+        state_values[mechanism] = values
+        state_values.update(output_state_values)
+
+    def _get_learning_context_label(self, component, component_type, processes):
+        """Return the label appended to the context for execution of a component in learningExecutionList
+
+        Labels are cached (in _learning_context_labels), since they are the same on every execution
+        """
+        try:
+            return self._learning_context_labels[component]
+        except KeyError:
+            processes = list(processes.keys())
+            # Sort for consistency of reporting:
+            process_keys_sorted = sorted(processes, key=lambda i : processes[processes.index(i)].name)
+            process_names = list(p.name for p in process_keys_sorted)
+            label = str(" | {}: {} [in processes: {}]".
+                        format(component_type,
+                               component.name,
+                               re.sub('[\[,\],\n]','',str(process_names))))
+            self._learning_context_labels[component] = label
+            return label
+
     def run(self,
             inputs,
             num_executions=None,
@@ -2149,12 +2400,15 @@ class System_Base(System):
             initialize=False,
             targets=None,
             learning=None,
+            learning_rate=None,
             call_before_trial=None,
             call_after_trial=None,
             call_before_time_step=None,
             call_after_time_step=None,
             clock=CentralClock,
             time_scale=None,
+            batch=False,
+            results='list',
             context=None):
         """Run a sequence of executions
 
@@ -2185,6 +2439,10 @@ class System_Base(System):
             If it is not specified, the current state is left intact.
             If it is :keyword:`True`, learning is forced on; if it is :keyword:`False`, learning is forced off.
 
+        learning_rate : float : default `None`
+            the learning_rate assigned to all of the LearningProjections in the system before the executions;  if it
+            is not specified, the system's `learning_rate <System_Base.learning_rate>` is used.
+
         call_before_trial : Function : default= `None`
             called before each trial in the sequence is executed.
 
@@ -2200,6 +2458,16 @@ class System_Base(System):
         time_scale : TimeScale :  default TimeScale.TRIAL
             specifies whether mechanisms are executed for a single time step or a trial.
 
+        batch : bool : default False
+            executes all of the trials at once, with each mechanism processing the inputs for all of them in a single
+            call (see `Run <Run.run>`), other than any that don't support batch execution, which are executed for
+            each trial in turn;  only supported for a system without recurrence, learning or an enabled controller.
+
+        results : 'list', 'array', 'none' or ResultReducer : default 'list'
+            determines how the result of each execution is stored:  appended to `results <System_Base.results>`
+            (``'list'``), in preallocated arrays (``'array'``), not at all (``'none'``), or by a `ResultReducer
+            <Run.ResultReducer>` such as `RunningMean <Run.RunningMean>` (see `Run_Results`).
+
         Returns
         -------
 
@@ -2210,7 +2478,8 @@ class System_Base(System):
                 each execution.
         COMMMENT
         <system>.results : List[Mechanism.OutputValue]
-            list of the OutputValue for each `TERMINAL` mechanism of the system returned for each execution.
+            list of the OutputValue for each `TERMINAL` mechanism of the system returned for each execution
+            (or, if **results** is not ``'list'``, the value described in `Run_Results`).
 
         """
         from PsyNeuLink.Globals.Run import run
@@ -2221,14 +2490,82 @@ class System_Base(System):
                    initialize=initialize,
                    targets=targets,
                    learning=learning,
+                   learning_rate=learning_rate,
                    call_before_trial=call_before_trial,
                    call_after_trial=call_after_trial,
                    call_before_time_step=call_before_time_step,
                    call_after_time_step=call_after_time_step,
                    time_scale=time_scale,
                    clock=clock,
+                   batch=batch,
+                   results=results,
                    context=context)
 
+    def run_iter(self,
+                 inputs,
+                 targets=None,
+                 reset_clock=True,
+                 initialize=False,
+                 learning=None,
+                 learning_rate=None,
+                 clock=CentralClock,
+                 time_scale=None,
+                 context=None):
+        """Generator that runs an execution for each input drawn from an iterable
+
+        Inputs are consumed one at a time, so they can be produced on the fly (e.g., by a generator, which need not
+        terminate);  the output of each execution is yielded rather than stored in `results <System_Base.results>`.
+        See `Run <Run.run_iter>` for details.
+
+        Arguments
+        ---------
+
+        inputs : iterable
+            the input for each execution, each item of which specifies the input for a single execution (i.e., a
+            list with one input for each `ORIGIN` mechanism, or a dict with one entry for each).
+
+        targets : iterable : default `None`
+            the target values for the MonitoringMechanisms of the system for each execution (used for learning),
+            in the same format as ``inputs``, and consumed in step with them.
+
+        reset_clock : bool : default :keyword:`True`
+            if True, resets the :py:class:`CentralClock <TimeScale.CentralClock>` to 0 before the first execution.
+
+        initialize : bool default :keyword:`False`
+            if :keyword:`True`, calls the :py:meth:`initialize <System_Base.initialize>` method of the system before
+            the first execution.
+
+        learning : bool :  default `None`
+            enables or disables learning during execution.
+            If it is not specified, the current state is left intact.
+            If it is :keyword:`True`, learning is forced on; if it is :keyword:`False`, learning is forced off.
+
+        learning_rate : float : default `None`
+            the learning_rate assigned to all of the LearningProjections in the system before the first execution;
+            if it is not specified, the system's `learning_rate <System_Base.learning_rate>` is used.
+
+        time_scale : TimeScale :  default TimeScale.TRIAL
+            specifies whether mechanisms are executed for a single time step or a trial.
+
+        Yields
+        ------
+
+        Mechanism.OutputValue
+            the OutputValue for each `TERMINAL` mechanism of the system for each execution.
+
+        """
+        from PsyNeuLink.Globals.Run import run_iter
+        return run_iter(self,
+                        inputs=inputs,
+                        targets=targets,
+                        reset_clock=reset_clock,
+                        initialize=initialize,
+                        learning=learning,
+                        learning_rate=learning_rate,
+                        time_scale=time_scale,
+                        clock=clock,
+                        context=context)
+
     def _report_system_initiation(self, clock=CentralClock):
         """Prints iniiation message, time_step, and list of processes in system being executed
         """
@@ -2496,12 +2833,14 @@ class System_Base(System):
 
         return inspect_dict
 
-    def _toposort_with_ordered_mech_tuples(self, data):
-        """Returns a single list of dependencies, sorted by mech_tuple[MECHANISM].name"""
+    def _toposort_with_ordered_mech_tuples(self, dependency_sets):
+        """Returns a single list of dependencies, sorted by mech_tuple[MECHANISM].name
+
+        dependency_sets is the list of sets returned by toposort (e.g., self.execution_sets)
+        """
         result = []
-        for dependency_set in toposort(data):
-            d_iter = iter(dependency_set)
-            result.extend(sorted(dependency_set, key=lambda item : next(d_iter).mechanism.name))
+        for dependency_set in dependency_sets:
+            result.extend(sorted(dependency_set, key=lambda mech_tuple : mech_tuple.mechanism.name))
         return result
 
     def _cache_state(self):
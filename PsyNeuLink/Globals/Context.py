@@ -0,0 +1,211 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+#
+#
+# ************************************************  Context ************************************************************
+
+"""
+
+Overview
+--------
+
+The **context** argument of the `execute` methods of systems, processes, mechanisms, states, projections and functions
+has traditionally been a string, that is extended at each level of execution and tested for keywords (e.g.,
+``EXECUTING in context`` or ``EVC_SIMULATION in context``) to determine how a component should execute.  An
+`ExecutionContext` replaces that string along the execution path.  It records the keywords it has been assigned as
+`ContextFlags`, so that testing for them is a bitwise operation rather than a substring search, and it records the
+component that created it and the context from which it was derived (its `owner` and `parent`), so that extending it
+for the next level of execution does not require building a new string.
+
+An ExecutionContext can be used wherever a context string is used:  keywords can be tested using ``in``, strings can
+be appended to it (or it to them) using ``+``, and it is converted to the equivalent string by ``str()`` (or by
+calling any string method on it).  The string is only generated if it is requested (e.g., for logging or reporting).
+
+"""
+
+from enum import IntEnum
+
+from PsyNeuLink.Globals.Keywords import *
+
+
+class ContextFlags(IntEnum):
+    """Bit flags used by an `ExecutionContext` to record the keywords that have been assigned to it.
+    """
+    INITIALIZING = 1 << 0    # INITIALIZING
+    EXECUTING = 1 << 1       # EXECUTING
+    SIMULATING = 1 << 2      # EVC_SIMULATION
+    LEARNING = 1 << 3        # LEARNING
+    RUN = 1 << 4             # RUN
+    ASSIGNING = 1 << 5       # kwAssign
+    VALIDATING = 1 << 6      # kwValidate
+    COMMAND_LINE = 1 << 7    # COMMAND_LINE
+    CONSTRUCTOR = 1 << 8     # '_init_' (any of COMPONENT_INIT, PROCESS_INIT, SYSTEM_INIT)
+    COMPONENT_INIT = 1 << 9  # COMPONENT_INIT
+    PROCESS_INIT = 1 << 10   # PROCESS_INIT
+    SYSTEM_INIT = 1 << 11    # SYSTEM_INIT
+
+
+# Keywords of string-based contexts that are recorded as ContextFlags
+# Note: all others are tested against the string version of the context
+_KEYWORD_FLAGS = {INITIALIZING: ContextFlags.INITIALIZING,
+                  EXECUTING: ContextFlags.EXECUTING,
+                  EVC_SIMULATION: ContextFlags.SIMULATING,
+                  LEARNING: ContextFlags.LEARNING,
+                  RUN: ContextFlags.RUN,
+                  kwAssign: ContextFlags.ASSIGNING,
+                  kwValidate: ContextFlags.VALIDATING,
+                  COMMAND_LINE: ContextFlags.COMMAND_LINE,
+                  '_init_': ContextFlags.CONSTRUCTOR,
+                  COMPONENT_INIT: ContextFlags.COMPONENT_INIT,
+                  PROCESS_INIT: ContextFlags.PROCESS_INIT,
+                  SYSTEM_INIT: ContextFlags.SYSTEM_INIT}
+
+# Cache of the flags for strings that have been parsed (labels are generally reused on every execution)
+_flags_for_string = {}
+_FLAGS_CACHE_SIZE = 10000
+
+
+def _get_flags_for_string(string):
+    """Return the ContextFlags (as an int) for the keywords contained in string
+    """
+    try:
+        return _flags_for_string[string]
+    except KeyError:
+        flags = 0
+        for keyword, flag in _KEYWORD_FLAGS.items():
+            if keyword in string:
+                flags |= flag
+        if len(_flags_for_string) > _FLAGS_CACHE_SIZE:
+            _flags_for_string.clear()
+        _flags_for_string[string] = flags
+        return flags
+
+
+class ExecutionContext(object):
+    """
+    ExecutionContext(   \
+    flags=0,            \
+    owner=None,         \
+    label='',           \
+    parent=None)
+
+    Context passed along the execution path of a system, process or mechanism.
+
+    COMMENT:
+        Use `from_string` to convert a context string (or return an ExecutionContext unchanged), and `for_owner` (or
+        ``+`` with a string) to derive the context for the next level of execution.  Contexts are never modified
+        once they are created, so that the same one can be passed to many components.
+    COMMENT
+
+    Arguments
+    ---------
+
+    flags : int : default 0
+        `ContextFlags` assigned to the context (combined using ``|``).
+
+    owner : Component : default None
+        the component that created the context.
+
+    label : str : default ''
+        the string appended to the string version of the `parent` to generate the string version of the context.
+
+    parent : ExecutionContext : default None
+        the context from which the current one was derived;  its flags are inherited by the current one.
+
+    Attributes
+    ----------
+
+    flags : int
+        the `ContextFlags` assigned to the context and all of its parents.
+
+    owner : Component
+        the component that created the context.
+
+    label : str
+        the string added to the context by its `owner`.
+
+    parent : ExecutionContext
+        the context from which the current one was derived.
+
+    """
+
+    __slots__ = ('flags', 'owner', 'label', 'parent', '_string')
+
+    def __init__(self, flags=0, owner=None, label='', parent=None):
+        if parent is not None:
+            flags |= parent.flags
+        self.flags = flags | _get_flags_for_string(label)
+        self.owner = owner
+        self.label = label
+        self.parent = parent
+        self._string = None
+
+    @classmethod
+    def from_string(cls, context, owner=None):
+        """Return an ExecutionContext for context (if it is already one, it is returned unchanged).
+        """
+        if isinstance(context, ExecutionContext):
+            return context
+        return cls(owner=owner, label=context or '')
+
+    def for_owner(self, owner, label=''):
+        """Return a context derived from the current one for execution by owner, with label appended to its string.
+        """
+        return ExecutionContext(owner=owner, label=label, parent=self)
+
+    def for_simulation(self, owner):
+        """Return a context for a simulation by owner (e.g., an EVCMechanism) in which EXECUTING is replaced by
+        EVC_SIMULATION.
+        """
+        return ExecutionContext(owner=owner,
+                                label=str(self).replace(EXECUTING, '{0} {1}'.format(owner.name, EVC_SIMULATION)))
+
+    @property
+    def owners(self):
+        """List of the owners of the current context and all of its parents (most recent first).
+        """
+        owners = []
+        context = self
+        while context is not None:
+            if context.owner is not None:
+                owners.append(context.owner)
+            context = context.parent
+        return owners
+
+    def __contains__(self, item):
+        try:
+            return bool(self.flags & _KEYWORD_FLAGS[item])
+        except KeyError:
+            return item in str(self)
+
+    def __add__(self, other):
+        if isinstance(other, ExecutionContext):
+            other = str(other)
+        return ExecutionContext(owner=self.owner, label=other, parent=self)
+
+    def __radd__(self, other):
+        return ExecutionContext(flags=self.flags, owner=self.owner, label=other + str(self))
+
+    def __str__(self):
+        if self._string is None:
+            if self.parent is None:
+                self._string = self.label
+            else:
+                self._string = str(self.parent) + self.label
+        return self._string
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, str(self))
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __getattr__(self, name):
+        # Compatibility with callers that treat context as a string (e.g., context.ljust(...))
+        if name.startswith('__') or name in self.__slots__:
+            raise AttributeError(name)
+        return getattr(str(self), name)
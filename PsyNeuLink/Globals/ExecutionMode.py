@@ -0,0 +1,113 @@
+# Princeton University licenses this file to You under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.  You may obtain a copy of the License at:
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and limitations under the License.
+#
+#
+# ***********************************************  ExecutionMode *******************************************************
+
+"""
+
+Overview
+--------
+
+The execution mode determines how much checking and reporting is done when systems, processes and mechanisms are
+executed.  It is assigned for all components at once, using `set_execution_mode`::
+
+    import PsyNeuLink
+    PsyNeuLink.set_execution_mode('fast')
+
+In the default (``'standard'``) mode, each execution consults the `preferences <ComponentPreferenceSet>` of every
+component it involves, to determine whether to validate its variable and runtime parameters (`paramValidationPref`),
+report its output (`reportOutputPref`) and log the values of its states (`logPref`), and the `run <Run.run>` function
+checks the types of its arguments.  Turning those preferences off disables the checks, but the preferences must still
+be resolved on every call.  In ``'fast'`` mode:
+
+    * variables and runtime parameters are not validated (runtime parameters are still assigned);
+    ..
+    * no output is reported for mechanisms, processes or systems;
+    ..
+    * state values are not logged;
+    ..
+    * the type checking of the arguments to `run <Run.run>` is removed;
+
+all without consulting any preferences.  It is intended for models that have already been tested in standard mode,
+and are being run many times (e.g., for parameter estimation).  Errors that standard mode would report when a
+component is executed may instead raise an exception from numpy, or go undetected.
+
+The mode can be changed at any time;  calling ``set_execution_mode('standard')`` restores all of the checks.
+
+.. _ExecutionMode_Class_Reference:
+
+Class Reference
+---------------
+
+"""
+
+from enum import Enum
+
+
+class ExecutionMode(Enum):
+    """Modes of execution that can be assigned using `set_execution_mode`.
+    """
+    STANDARD = 'standard'
+    FAST = 'fast'
+
+
+class ExecutionModeError(Exception):
+    def __init__(self, error_value):
+        self.error_value = error_value
+
+    def __str__(self):
+        return repr(self.error_value)
+
+
+_execution_mode = ExecutionMode.STANDARD
+
+# Typechecked functions (by module) on the execution path that are replaced by their unwrapped versions in FAST mode
+_TYPECHECKED_EXECUTION_FUNCTIONS = {'PsyNeuLink.Globals.Run': ['run', '_construct_stimulus_sets']}
+_typechecked_functions = {}
+
+
+def set_execution_mode(mode):
+    """Assign the mode of execution for all components.
+
+    Arguments
+    ---------
+
+    mode : ExecutionMode or str
+        `ExecutionMode` (or its value:  ``'standard'`` or ``'fast'``) to use for subsequent executions.
+    """
+    global _execution_mode
+    try:
+        mode = ExecutionMode(mode)
+    except ValueError:
+        raise ExecutionModeError("{} is not a valid execution mode; must be one of: {}".
+                                 format(repr(mode), ', '.join(repr(m.value) for m in ExecutionMode)))
+
+    from importlib import import_module
+    from PsyNeuLink.Components.Component import Component
+
+    fast = mode is ExecutionMode.FAST
+    Component._fast_execution = fast
+
+    for module_name, function_names in _TYPECHECKED_EXECUTION_FUNCTIONS.items():
+        module = import_module(module_name)
+        for function_name in function_names:
+            key = (module_name, function_name)
+            if key not in _typechecked_functions:
+                _typechecked_functions[key] = getattr(module, function_name)
+            function = _typechecked_functions[key]
+            if fast:
+                function = getattr(function, '__wrapped__', function)
+            setattr(module, function_name, function)
+
+    _execution_mode = mode
+
+
+def get_execution_mode():
+    """Return the current `ExecutionMode`.
+    """
+    return _execution_mode
@@ -440,6 +440,10 @@ COST_FUNCTION = 'cost_function'
 COMBINE_OUTCOME_AND_COST_FUNCTION = 'combine_outcome_and_cost_function'
 VALUE_FUNCTION = 'value_function'
 SAVE_ALL_VALUES_AND_POLICIES = 'save_all_values_and_policies'
+MAX_SAVED_POLICIES = 'max_saved_policies'
+TOLERANCE = 'tolerance'
+MAX_ITERATIONS = 'max_iterations'
+COARSE_SAMPLES = 'coarse_samples'
 SYSTEM_DEFAULT_CONTROLLER = "DefaultController"
 EVC_SIMULATION = 'SIMULATING'
 ALLOCATION_SAMPLES = "allocation_samples"
@@ -40,7 +40,8 @@ An attribute is logged if:
 ..
 * the context of the assignment is above the LogLevel specified in the logPref setting of the owner object
 
-Entry values are added by the setter method for the attribute being logged.
+Entry values are added by the setter method for the attribute being logged, except for the values of States, which
+are added by the State's update method (using the context in which the value was assigned).
 
 The following entries are automatically included in self.entries for a Mechanism object:
     - the value attribute of every State for which the Mechanism is an owner
@@ -56,7 +57,8 @@ Structure
 
 Each entry of log.entries has:
     + a key that is the name of the attribute being logged
-    + a value that is a list of sequentially entered LogEntry tuples since recording of the attribute began
+    + a value that is a LogBuffer of sequentially entered LogEntry tuples since recording of the attribute began
+      (stored as numpy arrays, and limited to the most recent LOG_MAX_ENTRIES if that is specified)
     + each tuple has three items:
         - time (CentralClock): when it was recorded in the run
         - context (str): the context in which it was recorded (i.e., where the attribute value was assigned)
@@ -110,6 +112,8 @@ import warnings
 from collections import namedtuple
 from enum import IntEnum
 
+import numpy as np
+
 from PsyNeuLink.Globals.Keywords import *
 
 
@@ -127,12 +131,184 @@ class LogLevel(IntEnum):
     """Record all value assignments during initialization, validation and execution."""
 
 LogEntry = namedtuple('LogEntry', 'time, context, value')
+LogTime = namedtuple('LogTime', 'task, block, trial, time_step')
+
+# Maximum number of values recorded for each entry of a Log (None = unbounded);  when it is reached,
+#    the oldest values are overwritten (see LogBuffer)
+LOG_MAX_ENTRIES = None
+
+# Columns of a LogBuffer (in addition to value)
+LOG_TIME_COLUMNS = ['task', 'block', 'trial', 'time_step']
+LOG_CONTEXT_COLUMN = 'context'
+LOG_VALUE_COLUMN = 'value'
 
 ALL_ENTRIES = 'all entries'
 
 kpCentralClock = 'CentralClock'
 SystemLogEntries = [kpCentralClock]
 
+#region LogBuffer
+class LogBuffer:
+    """Store the values recorded for an entry of a Log in preallocated numpy arrays (one for each column)
+
+    Description:
+        Each value is recorded with the task, block, trial and time_step of the clock at which it was recorded, and
+            the id of its context (an index into the contexts list of the Log, in which each context is stored once)
+        Values are stored in a numeric array if they are numeric and all have the same shape;  otherwise they are
+            stored in a list
+        Arrays are grown (by doubling) as needed, up to max_entries (if it is specified);  after that, they are used
+            as a ring buffer (i.e., each new value overwrites the oldest one)
+        Indexing and iteration return LogEntry tuples (in the order in which they were recorded), so that a
+            LogBuffer can be used in place of the list of LogEntries used previously
+
+    Initialization arguments:
+        - log (Log): the log to which the entry belongs (used to intern contexts)
+        - max_entries (int or None): maximum number of values stored;  None = unbounded
+
+    Class Methods:
+        - append(time, context, value) - record value, with time and context
+        - get_data(trials) - return dict of arrays for columns, optionally restricted to a range of trials
+    """
+
+    _initial_capacity = 16
+
+    def __init__(self, log, max_entries=None):
+        if max_entries is not None and max_entries < 1:
+            raise LogError("max_entries for a log must be a positive integer or None")
+        self._log = log
+        self._max_entries = max_entries
+        self._capacity = 0
+        self._length = 0
+        self._start = 0
+        self._columns = {column: np.empty(0, dtype=int) for column in LOG_TIME_COLUMNS + [LOG_CONTEXT_COLUMN]}
+        self._values = None
+
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, max_entries):
+        if max_entries is not None and max_entries < 1:
+            raise LogError("max_entries for a log must be a positive integer or None")
+        self._max_entries = max_entries
+        if max_entries is not None and self._capacity > max_entries:
+            self._resize(max_entries)
+
+    def __len__(self):
+        return self._length
+
+    def _indices(self):
+        """Return indices of stored values in the order in which they were recorded"""
+        if not self._start:
+            return np.arange(self._length)
+        return (self._start + np.arange(self._length)) % self._capacity
+
+    def _resize(self, capacity):
+        """Reallocate columns with capacity, preserving the most recent values (in order, starting at index 0)"""
+        indices = self._indices()[-capacity:]
+        for column, data in self._columns.items():
+            new_data = np.empty(capacity, dtype=data.dtype)
+            new_data[:len(indices)] = data[indices]
+            self._columns[column] = new_data
+        if isinstance(self._values, np.ndarray):
+            new_values = np.empty((capacity,) + self._values.shape[1:], dtype=self._values.dtype)
+            new_values[:len(indices)] = self._values[indices]
+            self._values = new_values
+        elif self._values is not None:
+            self._values = [self._values[i] for i in indices] + [None] * (capacity - len(indices))
+        self._capacity = capacity
+        self._length = len(indices)
+        self._start = 0
+
+    def append(self, time, context, value):
+        """Record value, along with the task, block, trial and time_step of time and the id of context"""
+
+        if self._length == self._capacity:
+            if self._max_entries is None or self._capacity < self._max_entries:
+                capacity = max(self._initial_capacity, 2 * self._capacity)
+                if self._max_entries is not None:
+                    capacity = min(capacity, self._max_entries)
+                self._resize(capacity)
+
+        if self._length < self._capacity:
+            index = (self._start + self._length) % self._capacity
+            self._length += 1
+        # Buffer is full, so overwrite oldest value
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self._capacity
+
+        columns = self._columns
+        columns['task'][index] = time.task
+        columns['block'][index] = time.block
+        columns['trial'][index] = time.trial
+        columns['time_step'][index] = time.time_step
+        columns[LOG_CONTEXT_COLUMN][index] = self._log._get_context_id(context)
+        self._assign_value(index, value)
+
+    def _assign_value(self, index, value):
+
+        if self._values is None:
+            array = np.asarray(value)
+            if array.dtype.kind in 'biuf':
+                self._values = np.empty((self._capacity,) + array.shape, dtype=array.dtype)
+            else:
+                self._values = [None] * self._capacity
+
+        if isinstance(self._values, np.ndarray):
+            array = np.asarray(value)
+            if array.shape == self._values.shape[1:] and np.can_cast(array.dtype, self._values.dtype):
+                self._values[index] = array
+                return
+            # Value is not compatible with those already recorded, so convert to list
+            self._values = list(self._values)
+
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+        self._values[index] = value
+
+    def __getitem__(self, item):
+        indices = self._indices()[item]
+        if isinstance(indices, np.ndarray):
+            return [self._get_entry(index) for index in indices]
+        return self._get_entry(indices)
+
+    def __iter__(self):
+        for index in self._indices():
+            yield self._get_entry(index)
+
+    def _get_entry(self, index):
+        columns = self._columns
+        return LogEntry(LogTime(*(int(columns[column][index]) for column in LOG_TIME_COLUMNS)),
+                        self._log.contexts[columns[LOG_CONTEXT_COLUMN][index]],
+                        self._values[index])
+
+    def get_data(self, trials=None):
+        """Return dict with an array for each column (in the order in which values were recorded)
+
+        If trials is specified (as a trial number or a (start, stop) tuple, in which stop is excluded),
+            only values recorded in those trials are returned
+        """
+        indices = self._indices()
+        if trials is not None:
+            trial_column = self._columns['trial'][indices]
+            if isinstance(trials, tuple):
+                start, stop = trials
+                indices = indices[(trial_column >= start) & (trial_column < stop)]
+            else:
+                indices = indices[trial_column == trials]
+        data = {column: self._columns[column][indices] for column in self._columns}
+        if isinstance(self._values, np.ndarray):
+            data[LOG_VALUE_COLUMN] = self._values[indices]
+        else:
+            values = np.empty(len(indices), dtype=object)
+            for i, index in enumerate(indices):
+                values[i] = self._values[index]
+            data[LOG_VALUE_COLUMN] = values
+        return data
+#endregion
+
 #region Custom Entries Dict
 # Modified from: http://stackoverflow.com/questions/7760916/correct-useage-of-getter-setter-for-dictionary-values
 from collections import MutableMapping
@@ -141,6 +317,9 @@ class EntriesDict(MutableMapping,dict):
 
     If entry is in owner mechanism's prefs.logPref.setting list, then append attribute value to entry's list
     Otherwise, either initialize or just update entry with value
+
+    Each entry is a LogBuffer:  assigning a LogEntry to it records the LogEntry in the LogBuffer;
+        assigning a list (of LogEntries) replaces the LogBuffer with one that contains only those LogEntries
     """
     def __init__(self, owner):
 
@@ -164,15 +343,22 @@ class EntriesDict(MutableMapping,dict):
 
     def __setitem__(self, key, value):
 
+        # Assignment of a list replaces the entry (e.g., [] to reset it)
+        if isinstance(value, list):
+            buffer = LogBuffer(self._ownerLog, max_entries=self._ownerLog.max_entries)
+            for item in value:
+                buffer.append(*item)
+            dict.__setitem__(self,key,buffer)
+            return
+
         try:
-        # If the entry already exists, use its value and append current value to it
-            self._ownerLog.entries[key].append(value)
-            value = self._ownerLog.entries[key]
+        # If the entry already exists, append current value to it
+            buffer = dict.__getitem__(self,key)
         except KeyError:
-        # Otherwise, initialize list with value as first item
-            dict.__setitem__(self,key,[value])
-        else:
-            dict.__setitem__(self,key,value)
+        # Otherwise, initialize buffer with value as first item
+            buffer = LogBuffer(self._ownerLog, max_entries=self._ownerLog.max_entries)
+            dict.__setitem__(self,key,buffer)
+        buffer.append(*value)
 
 
     def __delitem__(self, key):
@@ -269,20 +455,25 @@ class Log:
 
     """
 
-    def __init__(self, owner, entries=None):
+    def __init__(self, owner, entries=None, max_entries=None):
         """Initialize log with list of entries
 
         Each item of the entries list should be a keypath (kp<attribute name>) designating an attribute
             of the object to be logged;
         Initialize self.entries dict, each entry of which has a:
         - key corresponding to an attribute of the object to be logged
-        - value that is a list of sequentially logged values
+        - value that is a LogBuffer of sequentially logged values
 
         :parameter owner: (object in Function hierarchy) - parent object that owns the log object)
         :parameter entries: (list) - list of keypaths used as keys for entries in the log dict
+        :parameter max_entries: (int) - maximum number of values recorded for each entry (default: LOG_MAX_ENTRIES)
         """
 
         self.owner = owner
+        self._max_entries = max_entries or LOG_MAX_ENTRIES
+        # Contexts of recorded values (each is stored once, and referenced by its index in LogBuffers)
+        self.contexts = []
+        self._context_ids = {}
         # self.entries = EntriesDict({})
         self.entries = EntriesDict(self)
 
@@ -291,6 +482,65 @@ class Log:
 
         # self.add_entries(entries)
 
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, max_entries):
+        self._max_entries = max_entries
+        for buffer in self.entries.values():
+            buffer.max_entries = max_entries
+
+    def _get_context_id(self, context):
+        """Return index of context in self.contexts (adding it if it is not already there)"""
+        context = str(context)
+        try:
+            return self._context_ids[context]
+        except KeyError:
+            self._context_ids[context] = len(self.contexts)
+            self.contexts.append(context)
+            return self._context_ids[context]
+
+    def record_value(self, entry, value, context, time=None):
+        """Record value for entry (adding entry if it is not already in self.entries)
+
+        time can be any object with task, block, trial and time_step attributes (default: CentralClock);
+            its values are copied when the value is recorded.
+        Note: this is equivalent to self.entries[entry] = LogEntry(CurrentTime(), context, value),
+              but does not construct a LogEntry or CurrentTime object
+
+        :param entry: (str)
+        :param value: (value)
+        :param context: (str)
+        :param time: (Clock)
+        """
+        if time is None:
+            from PsyNeuLink.Globals.TimeScale import CentralClock
+            time = CentralClock
+        try:
+            buffer = dict.__getitem__(self.entries, entry)
+        except KeyError:
+            buffer = LogBuffer(self, max_entries=self._max_entries)
+            dict.__setitem__(self.entries, entry, buffer)
+        buffer.append(time, context, value)
+
+    def get_data(self, entry, trials=None):
+        """Return dict of arrays (one for each column) with the values recorded for entry
+
+        Columns are task, block, trial, time_step, context (index of the context in self.contexts) and value
+        If trials is specified (as a trial number or a (start, stop) tuple, in which stop is excluded),
+            only values recorded in those trials are returned
+
+        :param entry: (str)
+        :param trials: (int or tuple)
+        :return: (dict)
+        """
+        try:
+            return self.entries[entry].get_data(trials)
+        except KeyError:
+            raise LogError("{0} is not an entry in the log for {1}".format(entry, self.owner.name))
+
     def add_entries(self, entries):
         """Validate that a list of entries are attributes of owner or in SystemLogEntries, and then add to self.entries
 
@@ -561,7 +811,6 @@ class Log:
                 warnings.warn("{0} is not an entry in the log for {1}".
                       format(attrib_name, self.owner.name))
             else:
-                import numpy as np
                 for item in datum:
                     time, context, value = item
                     if isinstance(value, np.ndarray):
@@ -585,5 +834,48 @@ class Log:
                 if len(datum) > 1:
                     print("\n")
 
-    def save_log(self):
-        print("Saved")
+    def save_log(self, file_name, entries=ALL_ENTRIES, trials=None):
+        """Save columns of entries to file_name, in npz or HDF5 format (determined by the extension of file_name)
+
+        For npz files (the default), each column is saved as an array named <entry>/<column>;
+        for HDF5 files (.h5 or .hdf5 extension), each entry is saved as a group with a dataset for each column.
+        The contexts of the log are saved (as an array or dataset named contexts) along with the entries;
+            the context column of each entry contains indices into that array.
+        If trials is specified, only values recorded in those trials are saved (see get_data).
+        Note: saving in HDF5 format requires the h5py package, and is only possible for entries with numeric values
+
+        :param file_name: (str)
+        :param entries: (str, list or ALL_ENTRIES)
+        :param trials: (int or tuple)
+        :return:
+        """
+
+        if entries is ALL_ENTRIES or entries is None:
+            entries = self.entries.keys()
+        elif isinstance(entries, str):
+            entries = [entries]
+
+        data = {entry: self.get_data(entry, trials) for entry in entries}
+
+        if file_name.endswith(('.h5', '.hdf5')):
+            try:
+                import h5py
+            except ImportError:
+                raise LogError("The h5py package must be installed to save the log for {0} in HDF5 format".
+                               format(self.owner.name))
+            with h5py.File(file_name, 'w') as file:
+                file.create_dataset('contexts', data=np.array(self.contexts, dtype=h5py.special_dtype(vlen=str)))
+                for entry, columns in data.items():
+                    if columns[LOG_VALUE_COLUMN].dtype == object:
+                        raise LogError("Values of {0} in the log for {1} can't be saved in HDF5 format, "
+                                       "as they are not numeric arrays of the same shape".
+                                       format(entry, self.owner.name))
+                    group = file.create_group(entry)
+                    for column, array in columns.items():
+                        group.create_dataset(column, data=array)
+        else:
+            arrays = {'contexts': np.array(self.contexts, dtype=str)}
+            for entry, columns in data.items():
+                for column, array in columns.items():
+                    arrays['{0}/{1}'.format(entry, column)] = array
+            np.savez(file_name, **arrays)
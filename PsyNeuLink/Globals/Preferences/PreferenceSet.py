@@ -23,6 +23,14 @@ PreferenceSetVerbosity = False
 
 PreferenceEntry = namedtuple('PreferenceEntry', 'setting, level')
 
+# Incremented whenever a preference is assigned or a PreferenceSet is created;  settings cached by
+#    get_pref_setting_for_level are only used if they were cached in the current generation
+_preferences_generation = 0
+
+def _preferences_changed():
+    global _preferences_generation
+    _preferences_generation += 1
+
 
 class PreferenceLevel(IntEnum):
     NONE        = 0
@@ -402,6 +410,9 @@ class PreferenceSet(object):
             print ("Preference assignment condition {0}".format(condition))
         #endregion
 
+        # Invalidate cached settings (the new PreferenceSet may have been assigned as classPreferences)
+        _preferences_changed()
+
 # FIX: ARE THESE NEEDED?? @@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@@
     @property
     def level(self):
@@ -540,6 +551,10 @@ class PreferenceSet(object):
                                          format(default_entry, self.name))
         #endregion
 
+        # Invalidate settings cached by get_pref_setting_for_level (for all PreferenceSets, since a setting
+        #    at this level may be used by those at lower levels)
+        _preferences_changed()
+
         #region candidate_info is a PreferenceEntry
         if isinstance(candidate_info, PreferenceEntry):
             setting_OK = self.validate_setting(candidate_info.setting, default_setting, pref_ivar_name)
@@ -679,9 +694,28 @@ class PreferenceSet(object):
         - pref_ivar_name (str): name of ivar for preference attribute for which to return the setting;
         - requested_level (PreferenceLevel): preference level for which the setting should be returned
 
+        The setting is cached (for the current owner) until any preference is assigned or PreferenceSet is created
+
         :param requested_level: (PreferenceLevel)
         :return PreferenceEntry.setting, str:
         """
+        key = (pref_ivar_name, requested_level)
+        try:
+            owner, generation, setting = self._resolved_settings[key]
+            if generation == _preferences_generation and owner is self.owner:
+                return setting
+        except AttributeError:
+            self._resolved_settings = {}
+        except KeyError:
+            pass
+
+        setting = self._get_pref_setting_for_level(pref_ivar_name, requested_level)
+        self._resolved_settings[key] = (self.owner, _preferences_generation, setting)
+        return setting
+
+    def _get_pref_setting_for_level(self, pref_ivar_name, requested_level=None):
+        """Resolve the setting of a preference for a specified preference level (see get_pref_setting_for_level)
+        """
         pref_entry = getattr(self, pref_ivar_name)
 
         if requested_level is None:
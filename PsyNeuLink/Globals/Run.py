@@ -324,6 +324,26 @@ COMMENT:
     ADD EXAMPLE HERE
 COMMENT
 
+.. _Run_Results:
+
+Results
+~~~~~~~
+
+By default, the result of each execution (the value of the outputStates of the `TERMINAL` mechanism(s) of the object)
+is copied and appended to the object's :keyword:`results` attribute, and that is returned by :keyword:`run`.  For
+long runs, this can be changed using the **results** argument of :keyword:`run`:
+
+    * ``'array'`` -- the results are stored in arrays that are allocated before execution begins, one for each
+      `TERMINAL` outputState, the first axis of which is the execution number;  the list of those arrays is returned,
+      and the :keyword:`results` attribute is left unchanged.
+    ..
+    * ``'none'`` -- the results are not stored, and `None` is returned.
+    ..
+    * a `ResultReducer` -- its `update <ResultReducer.update>` method is called with the result of each execution,
+      and its `value <ResultReducer.value>` is returned.  `RunningMean`, `RunningVariance` and `LastK` keep,
+      respectively, the mean of the results, their mean and variance, and the most recent ``k`` of them, so that
+      memory use does not grow with the number of executions.
+
 COMMENT:
    Module Contents
        system() factory method:  instantiate system
@@ -339,13 +359,15 @@ Class Reference
 """
 
 
+import itertools
 import numpy as np
-from collections import Iterable
+from collections import Iterable, deque
 from PsyNeuLink.Globals.Utilities import *
 from PsyNeuLink.Components.Component import function_type
 from PsyNeuLink.Components.System import System
 from PsyNeuLink.Components.Process import Process, ProcessInputState
 from PsyNeuLink.Components.Mechanisms.Mechanism import Mechanism
+from PsyNeuLink.Globals.Context import ExecutionContext
 
 HOMOGENOUS = 1
 HETEROGENOUS = 0
@@ -384,6 +406,146 @@ class RunError(Exception):
      def __str__(object):
          return repr(object.error_value)
 
+class ResultReducer(object):
+    """Base class for objects that accumulate the results of a `run <Run.run>`, one execution at a time.
+
+    Subclasses must implement `update` and `value`.  The result of each execution is passed to `update` as a list
+    with one item (converted to an np.ndarray) for each `TERMINAL` outputState.
+    """
+
+    def reset(self):
+        """Called at the start of each run."""
+        pass
+
+    def update(self, result):
+        """Accumulate the result of an execution."""
+        raise RunError("{} class must implement update".format(self.__class__.__name__))
+
+    @property
+    def value(self):
+        """The reduced results (returned by `run <Run.run>`)."""
+        raise RunError("{} class must implement value".format(self.__class__.__name__))
+
+
+class RunningMean(ResultReducer):
+    """Keeps the mean of the result of each `TERMINAL` outputState over the executions of a run.
+    """
+
+    def reset(self):
+        self.count = 0
+        self.mean = None
+
+    def update(self, result):
+        self.count += 1
+        if self.mean is None:
+            self.mean = [np.array(item, dtype=float) for item in result]
+        else:
+            for mean, item in zip(self.mean, result):
+                mean += (item - mean) / self.count
+
+    @property
+    def value(self):
+        return self.mean
+
+
+class RunningVariance(RunningMean):
+    """Keeps the mean and (population) variance of the result of each `TERMINAL` outputState over the executions of
+    a run, using Welford's algorithm.
+    """
+
+    def reset(self):
+        super().reset()
+        self._sum_sq_diffs = None
+
+    def update(self, result):
+        if self.mean is None:
+            super().update(result)
+            self._sum_sq_diffs = [np.zeros_like(mean) for mean in self.mean]
+            return
+        self.count += 1
+        for mean, sum_sq_diffs, item in zip(self.mean, self._sum_sq_diffs, result):
+            delta = item - mean
+            mean += delta / self.count
+            sum_sq_diffs += delta * (item - mean)
+
+    @property
+    def variance(self):
+        if self._sum_sq_diffs is None:
+            return None
+        return [sum_sq_diffs / self.count for sum_sq_diffs in self._sum_sq_diffs]
+
+    @property
+    def value(self):
+        return self.variance
+
+
+class LastK(ResultReducer):
+    """Keeps the results of the last k executions of a run.
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self.reset()
+
+    def reset(self):
+        self.results = deque(maxlen=self.k)
+
+    def update(self, result):
+        self.results.append([item.copy() for item in result])
+
+    @property
+    def value(self):
+        return list(self.results)
+
+
+class _ResultsArray(ResultReducer):
+    """Stores the results of a run in arrays (one per `TERMINAL` outputState) allocated on the first execution.
+
+    The arrays are allocated as float (or the type of the first result, if that is not numeric), so that the results
+    of later executions are not truncated if that of the first one is an integer.
+    """
+
+    def __init__(self, num_executions):
+        self.num_executions = num_executions
+        self.reset()
+
+    def reset(self):
+        self.arrays = None
+        self.count = 0
+
+    def update(self, result):
+        if self.arrays is None:
+            self.arrays = [np.empty((self.num_executions,) + item.shape, dtype=np.result_type(item.dtype, float))
+                           for item in result]
+        for array, item in zip(self.arrays, result):
+            array[self.count] = item
+        self.count += 1
+
+    @property
+    def value(self):
+        return self.arrays
+
+
+class _DiscardResults(ResultReducer):
+    """Discards the results of a run.
+    """
+
+    def update(self, result):
+        pass
+
+    @property
+    def value(self):
+        return None
+
+
+def _get_result_items(result):
+    """Return result as a list of np.ndarrays (one for each TERMINAL outputState)
+    """
+    if isinstance(result, list):
+        return [np.asarray(item) for item in result]
+    return [np.asarray(result)]
+
+
 @tc.typecheck
 def run(object,
         inputs,
@@ -393,12 +555,15 @@ def run(object,
         intial_values:tc.optional(tc.any(list, np.ndarray))=None,
         targets:tc.optional(tc.any(list, dict, np.ndarray, function_type))=None,
         learning:tc.optional(bool)=None,
+        learning_rate:tc.optional(tc.any(int, float))=None,
         call_before_trial:tc.optional(function_type)=None,
         call_after_trial:tc.optional(function_type)=None,
         call_before_time_step:tc.optional(function_type)=None,
         call_after_time_step:tc.optional(function_type)=None,
         clock=CentralClock,
         time_scale:tc.optional(tc.enum(TimeScale.TRIAL, TimeScale.TIME_STEP))=None,
+        batch:bool=False,
+        results:tc.any(tc.enum('list', 'array', 'none'), ResultReducer)='list',
         context=None):
     """run(                         \
     inputs,                      \
@@ -408,12 +573,15 @@ def run(object,
     intial_values=None,          \
     targets=None,                \
     learning=None,               \
+    learning_rate=None,          \
     call_before_trial=None,      \
     call_after_trial=None,       \
     call_before_time_step=None,  \
     call_after_time_step=None,   \
     clock=CentralClock,          \
-    time_scale=None)
+    time_scale=None,             \
+    batch=False,                 \
+    results='list')
 
     Run a sequence of executions for a `process <Process>` or `system <System>`.
 
@@ -469,6 +637,11 @@ def run(object,
         `system <System_Execution_Learning>`.  If it is not specified, the current state of learning is left intact.
         If it is :keyword:`True`, learning is forced on; if it is :keyword:`False`, learning is forced off.
 
+    learning_rate : float : default None
+        the learning_rate assigned to all of the `LearningProjections <LearningProjection>` of the process or system
+        before the executions.  If it is not specified, the `learning_rate` attribute of the process or system is used
+        (and, if that is `None`, the learning_rates of the LearningProjections are left intact).
+
     call_before_trial : Function : default= `None`
         called before each `trial` in the sequence is executed.
 
@@ -484,12 +657,23 @@ def run(object,
     time_scale : TimeScale :  default TimeScale.TRIAL
         specifies whether mechanisms are executed for a single time_step or a trial
 
+    batch : bool : default False
+        executes all of the trials at once, with each mechanism that supports batch execution (e.g., a
+        `TransferMechanism`, or a `DDM` that uses `BogaczEtAl`) processing the inputs for all trials in a single call,
+        and any others executed for each trial in turn (only supported for a `system <System>` without recurrence,
+        learning or an enabled controller;  no reports are generated for the system, and **targets** and the
+        call_before and call_after arguments can't be specified).
+
+    results : 'list', 'array', 'none' or ResultReducer : default 'list'
+        determines how the result of each execution is stored (see `Run_Results`).
+
     Returns
     -------
 
     <object>.results : List[outputState.value]
         list of the values, for each execution, of the outputStates for a mechanism run directly,
         or of the outputStates of the `TERMINAL` mechanisms for the process or system run
+        (or, if **results** is not ``'list'``, the value described under `Run_Results`).
     """
 
     inputs = _construct_stimulus_sets(object, inputs)
@@ -526,11 +710,120 @@ def run(object,
     # num_executions = num_executions or np.size(inputs, inputs.ndim-3)
     num_executions = num_executions or np.size(inputs, EXECUTION_SET_DIM)
 
+    # SET LEARNING AND LEARNING_RATE (if relevant)
+    learning_state_buffer = _set_up_learning(object, learning, learning_rate)
+
+    # VALIDATE INPUTS AND TARGETS
+    context = context or RUN + "validating " + object.name
+    inputs = _validate_stimuli(object, inputs, targets, context=context)
+
+    if object.verbosePref:
+        shape = inputs.shape
+        print('Inputs for run of {}: \n'
+              '- executions: {}\n'
+              '- phases per execution: {}\n'
+              '- mechanisms per execution: {}\n'.
+              format(object.name, shape[EXECUTION_SET_DIM], shape[PHASE_DIM], shape[MECHANISM_DIM]))
+
+    # INITIALIZATION
+    context = _initialize_run(object, object_type, reset_clock, initialize, clock, context)
+
+    # SET UP TIMING
+    if object_type == MECHANISM:
+        time_steps = 1
+    else:
+        time_steps = object.numPhases
+
+    # SET UP STORAGE OF RESULTS
+    if results == 'list':
+        results_reducer = None
+    elif results == 'none':
+        results_reducer = _DiscardResults()
+    elif results == 'array':
+        results_reducer = _ResultsArray(num_executions)
+    else:
+        results_reducer = results
+        results_reducer.reset()
+
+    # EXECUTE
+    if batch:
+        if object_type != SYSTEM:
+            raise RunError("Batch execution is only supported for a system ({} is a {})".
+                           format(object.name, object_type))
+        if (targets is not None or call_before_trial or call_after_trial or
+                call_before_time_step or call_after_time_step):
+            raise RunError("targets and call_before/call_after functions can't be specified for batch execution "
+                           "of {}".format(object.name))
+        object._validate_batch_execution()
+        batch_results = object._execute_batch(inputs=inputs,
+                                              num_executions=num_executions,
+                                              time_scale=time_scale,
+                                              context=context)
+        if results_reducer is None:
+            object.results.extend(batch_results)
+        else:
+            for result in batch_results:
+                results_reducer.update(_get_result_items(result))
+        clock.time_step += num_executions * time_steps
+        clock.trial += num_executions
+
+    else:
+        for execution in range(num_executions):
+
+            if call_before_trial:
+                call_before_trial()
+
+            # IMPLEMENTATION NOTE:  USE input_num since # of inputs must equal # targets,
+            #                       whereas targets can be assigned a function (so can't be used to generated #)
+            input_num = execution%len(inputs)
+            if targets is None or isinstance(targets, function_type):
+                target_set = targets
+            else:
+                target_set = targets[input_num]
+
+            result = _execute_trial(object=object,
+                                    object_type=object_type,
+                                    input_set=inputs[input_num],
+                                    target_set=target_set,
+                                    time_steps=time_steps,
+                                    clock=clock,
+                                    time_scale=time_scale,
+                                    call_before_time_step=call_before_time_step,
+                                    call_after_time_step=call_after_time_step,
+                                    context=context)
+            if results_reducer is None:
+                object.results.append(result)
+            else:
+                results_reducer.update(_get_result_items(result))
+
+            if call_after_trial:
+                call_after_trial()
+
+            clock.trial += 1
+
+    # Restore learning state
+    _restore_learning(object, learning_state_buffer)
+
+    if results_reducer is None:
+        return object.results
+    return results_reducer.value
+
+
+def _set_up_learning(object, learning, learning_rate=None):
+    """Assign learning (if specified) and learning_rate for a sequence of executions of object
+
+    If learning_rate is None, object.learning_rate is used (if that is not None).
+
+    Returns the learning state of object before the assignment (to be restored by _restore_learning after the
+        executions), or None if learning is not specified
+    """
+
     # SET LEARNING (if relevant)
     # FIX: THIS NEEDS TO BE DONE FOR EACH PROCESS IF THIS CALL TO run() IS FOR SYSTEM
     #      IMPLEMENT learning_enabled FOR SYSTEM, WHICH FORCES LEARNING OF PROCESSES WHEN SYSTEM EXECUTES?
     #      OR MAKE LEARNING A PARAM THAT IS PASSED IN execute
     # If learning is specified, buffer current state and set to specified state
+    learning_state_buffer = None
     if learning is not None:
         try:
             learning_state_buffer = object._learning_enabled
@@ -545,13 +838,30 @@ def run(object,
                 object._learning_enabled = False
 
     # SET LEARNING_RATE, if specified, for all learningProjections in process or system
-    if object.learning_rate is not None:
-        from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.ObjectiveMechanism import ObjectiveMechanism
+    if learning_rate is None:
+        learning_rate = object.learning_rate
+    if learning_rate is not None:
         from PsyNeuLink.Components.Projections.LearningProjection import LearningProjection
         for learning_mech in object.monitoringMechanisms.mechanisms:
             for projection in learning_mech.outputState.sendsToProjections:
                 if isinstance(projection, LearningProjection):
-                    projection.function_object.learning_rate = object.learning_rate
+                    projection.function_object.learning_rate = learning_rate
+
+    return learning_state_buffer
+
+
+def _restore_learning(object, learning_state_buffer):
+    """Restore the learning state of object buffered by _set_up_learning (if learning was specified)
+    """
+    if learning_state_buffer is not None:
+        object._learning_enabled = learning_state_buffer
+
+
+def _validate_stimuli(object, inputs, targets=None, context=None):
+    """Validate inputs (and targets, if specified) constructed by _construct_stimulus_sets for a sequence of executions
+
+    Returns inputs as an (at least 2d) np.array
+    """
 
     # VALIDATE INPUTS: COMMON TO PROCESS AND SYSTEM
     # Input is empty
@@ -562,108 +872,215 @@ def run(object,
     if not isinstance(inputs, (list, np.ndarray)):
         raise RunError("The input must be a list or np.array")
 
-    inputs = np.array(inputs)
+    inputs = np.asarray(inputs)
     inputs = np.atleast_2d(inputs)
 
-    # Insure that all input sets have the same length
-    if any(len(input_set) != len(inputs[0]) for input_set in inputs):
+    # Insure that all input sets have the same length (they must if inputs is a regular array)
+    if inputs.dtype.kind == 'O' and any(len(input_set) != len(inputs[0]) for input_set in inputs):
         raise RunError("The length of at least one input in the series is not the same as the rest")
 
     # Class-specific validation:
-    context = context or RUN + "validating " + object.name
     num_inputs_sets = _validate_inputs(object=object, inputs=inputs, context=context)
     if targets is not None:
         _validate_targets(object, targets, num_inputs_sets, context=context)
 
-    if object.verbosePref:
-        shape = inputs.shape
-        print('Inputs for run of {}: \n'
-              '- executions: {}\n'
-              '- phases per execution: {}\n'
-              '- mechanisms per execution: {}\n'.
-              format(object.name, shape[EXECUTION_SET_DIM], shape[PHASE_DIM], shape[MECHANISM_DIM]))
+    return inputs
+
+
+def _initialize_run(object, object_type, reset_clock, initialize, clock, context):
+    """Reset clock and initialize object (if specified) before a sequence of executions, and return their context
+    """
 
-    # INITIALIZATION
     if reset_clock:
         clock.trial = 0
         clock.time_step = 0
     if initialize:
         object.initialize()
 
-    # SET UP TIMING
-    if object_type == MECHANISM:
-        time_steps = 1
-    else:
-        time_steps = object.numPhases
+    # Assign context for executions (if this is a simulation, leave as is)
+    # Note: this is done once for the run, rather than for each execution;  ExecutionContext (rather than string)
+    #       is used so that the keywords in it can be tested without a string search at each level of execution
+    if RUN in context and not EVC_SIMULATION in context:
+        context = RUN + ": EXECUTING " + object_type.upper() + " " + object.name
+    return ExecutionContext.from_string(context, owner=object)
+
+def _execute_trial(object,
+                   object_type,
+                   input_set,
+                   target_set,
+                   time_steps,
+                   clock,
+                   time_scale,
+                   call_before_time_step=None,
+                   call_after_time_step=None,
+                   context=None):
+    """Execute object for all of the time_steps of a single trial, and return (a copy of) its result
+
+    input_set is the input for the trial (one item per time_step);  target_set is the target for the trial (one item
+        per time_step for a process), a function that generates it, or None
+    """
 
-    # EXECUTE
-    for execution in range(num_executions):
+    execution_id = _get_unique_id()
 
-        execution_id = _get_unique_id()
+    for time_step in range(time_steps):
 
-        if call_before_trial:
-            call_before_trial()
+        if call_before_time_step:
+            call_before_time_step()
 
-        for time_step in range(time_steps):
+        input = input_set[time_step]
+        if object_type == SYSTEM:
+            object.inputs = input
 
-            if call_before_time_step:
-                call_before_time_step()
+        # Assign targets:
+        if target_set is not None:
 
-            input_num = execution%len(inputs)
-            input = inputs[input_num][time_step]
-            if object_type == SYSTEM:
-                object.inputs = input
+            if isinstance(target_set, function_type):
+                object.target = target_set
 
-            # Assign targets:
-            if targets is not None:
+            elif object_type == PROCESS:
+                object.target = target_set[time_step]
 
-                if isinstance(targets, function_type):
-                    object.target = targets
+            elif object_type == SYSTEM:
+                object.current_targets = target_set
 
-                # IMPLEMENTATION NOTE:  USE input_num since # of inputs must equal # targets,
-                #                       whereas targets can be assigned a function (so can't be used to generated #)
-                elif object_type == PROCESS:
-                    # object.target = targets[input_num][time_step]
-                    object.target = targets[input_num][time_step]
+        result = object.execute(input=input,
+                                execution_id=execution_id,
+                                clock=clock,
+                                time_scale=time_scale,
+                                context=context)
 
-                elif object_type == SYSTEM:
-                    object.current_targets = targets[input_num]
-            # MODIFIED 3/16/17 END
+        if call_after_time_step:
+            call_after_time_step()
 
-            if RUN in context and not EVC_SIMULATION in context:
-                context = RUN + ": EXECUTING " + object_type.upper() + " " + object.name
-            result = object.execute(input=input,
-                                    execution_id=execution_id,
-                                    clock=clock,
-                                    time_scale=time_scale,
-                                    context=context)
+        clock.time_step += 1
 
-            if call_after_time_step:
-                call_after_time_step()
+    if isinstance(result, Iterable):
+        return result.copy()
+    return result
 
-            clock.time_step += 1
 
-        # object.results.append(result)
-        if isinstance(result, Iterable):
-            result_copy = result.copy()
-        else:
-            result_copy = result
-        object.results.append(result_copy)
+def run_iter(object,
+             inputs,
+             targets=None,
+             reset_clock=True,
+             initialize=False,
+             learning=None,
+             learning_rate=None,
+             clock=CentralClock,
+             time_scale=None,
+             context=None):
+    """run_iter(             \
+    inputs,                  \
+    targets=None,            \
+    reset_clock=True,        \
+    initialize=False,        \
+    learning=None,           \
+    learning_rate=None,      \
+    clock=CentralClock,      \
+    time_scale=None)
 
-        if call_after_trial:
-            call_after_trial()
+    Generator that executes a `system <System>` for each input consumed from an iterable, and yields the result of
+    each execution.
 
-        clock.trial += 1
+    COMMENT:
+        Inputs (and targets) are drawn from their iterables one trial at a time, so they can be generated on the fly
+        and need not be bounded;  each is converted using _construct_stimulus_sets, and validated and assigned to
+        ``object.targets`` as in run() (which shares the set up of learning and initialization).  Results are yielded
+        rather than appended to ``object.results``, so memory use does not grow with the number of executions.
+        The learning state (if learning is specified) is restored when the generator is exhausted or closed.
+    COMMENT
+
+    Arguments
+    ---------
+
+    inputs : iterable
+        the input for each execution;  each item must be the input for a single execution, in either of the formats
+        described in `Run_Inputs` (i.e., a list with one input for each `ORIGIN` mechanism, or a dict with one entry
+        for each `ORIGIN` mechanism, the value of which is its input).
+
+    targets : iterable : default None
+        the target for each execution, in the same format as **inputs** (used for learning);  it is consumed in step
+        with **inputs**.
+
+    reset_clock : bool : default True
+        if :keyword:`True`, resets `CentralClock` to 0 before the first execution.
+
+    initialize : bool default False
+        calls the `initialize <System.System_Base.initialize>` method of the system before the first execution.
+
+    learning : bool :  default None
+        enables or disables learning during execution (see `run <Run.run>`).
+
+    learning_rate : float : default None
+        the learning_rate assigned to all of the `LearningProjections <LearningProjection>` of the system before the
+        first execution (see `run <Run.run>`).
+
+    time_scale : TimeScale :  default TimeScale.TRIAL
+        specifies whether mechanisms are executed for a single time_step or a trial
+
+    Yields
+    ------
+
+    outputState values : List[outputState.value]
+        the values of the outputStates of the `TERMINAL` mechanisms of the system for each execution (these are not
+        added to its results attribute).
+    """
+
+    object_type = _get_obect_type(object)
+    if object_type != SYSTEM:
+        raise RunError("run_iter is only supported for a system ({} is a {})".format(object.name, object_type))
+
+    time_scale = time_scale or TimeScale.TRIAL
+
+    learning_state_buffer = _set_up_learning(object, learning, learning_rate)
+
+    context = context or RUN + "validating " + object.name
+    validation_context = context
+    context = _initialize_run(object, object_type, reset_clock, initialize, clock, context)
+
+    if targets is not None:
+        targets = iter(targets)
 
-    # Restore learning state
     try:
-        learning_state_buffer
-    except UnboundLocalError:
-        pass
+        for trial_input in inputs:
+
+            input_sets = _construct_trial_stimulus(object, trial_input)
+
+            target_sets = None
+            if targets is not None:
+                try:
+                    target_sets = _construct_trial_stimulus(object, next(targets), is_target=True)
+                except StopIteration:
+                    raise RunError("targets for run_iter of {} were exhausted before its inputs".format(object.name))
+
+            object.targets = target_sets
+            input_sets = _validate_stimuli(object, input_sets, target_sets, context=validation_context)
+
+            yield _execute_trial(object=object,
+                                 object_type=object_type,
+                                 input_set=input_sets[0],
+                                 target_set=target_sets[0] if target_sets is not None else None,
+                                 time_steps=object.numPhases,
+                                 clock=clock,
+                                 time_scale=time_scale,
+                                 context=context)
+
+            clock.trial += 1
+
+    finally:
+        # Restore learning state
+        _restore_learning(object, learning_state_buffer)
+
+
+def _construct_trial_stimulus(object, stimulus, is_target=False):
+    """Return the stimulus sets for a single execution of object (i.e., with one item, as for a sequence of executions)
+    """
+    if isinstance(stimulus, dict):
+        stimulus = {mech: [value] for mech, value in stimulus.items()}
     else:
-        object._learning_enabled = learning_state_buffer
+        stimulus = [stimulus]
+    return _construct_stimulus_sets(object, stimulus, is_target=is_target)
 
-    return object.results
 
 @tc.typecheck
 def _construct_stimulus_sets(object, stimuli, is_target=False):
@@ -705,6 +1122,12 @@ def _construct_stimulus_sets(object, stimuli, is_target=False):
 
     object_type = _get_obect_type(object)
 
+    # Stimuli that are already float ndarrays of the required shape are validated by shape and used as is
+    if object_type is SYSTEM and not is_target:
+        stim_array = _construct_from_stimulus_arrays(object, stimuli)
+        if stim_array is not None:
+            return stim_array
+
     # Stimuli in sequence format
     if isinstance(stimuli, (list, np.ndarray)):
         stim_list = _construct_from_stimulus_list(object, stimuli, is_target=is_target)
@@ -724,9 +1147,67 @@ def _construct_stimulus_sets(object, stimuli, is_target=False):
         raise RunError("{} arg for {}._construct_stimulus_sets() must be a dict or list".
                           format(stim_type, object.name))
 
-    stim_list_array = np.array(stim_list)
+    stim_list_array = np.asarray(stim_list)
     return stim_list_array
 
+def _construct_from_stimulus_arrays(object, stimuli):
+    """Return the stimulus sets for a system constructed from float ndarrays without iterating over executions
+
+    Handles stimuli that are either:
+        - a float ndarray that already has the shape of the stimulus sets returned by _construct_stimulus_sets
+          (executions, phases, origin mechanisms, inputStates, items) -- returned as is;
+        - a dict with a float ndarray for each ORIGIN mechanism, the first axis of which is the execution and the
+          rest of which have the shape of the mechanism's variable (with or without its inputState axis), and all of
+          which have the same shape -- placed in the (zero-padded) phase of each mechanism, without copying if the
+          system has a single ORIGIN mechanism and phase.
+
+    Returns None if stimuli are not in one of those forms, in which case they are constructed (and any errors
+    reported) by _construct_from_stimulus_list or _construct_from_stimulus_dict.
+    """
+
+    mech_tuples = list(object.originMechanisms.mech_tuples)
+    num_mechs = len(mech_tuples)
+    num_phases = object.numPhases
+
+    if isinstance(stimuli, np.ndarray):
+        if (stimuli.dtype.kind == 'f' and stimuli.ndim == 5 and len(stimuli) and
+                stimuli.shape[PHASE_DIM] == num_phases and stimuli.shape[MECHANISM_DIM] == num_mechs):
+            _validate_inputs(object=object, inputs=stimuli)
+            return stimuli
+        return None
+
+    if not isinstance(stimuli, dict) or len(stimuli) != num_mechs:
+        return None
+
+    stim_arrays = []
+    for mech, runtime_params, phase_spec in mech_tuples:
+        stim_array = stimuli.get(mech)
+        if not isinstance(stim_array, np.ndarray) or stim_array.dtype.kind != 'f' or stim_array.ndim not in {2, 3}:
+            return None
+        variable_shape = np.shape(np.atleast_2d(mech.variable))
+        if stim_array.ndim == 2:
+            stim_array = stim_array.reshape((len(stim_array), 1) + stim_array.shape[1:])
+        if stim_array.shape[1:] != variable_shape:
+            return None
+        stim_arrays.append(stim_array)
+
+    num_input_sets = len(stim_arrays[0])
+    stim_shape = stim_arrays[0].shape[1:]
+    if (not num_input_sets or
+            any(stim_array.shape != (num_input_sets,) + stim_shape for stim_array in stim_arrays)):
+        return None
+    # Zero padding of the phases in which a mechanism does not receive input is only regular for single states
+    if num_phases > 1 and stim_shape[0] != 1:
+        return None
+
+    if num_mechs == 1 and num_phases == 1:
+        return stim_arrays[0].reshape((num_input_sets, 1, 1) + stim_shape)
+
+    stim_sets = np.zeros((num_input_sets, num_phases, num_mechs) + stim_shape)
+    for mech_num, (stim_array, mech_tuple) in enumerate(zip(stim_arrays, mech_tuples)):
+        stim_sets[:, mech_tuple.phase, mech_num] = stim_array
+    return stim_sets
+
 def _construct_from_stimulus_list(object, stimuli, is_target, context=None):
 
     object_type = _get_obect_type(object)
@@ -1077,8 +1558,26 @@ def _validate_inputs(object, inputs=None, is_target=False, num_phases=None, cont
         else:
             mechs = list(object.originMechanisms)
         num_mechs = len(mechs)
-        inputs_array = np.array(inputs)
+        inputs_array = np.asarray(inputs)
         num_execution_sets = inputs_array.shape[EXECUTION_SET_DIM]
+
+        # Homogenous inputs have the same shape for every execution and phase, so only need to be validated once
+        if input_homogenity and not is_target:
+            if num_execution_sets and inputs_array.shape[PHASE_DIM] < num_phases:
+                raise RunError("Number of phases ({}) in inputs for {} should be {}".
+                               format(inputs_array.shape[PHASE_DIM], object.name, num_phases))
+            num_states = inputs_array.shape[MECHANISM_DIM + 1]
+            input_len = inputs_array.shape[-1]
+            for mech in mechs:
+                if num_states != len(mech.inputValue):
+                    raise RunError("Number of states ({}) in input for {} should be {}".
+                                   format(num_states, mech.name, len(mech.inputValue)))
+                for state_name, state in mech.inputStates.items():
+                    if input_len != len(state.value):
+                        raise RunError("Length of state {} ({}) in input for {} should be {}".
+                                       format(state_name, input_len, mech.name, len(state.value)))
+            return num_execution_sets
+
         for execution_set_num in range(num_execution_sets):
             execution_set = inputs_array[execution_set_num]
             for phase_num in range(num_phases):
@@ -1254,6 +1753,28 @@ def _get_obect_type(object):
         raise RunError("{} type not supported by Run module".format(object.__class__.__name__))
     
 
-import uuid
+# Execution ids are drawn from a single, monotonically increasing counter
+#    (they only need to be unique within the session, so uuid4 is not needed)
+_execution_ids = itertools.count(1)
+
 def _get_unique_id():
-    return uuid.uuid4()
+    return next(_execution_ids)
+
+# System or Process that was most recently assigned as the execution owner of its mechanisms
+_current_execution_owner = None
+
+def _assign_execution_owner(owner, mechanisms):
+    """Assign owner (a System or Process) as the execution owner of each mechanism in mechanisms
+
+    A mechanism's _execution_id is that of its execution owner, so the owner only has to update its own
+        _execution_id for each execution (rather than assign it to each of its mechanisms).
+    The assignment is skipped if owner made the most recent one and has not been modified since
+        (owner._execution_owner_assigned is set to False when its graph is instantiated).
+    """
+    global _current_execution_owner
+    if _current_execution_owner is owner and owner._execution_owner_assigned:
+        return
+    for mech in mechanisms:
+        mech._execution_owner = owner
+    owner._execution_owner_assigned = True
+    _current_execution_owner = owner
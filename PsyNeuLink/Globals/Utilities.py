@@ -58,6 +58,11 @@ OTHER
 * `append_type_to_name`
 * `make_prop`
 
+GRAPHS
+~~~~~~
+
+* `IncrementalTopologicalOrder`
+
 """
 
 import warnings
@@ -529,3 +534,96 @@ def append_type_to_name(object, type=None):
         # string = name + ' ' + type.lower()
     return string
 #endregion
+
+
+#region GRAPHS ********************************************************************************************************
+
+class IncrementalTopologicalOrder(object):
+    """Maintains a topological order of the nodes of an acyclic graph as dependencies are added to it
+
+    Used to test whether adding a dependency would introduce a cycle, without sorting the entire graph each time
+    (as calling toposort for each dependency would).  Implements the dynamic topological sort algorithm of
+    Pearce and Kelly (2006):  adding a dependency of receiver on sender only requires searching the nodes that lie
+    between them in the current order, and only those nodes are reordered.
+
+    Dependencies of a node on itself are ignored (as they are by toposort).
+
+    Sample:
+
+        order = IncrementalTopologicalOrder()
+        >>>order.add_dependency('a', 'b')    # 'b' depends on 'a'
+         True
+        >>>order.add_dependency('b', 'a')    # would introduce a cycle, so is not added
+         False
+    """
+    def __init__(self):
+        self._order = {}
+        self._dependents = {}
+        self._dependencies = {}
+
+    def __contains__(self, node):
+        return node in self._order
+
+    def add_node(self, node):
+        """Add node (with no dependencies) after all nodes currently in the order, if it is not already in it
+        """
+        if not node in self._order:
+            self._order[node] = len(self._order)
+            self._dependents[node] = set()
+            self._dependencies[node] = set()
+
+    def add_dependency(self, sender, receiver):
+        """Make receiver dependent on sender, unless that would introduce a cycle
+
+        Returns :keyword:`True` if the dependency was added (or already exists), and :keyword:`False`
+        (leaving the graph unchanged) if it would introduce a cycle.
+        """
+        self.add_node(sender)
+        self.add_node(receiver)
+
+        if sender == receiver or receiver in self._dependents[sender]:
+            return True
+
+        lower_bound = self._order[receiver]
+        upper_bound = self._order[sender]
+
+        # Receiver precedes sender in the current order, so reorder the nodes between them (or detect a cycle)
+        if lower_bound < upper_bound:
+            # Nodes that depend (directly or indirectly) on receiver and precede sender;  if sender is among them,
+            #    then sender depends on receiver, and making receiver dependent on sender would introduce a cycle
+            forward = self._search(receiver, self._dependents, lambda node: self._order[node] <= upper_bound)
+            if sender in forward:
+                return False
+            # Nodes on which sender depends (directly or indirectly) that follow receiver
+            backward = self._search(sender, self._dependencies, lambda node: self._order[node] > lower_bound)
+            # Move those on which sender depends ahead of those that depend on receiver, reusing their positions
+            backward = sorted(backward, key=lambda node: self._order[node])
+            forward = sorted(forward, key=lambda node: self._order[node])
+            positions = sorted(self._order[node] for node in backward + forward)
+            for node, position in zip(backward + forward, positions):
+                self._order[node] = position
+
+        self._dependents[sender].add(receiver)
+        self._dependencies[receiver].add(sender)
+        return True
+
+    def remove_dependencies(self, node):
+        """Remove all of the dependencies of node (the current order remains valid)
+        """
+        for sender in self._dependencies[node]:
+            self._dependents[sender].discard(node)
+        self._dependencies[node] = set()
+
+    def _search(self, start, edges, in_range):
+        """Return set of nodes reachable from start through edges that satisfy in_range (including start)
+        """
+        found = {start}
+        stack = [start]
+        while stack:
+            for node in edges[stack.pop()]:
+                if not node in found and in_range(node):
+                    found.add(node)
+                    stack.append(node)
+        return found
+
+#endregion
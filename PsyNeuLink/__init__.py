@@ -19,6 +19,7 @@ from PsyNeuLink.Components.Projections.LearningProjection import LearningProject
 from PsyNeuLink.Components.Projections.MappingProjection import MappingProjection
 from PsyNeuLink.Components.System import System, system
 from PsyNeuLink.Globals.Defaults import DefaultControlAllocationMode
+from PsyNeuLink.Globals.ExecutionMode import ExecutionMode, set_execution_mode
 from PsyNeuLink.Globals.Keywords import *
 from PsyNeuLink.Globals.Preferences.ComponentPreferenceSet import ComponentPreferenceSet
 
@@ -26,6 +27,8 @@ __all__ = ['System',
            'system',
            'process',
            'CentralClock',
+           'ExecutionMode',
+           'set_execution_mode',
            'TransferMechanism',
            'IntegratorMechanism',
            'DDM',
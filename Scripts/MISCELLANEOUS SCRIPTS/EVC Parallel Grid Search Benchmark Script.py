@@ -0,0 +1,87 @@
+import multiprocessing
+import os
+
+import PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCAuxiliary as EVCAuxiliary
+from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCMechanism import EVCMechanism
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.DDM import *
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.TransferMechanism import *
+from PsyNeuLink.Components.Process import process
+from PsyNeuLink.Components.Projections.ControlProjection import ControlProjection
+from PsyNeuLink.Components.System import system
+from PsyNeuLink.Globals.Keywords import *
+
+# Times the grid search of the EVC Laming validation model (with 31 x 31 allocation policies) in a single process and
+#    in parallel processes, and checks that the EVCs are the same.  Wall-clock times only show a speedup with as many
+#    CPUs as processes;  the CPU time of the slowest process (this one, or the mean of the forked ones) estimates the
+#    wall-clock time with that many CPUs.
+
+NUM_PROCESSES = [1, 2, 4]
+ALLOCATION_SAMPLES_RANGE = np.arange(0.1, 1.01, 0.03)
+
+Input = TransferMechanism(name='Input')
+Reward = TransferMechanism(name='Reward')
+Decision = DDM(function=BogaczEtAl(drift_rate=(1.0, ControlProjection(function=Linear,
+                                                                      control_signal={
+                                                                          ALLOCATION_SAMPLES:ALLOCATION_SAMPLES_RANGE}
+                                                                      )),
+                                   threshold=(1.0, ControlProjection(function=Linear,
+                                                                     control_signal={
+                                                                         ALLOCATION_SAMPLES:ALLOCATION_SAMPLES_RANGE}
+                                                                     )),
+                                   noise=(0.5),
+                                   starting_point=(0),
+                                   t0=0.45),
+               name='Decision')
+
+TaskExecutionProcess = process(default_input_value=[0],
+                               pathway=[(Input, 0), IDENTITY_MATRIX, (Decision, 0)],
+                               name = 'TaskExecutionProcess')
+
+RewardProcess = process(default_input_value=[0],
+                        pathway=[(Reward, 1)],
+                        name = 'RewardProcess')
+
+mySystem = system(processes=[TaskExecutionProcess, RewardProcess],
+                  controller=EVCMechanism,
+                  enable_controller=True,
+                  monitor_for_control=[Reward, DDM_PROBABILITY_UPPER_THRESHOLD, (DDM_RESPONSE_TIME, -1, 1)],
+                  name='EVC Test System')
+mySystem.controller.reportOutputPref = False
+mySystem.controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES] = True
+for mechanism in [Decision] + list(mySystem.controller.prediction_mechanisms.values()):
+    mechanism.reportOutputPref = False
+
+stim_list_dict = {Input:[0.5, 0.123],
+                  Reward:[20, 20]}
+
+
+def time_configuration(num_processes, connection):
+    """Run the system (in a forked process, so that each configuration starts from the same state), and send the
+    wall-clock time, the CPU time of the slowest process, and the EVCs for the last trial
+    """
+    EVCAuxiliary.PY_MULTIPROCESSING = num_processes > 1
+    EVCAuxiliary.PY_MULTIPROCESSING_PROCESSES = num_processes
+    start_times = os.times()
+    mySystem.run(inputs=stim_list_dict)
+    end_times = os.times()
+    cpu_time = end_times.user + end_times.system - start_times.user - start_times.system
+    children_cpu_time = (end_times.children_user + end_times.children_system -
+                         start_times.children_user - start_times.children_system)
+    connection.send((end_times.elapsed - start_times.elapsed,
+                     max(cpu_time, children_cpu_time / max(num_processes - 1, 1)),
+                     np.array(mySystem.controller.EVC_values)))
+
+# Isolate the effect of the processes from that of running the simulations all at once
+EVCAuxiliary.BATCH_SIMULATION = False
+
+EVC_values = {}
+for num_processes in NUM_PROCESSES:
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    configuration = multiprocessing.Process(target=time_configuration, args=(num_processes, sender))
+    configuration.start()
+    sender.close()
+    wall_time, slowest_cpu_time, EVC_values[num_processes] = receiver.recv()
+    configuration.join()
+    print('{} process(es): {:.2f}s wall-clock, {:.2f}s CPU for the slowest process'.
+          format(num_processes, wall_time, slowest_cpu_time))
+assert all(np.array_equal(EVC_values[1], EVC_values[num_processes]) for num_processes in NUM_PROCESSES)
@@ -0,0 +1,57 @@
+import time
+
+from PsyNeuLink.Components.Functions.Function import Linear, Logistic
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.TransferMechanism import TransferMechanism
+from PsyNeuLink.Components.System import *
+from PsyNeuLink.Globals.ExecutionMode import set_execution_mode
+from PsyNeuLink.Globals.Keywords import *
+
+# Times runs of the Stroop model in standard and fast execution modes
+
+NUM_TRIALS = 1000
+
+colors = TransferMechanism(default_input_value=[0,0],
+                        function=Linear,
+                        name="Colors")
+
+words = TransferMechanism(default_input_value=[0,0],
+                        function=Linear,
+                        name="Words")
+
+response = TransferMechanism(default_input_value=[0,0],
+                           function=Logistic,
+                           name="Response")
+
+color_naming_process = process(
+    default_input_value=[1, 2.5],
+    pathway=[colors, FULL_CONNECTIVITY_MATRIX, response],
+    name='Color Naming',
+)
+
+word_reading_process = process(
+    default_input_value=[.5, 3],
+    pathway=[words, FULL_CONNECTIVITY_MATRIX, response],
+    name='Word Reading',
+)
+
+mySystem = system(processes=[color_naming_process, word_reading_process],
+                  name='Stroop Model')
+
+stim_dict = {colors:[[1,0],[0,1]] * (NUM_TRIALS // 2),
+             words:[[0,1],[1,0]] * (NUM_TRIALS // 2)}
+
+times = {}
+results = {}
+for mode in ['standard', 'fast']:
+    set_execution_mode(mode)
+    mySystem.results = []
+    start = time.time()
+    results[mode] = mySystem.run(inputs=stim_dict)
+    times[mode] = time.time() - start
+    print('{} mode: {} trials in {:.3f} seconds'.format(mode, NUM_TRIALS, times[mode]))
+set_execution_mode('standard')
+
+assert all(np.allclose(standard_value, fast_value)
+           for standard_trial, fast_trial in zip(results['standard'], results['fast'])
+           for standard_value, fast_value in zip(standard_trial, fast_trial))
+print('speedup: {:.2f}x'.format(times['standard'] / times['fast']))
@@ -0,0 +1,161 @@
+import multiprocessing
+import traceback
+
+import numpy as np
+import pytest
+
+import PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCAuxiliary as EVCAuxiliary
+from PsyNeuLink.Components.Functions.Function import BogaczEtAl, Linear
+from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCAuxiliary import \
+    ControlSignalCoordinateAscent, ControlSignalGoldenSectionSearch, ControlSignalGridRefinement, \
+    ControlSignalGridSearch, ControlSignalSearchSpace
+from PsyNeuLink.Components.Mechanisms.AdaptiveMechanisms.ControlMechanisms.EVCMechanism import EVCMechanism
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.DDM import DDM, DDM_PROBABILITY_UPPER_THRESHOLD, DDM_RESPONSE_TIME
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.TransferMechanism import TransferMechanism
+from PsyNeuLink.Components.Process import process
+from PsyNeuLink.Components.Projections.ControlProjection import ControlProjection
+from PsyNeuLink.Components.System import system
+from PsyNeuLink.Globals.Keywords import *
+
+SAMPLES = [[0.1, 0.2, 0.3], [1, 2], [5, 6, 7, 8]]
+
+
+def _meshgrid_policies(samples):
+    # The order in which the search space was previously built
+    return np.array(np.meshgrid(*samples)).T.reshape(-1, len(samples))
+
+
+@pytest.mark.parametrize('samples', [SAMPLES[:1], SAMPLES[:2], SAMPLES])
+def test_search_space_order_matches_meshgrid(samples):
+    search_space = ControlSignalSearchSpace(samples)
+    expected = _meshgrid_policies(samples)
+    assert len(search_space) == len(expected)
+    assert search_space.shape == expected.shape
+    assert np.array_equal(np.array(search_space), expected)
+    assert np.array_equal(np.array(list(search_space)), expected)
+    for i in range(len(expected)):
+        assert np.array_equal(search_space[i], expected[i])
+
+
+def test_search_space_indexing_matches_array():
+    search_space = ControlSignalSearchSpace(SAMPLES)
+    expected = _meshgrid_policies(SAMPLES)
+    mask = np.arange(len(expected)) % 3 == 0
+    for key in [-1, slice(2, 10, 3), slice(None, None, -5), [0, -1, 4], np.array([3, 3, 1]), mask, list(mask),
+                (mask, 1), (slice(1, 4), 2), (5, 0)]:
+        assert np.array_equal(search_space[key], expected[key])
+    assert search_space[[]].shape == (0, len(SAMPLES))
+
+
+@pytest.mark.parametrize('key', [24, -25, [0, 24], [True, False], [0.5, 1.0]])
+def test_search_space_index_errors(key):
+    search_space = ControlSignalSearchSpace(SAMPLES)
+    with pytest.raises(IndexError):
+        search_space[key]
+
+
+def test_search_space_chunks():
+    search_space = ControlSignalSearchSpace(SAMPLES)
+    expected = _meshgrid_policies(SAMPLES)
+    chunks = list(search_space.chunks(3, 20, chunk_size=5))
+    assert [len(chunk) for chunk in chunks] == [5, 5, 5, 2]
+    assert np.array_equal(np.concatenate(chunks), expected[3:20])
+
+
+def _run_in_process(function, *args):
+    # Run function in a forked process, since only one EVCMechanism can be created in a process
+    fork_context = multiprocessing.get_context('fork')
+    receiver, sender = fork_context.Pipe(duplex=False)
+
+    def send_result():
+        try:
+            sender.send((True, function(*args)))
+        except Exception:
+            sender.send((False, traceback.format_exc()))
+
+    child = fork_context.Process(target=send_result)
+    child.start()
+    sender.close()
+    try:
+        succeeded, result = receiver.recv()
+    except EOFError:
+        succeeded, result = False, 'process exited with code {}'.format(child.exitcode)
+    child.join()
+    if not succeeded:
+        pytest.fail(result)
+    return result
+
+
+def _search(function_type, control_threshold=True, batch_simulation=True):
+    """Run the Laming validation model with function_type as the EVCMechanism's function, and return the results
+    of its last execution
+    """
+    EVCAuxiliary.BATCH_SIMULATION = batch_simulation
+    allocation_samples = np.arange(0.1, 1.01, 0.1)
+    threshold = 1.0
+    if control_threshold:
+        threshold = (1.0, ControlProjection(function=Linear,
+                                            control_signal={ALLOCATION_SAMPLES:allocation_samples}))
+    Input = TransferMechanism(name='Input')
+    Reward = TransferMechanism(name='Reward')
+    Decision = DDM(function=BogaczEtAl(drift_rate=(1.0, ControlProjection(function=Linear,
+                                                                          control_signal={
+                                                                              ALLOCATION_SAMPLES:allocation_samples})),
+                                       threshold=threshold,
+                                       noise=(0.5),
+                                       starting_point=(0),
+                                       t0=0.45),
+                   name='Decision')
+    TaskExecutionProcess = process(default_input_value=[0],
+                                   pathway=[(Input, 0), IDENTITY_MATRIX, (Decision, 0)],
+                                   name='TaskExecutionProcess')
+    RewardProcess = process(default_input_value=[0],
+                            pathway=[(Reward, 1)],
+                            name='RewardProcess')
+    mySystem = system(processes=[TaskExecutionProcess, RewardProcess],
+                      controller=EVCMechanism,
+                      enable_controller=True,
+                      monitor_for_control=[Reward, DDM_PROBABILITY_UPPER_THRESHOLD, (DDM_RESPONSE_TIME, -1, 1)],
+                      name='EVC Test System')
+    mySystem.controller.function = function_type().function
+    mySystem.controller.paramsCurrent[SAVE_ALL_VALUES_AND_POLICIES] = True
+    for mechanism in [mySystem.controller, Decision] + list(mySystem.controller.prediction_mechanisms.values()):
+        mechanism.reportOutputPref = False
+    mySystem.run(inputs={Input:[0.5, 0.123], Reward:[20, 20]})
+    controller = mySystem.controller
+    return (float(controller.EVC_max),
+            np.array(controller.EVC_max_policy, dtype=float),
+            np.array(controller.EVC_values, dtype=float),
+            np.array(controller.EVC_policies, dtype=float))
+
+
+@pytest.fixture(scope='module')
+def grid_search_results():
+    return _run_in_process(_search, ControlSignalGridSearch)
+
+
+def test_batch_grid_search_matches_serial_grid_search(grid_search_results):
+    serial_results = _run_in_process(_search, ControlSignalGridSearch, True, False)
+    assert grid_search_results[0] == serial_results[0]
+    for array, serial_array in zip(grid_search_results[1:], serial_results[1:]):
+        assert np.array_equal(array, serial_array)
+
+
+@pytest.mark.parametrize('optimizer', [ControlSignalCoordinateAscent, ControlSignalGridRefinement])
+def test_optimizer_matches_grid_search(optimizer, grid_search_results):
+    EVC_max, EVC_max_policy, EVC_values, EVC_policies = _run_in_process(_search, optimizer)
+    grid_EVC_max, grid_EVC_max_policy, grid_EVC_values, grid_EVC_policies = grid_search_results
+    assert EVC_max == grid_EVC_max
+    assert np.array_equal(EVC_max_policy, grid_EVC_max_policy)
+    # The optimizer simulates fewer policies, with the same EVCs as the grid search
+    assert len(EVC_values) < len(grid_EVC_values)
+    for value, policy in zip(EVC_values, EVC_policies):
+        assert value == grid_EVC_values[np.all(grid_EVC_policies == policy, axis=1)][0]
+
+
+def test_golden_section_search_matches_grid_search():
+    EVC_max, EVC_max_policy, EVC_values, _ = _run_in_process(_search, ControlSignalGoldenSectionSearch, False)
+    grid_EVC_max, grid_EVC_max_policy, grid_EVC_values, _ = _run_in_process(_search, ControlSignalGridSearch, False)
+    assert EVC_max == grid_EVC_max
+    assert np.array_equal(EVC_max_policy, grid_EVC_max_policy)
+    assert len(EVC_values) < len(grid_EVC_values)
@@ -0,0 +1,93 @@
+import itertools
+import random
+
+from toposort import toposort_flatten
+
+from PsyNeuLink.Globals.Utilities import IncrementalTopologicalOrder
+
+
+def _assert_consistent(order, dependencies):
+    # Each node follows all of the nodes on which it depends
+    for sender, receiver in dependencies:
+        assert order._order[sender] < order._order[receiver]
+    # Positions are a permutation of the nodes
+    assert sorted(order._order.values()) == list(range(len(order._order)))
+
+
+def _has_path(dependencies, start, end):
+    found = {start}
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if node == end:
+            return True
+        for sender, receiver in dependencies:
+            if sender == node and not receiver in found:
+                found.add(receiver)
+                stack.append(receiver)
+    return False
+
+
+def test_add_dependency_in_order():
+    order = IncrementalTopologicalOrder()
+    assert order.add_dependency('a', 'b')
+    assert order.add_dependency('b', 'c')
+    _assert_consistent(order, [('a', 'b'), ('b', 'c')])
+
+
+def test_add_dependency_reorders_nodes():
+    order = IncrementalTopologicalOrder()
+    for node in ['c', 'b', 'a']:
+        order.add_node(node)
+    assert order.add_dependency('a', 'b')
+    assert order.add_dependency('b', 'c')
+    _assert_consistent(order, [('a', 'b'), ('b', 'c')])
+
+
+def test_add_dependency_rejects_cycle_and_leaves_order_unchanged():
+    order = IncrementalTopologicalOrder()
+    assert order.add_dependency('a', 'b')
+    assert order.add_dependency('b', 'c')
+    positions = dict(order._order)
+    assert not order.add_dependency('c', 'a')
+    assert not order.add_dependency('b', 'a')
+    assert order._order == positions
+    # The rejected dependencies were not added, so reversing the path is still rejected
+    assert not order.add_dependency('c', 'b')
+
+
+def test_dependency_on_self_is_ignored():
+    order = IncrementalTopologicalOrder()
+    assert order.add_dependency('a', 'a')
+    assert 'a' in order
+    assert order.add_dependency('a', 'b')
+    _assert_consistent(order, [('a', 'b')])
+
+
+def test_remove_dependencies():
+    order = IncrementalTopologicalOrder()
+    assert order.add_dependency('a', 'b')
+    assert not order.add_dependency('b', 'a')
+    order.remove_dependencies('b')
+    assert order.add_dependency('b', 'a')
+    _assert_consistent(order, [('b', 'a')])
+
+
+def test_random_graphs_match_toposort():
+    rng = random.Random(0)
+    for graph in range(50):
+        nodes = list(range(rng.randint(2, 12)))
+        order = IncrementalTopologicalOrder()
+        dependencies = []
+        pairs = list(itertools.permutations(nodes, 2))
+        for sender, receiver in rng.sample(pairs, rng.randint(1, min(30, len(pairs)))):
+            added = order.add_dependency(sender, receiver)
+            # A dependency is rejected only if it would introduce a cycle
+            assert added != _has_path(dependencies, receiver, sender)
+            if added:
+                dependencies.append((sender, receiver))
+            _assert_consistent(order, dependencies)
+        # toposort finds no cycle in the dependencies that were added
+        graph_dependencies = {node: {sender for sender, receiver in dependencies if receiver == node}
+                              for node in nodes}
+        assert len(toposort_flatten(graph_dependencies)) == len(nodes)
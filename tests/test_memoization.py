@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from PsyNeuLink.Components.Functions.Function import Linear, Logistic
+from PsyNeuLink.Components.Mechanisms.Mechanism import MechanismError
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.DDM import DDM
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.TransferMechanism import TransferMechanism
+from PsyNeuLink.Components.Process import process
+from PsyNeuLink.Components.System import system
+
+
+def _build_system(memoize):
+    task = TransferMechanism(default_input_value=[0, 0], function=Linear, name='Task')
+    hidden = TransferMechanism(default_input_value=[0, 0], function=Logistic, memoize=memoize, name='Hidden')
+    response = TransferMechanism(default_input_value=[0, 0], function=Logistic, memoize=memoize, name='Response')
+    task_process = process(pathway=[task, hidden, response], name='Task Process')
+    return system(processes=[task_process], name='Memoization System'), task, hidden, response
+
+
+def _run(memoized, unmemoized, trials=5):
+    # memoized and unmemoized are (system, task) tuples
+    return tuple(np.array(mech_system.run(inputs={task: [[1, 2]] * trials})[-1][0], dtype=float)
+                 for mech_system, task in (memoized, unmemoized))
+
+
+def test_memoized_system_matches_unmemoized_for_constant_inputs():
+    memoized_system, memoized_task, _, _ = _build_system(memoize=True)
+    unmemoized_system, unmemoized_task, _, _ = _build_system(memoize=False)
+    memoized, unmemoized = _run((memoized_system, memoized_task), (unmemoized_system, unmemoized_task))
+    assert np.allclose(memoized, unmemoized)
+
+
+def test_memoized_mechanism_uses_function_param_assigned_between_runs():
+    memoized_system, memoized_task, memoized_hidden, _ = _build_system(memoize=True)
+    unmemoized_system, unmemoized_task, unmemoized_hidden, _ = _build_system(memoize=False)
+    _run((memoized_system, memoized_task), (unmemoized_system, unmemoized_task))
+    memoized_hidden.function_object.gain = 5.0
+    unmemoized_hidden.function_object.gain = 5.0
+    memoized, unmemoized = _run((memoized_system, memoized_task), (unmemoized_system, unmemoized_task))
+    assert np.allclose(memoized, unmemoized)
+
+
+def test_memoized_mechanism_uses_mechanism_param_assigned_between_runs():
+    memoized_system, memoized_task, memoized_hidden, _ = _build_system(memoize=True)
+    unmemoized_system, unmemoized_task, unmemoized_hidden, _ = _build_system(memoize=False)
+    _run((memoized_system, memoized_task), (unmemoized_system, unmemoized_task))
+    memoized_hidden.noise = 0.5
+    unmemoized_hidden.noise = 0.5
+    memoized, unmemoized = _run((memoized_system, memoized_task), (unmemoized_system, unmemoized_task))
+    assert np.allclose(memoized, unmemoized)
+
+
+def test_memoized_mechanism_uses_matrix_assigned_between_runs():
+    memoized_system, memoized_task, _, memoized_response = _build_system(memoize=True)
+    unmemoized_system, unmemoized_task, _, unmemoized_response = _build_system(memoize=False)
+    _run((memoized_system, memoized_task), (unmemoized_system, unmemoized_task))
+    matrix = np.array([[2.0, 0.0], [0.0, 3.0]])
+    memoized_response.inputState.receivesFromProjections[0].matrix = matrix.copy()
+    unmemoized_response.inputState.receivesFromProjections[0].matrix = matrix.copy()
+    memoized, unmemoized = _run((memoized_system, memoized_task), (unmemoized_system, unmemoized_task))
+    assert np.allclose(memoized, unmemoized)
+
+
+def test_memoized_mechanism_uses_matrix_modified_in_place_between_runs():
+    memoized_system, memoized_task, _, memoized_response = _build_system(memoize=True)
+    unmemoized_system, unmemoized_task, _, unmemoized_response = _build_system(memoize=False)
+    _run((memoized_system, memoized_task), (unmemoized_system, unmemoized_task))
+    memoized_response.inputState.receivesFromProjections[0].matrix[0, 0] = 4.0
+    unmemoized_response.inputState.receivesFromProjections[0].matrix[0, 0] = 4.0
+    memoized, unmemoized = _run((memoized_system, memoized_task), (unmemoized_system, unmemoized_task))
+    assert np.allclose(memoized, unmemoized)
+
+
+def test_memoized_mechanism_is_not_executed_again_for_constant_inputs():
+    memoized_system, memoized_task, memoized_hidden, memoized_response = _build_system(memoize=True)
+    executions = []
+    for mechanism in (memoized_hidden, memoized_response):
+        original_execute = mechanism._execute
+        def counted_execute(*args, _execute=original_execute, _mechanism=mechanism, **kwargs):
+            executions.append(_mechanism)
+            return _execute(*args, **kwargs)
+        mechanism._execute = counted_execute
+    memoized_system.run(inputs={memoized_task: [[1, 2]] * 5})
+    assert executions == [memoized_hidden, memoized_response]
+
+
+def test_memoize_is_not_a_user_param():
+    mechanism = TransferMechanism(memoize=True)
+    assert mechanism.memoize
+    assert 'memoize' not in mechanism.user_params
+
+
+def test_stochastic_mechanism_cannot_be_memoized():
+    with pytest.raises(MechanismError):
+        DDM().memoize = True
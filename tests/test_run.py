@@ -0,0 +1,136 @@
+import random
+
+import numpy as np
+import pytest
+
+from PsyNeuLink.Components.Functions.Function import BogaczEtAl, Integrator, Linear, Logistic
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.DDM import DDM
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.IntegratorMechanism import IntegratorMechanism
+from PsyNeuLink.Components.Mechanisms.ProcessingMechanisms.TransferMechanism import TransferMechanism
+from PsyNeuLink.Components.Process import process
+from PsyNeuLink.Components.System import system
+from PsyNeuLink.Globals.Run import LastK, RunningMean, RunningVariance
+
+INPUTS = [[0.5, 1.0], [1.0, -2.0], [-0.3, 0.25], [2.0, 0.0], [0.1, 0.7]]
+
+
+def _build_transfer_system():
+    task = TransferMechanism(default_input_value=[0, 0], function=Linear(slope=2.0), name='Task')
+    hidden = TransferMechanism(default_input_value=[0, 0], function=Logistic, name='Hidden')
+    response = TransferMechanism(default_input_value=[0, 0], function=Logistic(gain=2.0), name='Response')
+    task_process = process(pathway=[task, hidden, response], name='Task Process')
+    return system(processes=[task_process], name='Transfer System'), task
+
+
+def _build_decision_system():
+    stimulus = TransferMechanism(default_input_value=[0], name='Stimulus')
+    evidence = IntegratorMechanism(function=Integrator(rate=0.5), name='Evidence')
+    decision = DDM(function=BogaczEtAl(drift_rate=1.0, threshold=1.0), name='Decision')
+    decision_process = process(pathway=[stimulus, evidence, decision], name='Decision Process')
+    return system(processes=[decision_process], name='Decision System'), stimulus
+
+
+def _as_arrays(results):
+    return [[np.array(value, dtype=float) for value in result] for result in results]
+
+
+def _assert_results_equal(results, expected):
+    assert len(results) == len(expected)
+    for result, expected_result in zip(_as_arrays(results), _as_arrays(expected)):
+        assert len(result) == len(expected_result)
+        for value, expected_value in zip(result, expected_result):
+            assert np.array_equal(value, expected_value)
+
+
+def test_batch_run_matches_run_for_transfer_mechanisms():
+    serial_system, serial_task = _build_transfer_system()
+    batch_system, batch_task = _build_transfer_system()
+    serial_results = serial_system.run(inputs={serial_task: INPUTS})
+    batch_results = batch_system.run(inputs={batch_task: INPUTS}, batch=True)
+    _assert_results_equal(batch_results, serial_results)
+
+
+def test_batch_run_matches_run_for_integrator_and_ddm():
+    serial_system, serial_stimulus = _build_decision_system()
+    batch_system, batch_stimulus = _build_decision_system()
+    inputs = [[value[0]] for value in INPUTS]
+    random.seed(0)
+    serial_results = serial_system.run(inputs={serial_stimulus: inputs})
+    random.seed(0)
+    batch_results = batch_system.run(inputs={batch_stimulus: inputs}, batch=True)
+    _assert_results_equal(batch_results, serial_results)
+
+
+def test_batch_run_leaves_system_in_state_of_last_trial():
+    serial_system, serial_stimulus = _build_decision_system()
+    batch_system, batch_stimulus = _build_decision_system()
+    inputs = [[value[0]] for value in INPUTS]
+    serial_system.run(inputs={serial_stimulus: inputs})
+    batch_system.run(inputs={batch_stimulus: inputs}, batch=True)
+    random.seed(0)
+    serial_results = serial_system.run(inputs={serial_stimulus: inputs})
+    random.seed(0)
+    batch_results = batch_system.run(inputs={batch_stimulus: inputs})
+    _assert_results_equal(batch_results, serial_results)
+
+
+def test_run_iter_matches_run():
+    run_system, run_task = _build_transfer_system()
+    iter_system, iter_task = _build_transfer_system()
+    run_results = run_system.run(inputs={run_task: INPUTS})
+    iter_results = list(iter_system.run_iter(inputs=({iter_task: input} for input in INPUTS)))
+    _assert_results_equal(iter_results, run_results)
+
+
+def test_run_iter_does_not_store_results():
+    iter_system, iter_task = _build_transfer_system()
+    for result in iter_system.run_iter(inputs=({iter_task: input} for input in INPUTS)):
+        pass
+    assert iter_system.results == []
+
+
+def _terminal_results():
+    # Results of a run for each TERMINAL outputState (with one item for each execution)
+    run_system, run_task = _build_transfer_system()
+    results = _as_arrays(run_system.run(inputs={run_task: INPUTS}))
+    return [np.array(item_results) for item_results in zip(*results)]
+
+
+def test_running_mean_reducer():
+    expected = _terminal_results()
+    reducer_system, reducer_task = _build_transfer_system()
+    mean = reducer_system.run(inputs={reducer_task: INPUTS}, results=RunningMean())
+    assert len(mean) == len(expected)
+    for value, item_results in zip(mean, expected):
+        assert np.allclose(value, np.mean(item_results, axis=0))
+
+
+def test_running_variance_reducer():
+    expected = _terminal_results()
+    reducer = RunningVariance()
+    reducer_system, reducer_task = _build_transfer_system()
+    variance = reducer_system.run(inputs={reducer_task: INPUTS}, results=reducer)
+    assert len(variance) == len(expected)
+    for value, mean, item_results in zip(variance, reducer.mean, expected):
+        assert np.allclose(value, np.var(item_results, axis=0))
+        assert np.allclose(mean, np.mean(item_results, axis=0))
+
+
+def test_last_k_reducer():
+    expected = _terminal_results()
+    reducer_system, reducer_task = _build_transfer_system()
+    last = reducer_system.run(inputs={reducer_task: INPUTS}, results=LastK(2))
+    assert len(last) == 2
+    for execution, result in zip(range(-2, 0), last):
+        for value, item_results in zip(result, expected):
+            assert np.array_equal(value, item_results[execution])
+
+
+@pytest.mark.parametrize('reducer', [RunningMean(), RunningVariance(), LastK(3)])
+def test_reducer_is_reset_for_each_run(reducer):
+    reducer_system, reducer_task = _build_transfer_system()
+    first = np.array(reducer_system.run(inputs={reducer_task: INPUTS[:2]}, results=reducer), dtype=object)
+    reducer_system.run(inputs={reducer_task: INPUTS[2:]}, results=reducer)
+    reducer_system, reducer_task = _build_transfer_system()
+    second = np.array(reducer_system.run(inputs={reducer_task: INPUTS[:2]}, results=reducer), dtype=object)
+    assert repr(second) == repr(first)